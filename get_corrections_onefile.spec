@@ -6,7 +6,7 @@ block_cipher = None
 a = Analysis(['scripts\\get_corrections.py'],
              pathex=['.'],
              binaries=[],
-             datas=[('exiftool/exiftool.exe', '.')],
+             datas=[('exiftool/exiftool.exe', '.'), ('imgcorrect/zenith_co.npz', 'imgcorrect'), ('imgcorrect/panels.json', 'imgcorrect')],
              hiddenimports=['pkg_resources.py2_warn'],
              hookspath=[],
              runtime_hooks=[],
@@ -1,37 +1,44 @@
 """Radiometric corrections for Sentera sensors."""
 
+import importlib
+
 from imgcorrect._version import __version__
-from imgcorrect.corrections import (
-    adjust_scale,
-    apply_corrections,
-    compute_correction_coefficient,
-    compute_ils_correction,
-    compute_reflectance_correction,
-    correct_images,
-)
-from imgcorrect.io import (
-    apply_sensor_settings,
-    create_cal_df,
-    create_image_df,
-    delete_all_originals,
-    move_corrected_images,
-    write_image,
-)
-from imgcorrect.metadata import copy_exif
-
-__all__ = [
-    "__version__",
-    "adjust_scale",
-    "apply_corrections",
-    "compute_correction_coefficient",
-    "compute_ils_correction",
-    "compute_reflectance_correction",
-    "correct_images",
-    "apply_sensor_settings",
-    "create_cal_df",
-    "create_image_df",
-    "delete_all_originals",
-    "move_corrected_images",
-    "write_image",
-    "copy_exif",
-]
+
+# Public functions, and the modules they are imported from on first access (PEP 562), so that importing
+# imgcorrect doesn't import pandas, OpenCV and the other heavy dependencies until they are needed
+_EXPORTS = {
+    "adjust_scale": "imgcorrect.corrections",
+    "apply_corrections": "imgcorrect.corrections",
+    "compute_correction_coefficient": "imgcorrect.corrections",
+    "compute_ils_correction": "imgcorrect.corrections",
+    "compute_reflectance_correction": "imgcorrect.corrections",
+    "correct_images": "imgcorrect.corrections",
+    "apply_sensor_settings": "imgcorrect.io",
+    "create_cal_df": "imgcorrect.io",
+    "create_image_df": "imgcorrect.io",
+    "delete_all_originals": "imgcorrect.io",
+    "move_corrected_images": "imgcorrect.io",
+    "write_image": "imgcorrect.io",
+    "copy_exif": "imgcorrect.metadata",
+}
+# Submodules that importing the public functions used to make attributes of the package
+_SUBMODULES = ("corrections", "detect_panel", "io", "metadata")
+
+__all__ = ["__version__", *_EXPORTS]
+
+
+def __getattr__(name):
+    """Import public functions and submodules on first access."""
+    if name in _SUBMODULES:
+        # importing a submodule also sets it as an attribute of the package
+        return importlib.import_module(f"{__name__}.{name}")
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the public functions and submodules along with the loaded attributes of the package."""
+    return sorted({*globals(), *_EXPORTS, *_SUBMODULES})
@@ -1,22 +1,41 @@
 """Radiometric corrections for Sentera sensors."""
 
+import hashlib
+import json
 import logging
 import os
-import tempfile
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import NamedTuple, Optional
 
 import imgparse
 import numpy as np
-import tifffile as tf
-from PIL import Image
+import pandas as pd
 from tqdm import tqdm
 
-from imgcorrect import detect_panel, io, metadata, thermal_convert, zenith_co
+from imgcorrect import (
+    detect_panel,
+    incremental,
+    io,
+    journal,
+    metadata,
+    panels,
+    plan,
+    thermal_convert,
+    work_queue,
+)
 
 logger = logging.getLogger(__name__)
 
 ROLLING_AVG_TIMESPAN = "3s"
 
+# Number of captures a queue worker claims at once, and number of queue tasks LWIR images are split into
+QUEUE_BATCH_CAPTURES = 8
+QUEUE_LWIR_TASKS = 16
+
+
+class CalibrationNotFoundError(FileNotFoundError):
+    """Raised when no calibration image with a visible panel was found for one or more bands."""
+
 
 def take_closest_image(df_grouped_by_band, target=2048):
     """Per band, return image with mean reflectance closest to target."""
@@ -45,28 +64,21 @@ def compute_reflectance_correction(image_df, calibration_df, ils_present):
     """Compute coefficient that will scale output values to known panel reflectance."""
 
     def _get_band_coeff(row):
-        if row["aruco_id"] == 23:
-            coeffs = zenith_co.sg3144_batch1_coefficients
-        elif row["aruco_id"] == 63:
-            coeffs = zenith_co.sg3144_batch2_coefficients
-        else:
+        panel = panels.get_panel(row["aruco_id"])
+        if panel is None:
             raise Exception(
                 f"The detected aruco marker id {row['aruco_id']} is not supported. band: {row['band']}"
             )
 
-        logger.debug("Detected aruco marker id: %s", {row["aruco_id"]})
+        logger.debug("Detected aruco marker id: %s (%s)", row["aruco_id"], panel.name)
         cent_arr, fwhm_arr = imgparse.get_wavelength_data(row.image_path)
         cent = int(cent_arr[int(row.XMP_index)])
         wfhm = int(fwhm_arr[int(row.XMP_index)])
 
-        return np.average(coeffs[cent - wfhm : cent + wfhm + 1])
-
-    def _get_ils_scaling(band_row):
-        calibration_img_ils = imgparse.get_ils(band_row.image_path)[0]
-        return band_row.ILS / calibration_img_ils
+        return panel.reflectance(cent - wfhm, cent + wfhm + 1)
 
     if calibration_df.empty:
-        raise FileNotFoundError(
+        raise CalibrationNotFoundError(
             "No calibration images were found. If not attempting to correct for "
             "absolute reflectance, set the '--no_reflectance_correct' flag. Otherwise, "
             "set the calibration image identifier with the '--calibration_id' option."
@@ -123,8 +135,12 @@ def compute_reflectance_correction(image_df, calibration_df, ils_present):
 
     if ils_present:
         band_avg_ils = image_df.groupby("band").ILS.mean().reset_index()
-        band_df["ils_scaling_factor"] = band_df.merge(band_avg_ils, on="band").apply(
-            _get_ils_scaling, axis=1
+        calibration_img_ils = band_df.image_path.map(
+            lambda path: imgparse.get_ils(path)[0]
+        )
+        band_df["ils_scaling_factor"] = (
+            band_df[["band"]].merge(band_avg_ils, on="band", how="left").ILS.values
+            / calibration_img_ils
         )
     else:
         band_df["ils_scaling_factor"] = 1
@@ -139,7 +155,7 @@ def compute_reflectance_correction(image_df, calibration_df, ils_present):
         band_df[["band", "slope_coefficient"]], on="band", how="outer"
     )
     if image_df["slope_coefficient"].isnull().values.any():
-        raise FileNotFoundError(
+        raise CalibrationNotFoundError(
             "Calibration imagery with a visible reference panel was not found for one or more bands."
         )
 
@@ -147,52 +163,152 @@ def compute_reflectance_correction(image_df, calibration_df, ils_present):
 
 
 def compute_correction_coefficient(image_df_row):
-    """Compute final correction coefficient."""
+    """Compute final correction coefficient, of an image dataframe row or of every row of an image dataframe."""
     return image_df_row.slope_coefficient / (
         image_df_row.autoexposure * image_df_row.ILS_ratio
     )
 
 
-def adjust_scale(path, max_val, normalize, uint16_output):
-    """Normalize and/or scale output values to 0-65535."""
-    image_arr = np.asarray(Image.open(path)).astype(np.float32)
+def _scale_array(image_arr, max_val, normalize, uint16_output):
+    """Normalize and/or scale an array (or strip of an array) to 0-65535."""
+    image_arr = image_arr.astype(np.float32)
     if normalize:
         image_arr = image_arr / max_val
     if uint16_output:
         image_arr = image_arr * 65535
         image_arr = image_arr.astype(np.uint16)
-    tf.imwrite(path, image_arr)
+    return image_arr
 
 
-def apply_corrections(image_df_row):
-    """Multiply input values by correction coefficients to generate reflectance values."""
-    logger.debug("Applying correction to image: %s", image_df_row.image_path)
+def adjust_scale(
+    path,
+    max_val,
+    normalize,
+    uint16_output,
+    streaming=False,
+    compression=None,
+    compression_level=None,
+    tile_size=None,
+    overviews=0,
+    tiff_metadata=None,
+    scaled_path=None,
+):
+    """
+    Normalize and/or scale output values to 0-65535, writing the result with the requested compression, layout and metadata.
+
+    The result replaces the image at path, or is written to scaled_path if given.
+    """
+    write_options = io.tiff_write_options(compression, compression_level, tile_size)
+    replace = scaled_path is None
+    if replace:
+        scaled_path = path + io.SCALED_SUFFIX
+    if streaming:
+        image = io.iter_image_strips(path)
+        io.write_strips(
+            scaled_path,
+            image._replace(
+                strips=(
+                    _scale_array(strip, max_val, normalize, uint16_output)
+                    for strip in image.strips
+                )
+            ),
+            dtype=np.uint16 if uint16_output else np.float32,
+            overviews=overviews,
+            tiff_metadata=tiff_metadata,
+            **write_options,
+        )
+    else:
+        from PIL import Image
+
+        image_arr = np.asarray(Image.open(path))
+        io.write_tiff(
+            scaled_path,
+            _scale_array(image_arr, max_val, normalize, uint16_output),
+            overviews,
+            tiff_metadata,
+            **write_options,
+        )
+    if replace:
+        os.replace(scaled_path, path)
+
+
+def _correct_array(image_arr, image_df_row):
+    """Multiply an array (or strip of an array) of input values by the image's correction coefficient."""
+    if "band_math" not in image_df_row.index:
+        # single pass from (possibly memory-mapped) input to float output, without an intermediate copy
+        return np.multiply(
+            image_arr, image_df_row.correction_coefficient, dtype=np.float32
+        )
 
-    image_arr = np.asarray(Image.open(image_df_row.image_path)).astype(np.float32)
     # for images that represent data for multiple bands
-    if "band_math" in image_df_row.index:
-        # ignore saturated pixels
-        saturation_indices = image_arr >= 255
-        # ideally set to np.nan, but this messes up the stitching software
-        image_arr[saturation_indices] = 255
-        # perform band math
-        image_arr = detect_panel.isolate_band(image_arr, image_df_row.band_math)
+    image_arr = image_arr.astype(np.float32)
+    # ignore saturated pixels
+    saturation_indices = image_arr >= 255
+    # ideally set to np.nan, but this messes up the stitching software
+    image_arr[saturation_indices] = 255
+    # perform band math
+    image_arr = detect_panel.isolate_band(image_arr, image_df_row.band_math)
 
     image_arr = image_arr * image_df_row.correction_coefficient
 
     return image_arr
 
 
+def apply_corrections(image_df_row, streaming=False):
+    """
+    Multiply input values by correction coefficients to generate reflectance values.
+
+    If ``streaming`` is set, the image is not corrected immediately. Instead, ImageStrips are returned that
+    read and correct the image one horizontal strip at a time as they are consumed by ``io.write_image``,
+    which keeps peak memory per image bounded regardless of sensor resolution.
+    """
+    logger.debug("Applying correction to image: %s", image_df_row.image_path)
+
+    if streaming:
+        image = io.iter_image_strips(image_df_row.image_path)
+        return image._replace(
+            shape=image.shape[:2],
+            strips=(_correct_array(strip, image_df_row) for strip in image.strips),
+        )
+
+    return _correct_array(io.read_image(image_df_row.image_path), image_df_row)
+
+
+def compute_max_values(image_df):
+    """
+    Return the maximum corrected value of each image, as found by ``io.write_image`` before any scale adjustment.
+
+    Images are read and corrected strip-wise, but not written. Recording these in the ``corrected_max_val``
+    column of a correction plan lets the shards of a sharded run scale their output by the same maximum over
+    all images. (The ``max_val`` column set by some sensors' settings is the range of their raw values.)
+    """
+
+    def _max_value(row):
+        return max(np.max(strip) for strip in apply_corrections(row, True).strips)
+
+    return image_df.progress_apply(_max_value, axis=1)
+
+
 def get_corrections(
-    input_path, calibration_id, output_path, no_ils_correct, no_reflectance_correct
+    input_path,
+    calibration_id,
+    output_path,
+    no_ils_correct,
+    no_reflectance_correct,
+    panels_file=None,
+    manifest=None,
 ):
     """
     Find correction coefficient for each image.
 
     For each image in the input_path directory (recursive), determine coefficients to correct for
     autoexposure and incidental lighting variance, and scale to mean reflectance of a calibration
-    panel with known reflectance.
+    panel with known reflectance. Panels are looked up in the packaged panel registry, extended with
+    the panels of ``panels_file`` if given. If the ``incremental.Manifest`` of an incremental run is given,
+    panels are only searched for in the images it has no record of, and recorded in it.
     """
+    panels.load_panels(panels_file)
+
     # Create new `pandas` methods which use `tqdm` progress
     # (can use tqdm_gui, optional kwargs, etc.)
     tqdm.pandas()
@@ -208,31 +324,30 @@ def get_corrections(
     # Determine sensor type apply sensor specific settings
     image_df = io.apply_sensor_settings(image_df)
 
+    # Metadata is read once per image, and shared by all band rows of the image
+    images = image_df.drop_duplicates("image_path")
+
     # Get autoexposure correction:
     logger.info("Getting autoexposure")
-    image_df["autoexposure"] = image_df.progress_apply(
-        lambda row: imgparse.get_autoexposure(row.image_path, row.EXIF) / 100, axis=1
-    )
+    autoexposure = {
+        path: imgparse.get_autoexposure(path, exif)
+        for path, exif in tqdm(zip(images.image_path, images.EXIF), total=len(images))
+    }
+    image_df["autoexposure"] = image_df.image_path.map(autoexposure) / 100
 
     # Get and sort by timestamp
     logger.info("Getting timestamps")
-
-    def _get_timestamp(exif):
-        return datetime.strptime(
-            exif["EXIF DateTimeOriginal"].values, "%Y:%m:%d %H:%M:%S"
-        )
-
-    image_df["timestamp"] = image_df.EXIF.apply(_get_timestamp)
+    image_df["timestamp"] = pd.to_datetime(
+        image_df.EXIF.map(lambda exif: exif["EXIF DateTimeOriginal"].values),
+        format="%Y:%m:%d %H:%M:%S",
+    )
     image_df = image_df.set_index("timestamp", drop=False).sort_index()
 
     # Attempt to parse ILS metadata
     logger.info("Getting ILS")
     try:
-
-        def _get_ils(row):
-            return imgparse.get_ils(row.image_path)[0]
-
-        image_df["ILS"] = image_df.progress_apply(_get_ils, axis=1)
+        ils = {path: imgparse.get_ils(path)[0] for path in tqdm(images.image_path)}
+        image_df["ILS"] = image_df.image_path.map(ils)
     except imgparse.ParsingError:
         if not no_ils_correct:
             logger.warning(
@@ -243,7 +358,10 @@ def get_corrections(
     # Split out calibration images, if present:
     if not no_reflectance_correct:
         logger.info("Creating calibration dataframe")
-        calibration_df, image_df = io.create_cal_df(image_df, calibration_id)
+        calibration_df, image_df = io.create_cal_df(image_df, calibration_id, manifest)
+        if manifest is not None:
+            # keep the panels searched for, even if calibration turns out to be incomplete
+            manifest.save()
 
     # Get ILS correction:
     if not no_ils_correct:
@@ -262,25 +380,510 @@ def get_corrections(
         )
     else:
 
-        def get_sensitivity(row):
-            xmp = imgparse.get_xmp_data(row.image_path)
+        def get_sensitivities(path):
+            xmp = imgparse.get_xmp_data(path)
             if "Camera:BandSensitivity" in xmp:
-                sensitivity = float(
-                    imgparse.util.parse_seq(xmp["Camera:BandSensitivity"])[
-                        row.XMP_index
-                    ]
-                )
-                return 1 / sensitivity
-            else:
-                return 1
+                return imgparse.util.parse_seq(xmp["Camera:BandSensitivity"])
+            return None
+
+        sensitivities = {
+            path: get_sensitivities(path)
+            for path in image_df.image_path.drop_duplicates()
+        }
+        image_df["slope_coefficient"] = [
+            1 / float(sensitivities[path][int(xmp_index)])
+            if sensitivities[path] is not None
+            else 1
+            for path, xmp_index in zip(image_df.image_path, image_df.XMP_index)
+        ]
+
+    image_df["correction_coefficient"] = compute_correction_coefficient(image_df)
+
+    return image_df, calibration_sets, selected_group_id
+
+
+def plan_options(calibration_id, no_ils_correct, no_reflectance_correct):
+    """Return the options recorded in a correction plan, which it can only be applied with."""
+    return {
+        "calibration_id": calibration_id,
+        "no_ils_correct": no_ils_correct,
+        "no_reflectance_correct": no_reflectance_correct,
+    }
 
-        image_df["slope_coefficient"] = image_df.apply(get_sensitivity, axis=1)
 
-    image_df["correction_coefficient"] = image_df.progress_apply(
-        lambda row: compute_correction_coefficient(row), axis=1
+def _read_plan(plan_file, input_path, output_path, options, native_metadata):
+    """Read the image dataframe of a correction plan, with the EXIF of each image if it is to be embedded."""
+    tqdm.pandas()
+    image_df = plan.read_plan(plan_file, input_path, output_path, options)
+    if native_metadata:
+        image_df["EXIF"] = image_df.image_path.apply(imgparse.get_exif_data)
+    return image_df
+
+
+def _global_max_val(image_df):
+    """Return the maximum value over all images of a correction plan, which sharded and queued runs scale by."""
+    if "corrected_max_val" not in image_df:
+        raise ValueError(
+            "Sharded and queued runs that normalize or scale their output need the maximum value over all "
+            "images. Apply a correction plan made with get_corrections.py --plan_max_val."
+        )
+    # corrected images are float32, and are scaled by their maximum as such
+    return np.float32(image_df.corrected_max_val.max())
+
+
+def _select_shard(image_df, shard):
+    """Select the captures of a shard from the image dataframe, keeping the band rows of each capture together."""
+    index, count = shard
+    in_shard = [io.shard_of(capture_id, count) == index for capture_id in image_df.ID]
+    logger.info(
+        "Shard %d/%d: correcting %d of %d images",
+        index,
+        count,
+        sum(in_shard),
+        len(in_shard),
     )
+    return image_df.loc[in_shard]
 
-    return image_df, calibration_sets, selected_group_id
+
+def _queue_name(image_df, output_path, settings):
+    """
+    Return the default name of the tasks of a queued run, shared by the workers of the run.
+
+    This is a hash of the output folder and of the key of each output (see ``incremental.output_keys``), so
+    that runs of other images, corrections or output settings don't skip tasks done by the run, while the
+    same run started again resumes it.
+    """
+    keys = sorted(
+        zip(
+            [os.path.relpath(path, output_path) for path in image_df.output_path],
+            incremental.output_keys(image_df, settings.journaled()),
+        )
+    )
+    return hashlib.blake2b(
+        json.dumps([os.path.abspath(output_path), keys]).encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+
+
+def _run_queue(queue, name, image_df, correct_batch, convert_lwir, lease):
+    """
+    Correct the captures of image_df, and convert LWIR images, as tasks claimed from a queue shared by workers.
+
+    Every worker enqueues all tasks under the run's name, of which those already queued are ignored, and
+    then works until none are left. The leases of each batch of tasks are renewed while it is processed,
+    and it is acknowledged once its images are in place, or released to be retried if processing it fails.
+
+    :param correct_batch: Function correcting the rows of an image dataframe, returning them
+    :param convert_lwir: Function converting a shard of the LWIR images, or None if there are none
+    :return: Image dataframe of the captures corrected by this worker
+    """
+    logger.info("Claiming the tasks named %s from queue %s", name, queue)
+    broker = work_queue.open_broker(queue, name)
+    worker = work_queue.worker_name()
+    capture_ids = image_df.ID.astype(str)
+    tasks = [f"capture:{capture_id}" for capture_id in capture_ids.unique()]
+    if convert_lwir is not None:
+        tasks += [
+            f"lwir:{i}/{QUEUE_LWIR_TASKS}" for i in range(1, QUEUE_LWIR_TASKS + 1)
+        ]
+    corrected = [image_df.iloc[:0]]
+    try:
+        broker.enqueue(tasks)
+        for claimed in work_queue.iter_claims(
+            broker, worker, QUEUE_BATCH_CAPTURES, lease
+        ):
+            kinds = [task.split(":", 1) for task in claimed]
+            batch = image_df.loc[
+                capture_ids.isin([key for kind, key in kinds if kind == "capture"])
+            ]
+            try:
+                with work_queue.renewing_leases(queue, name, worker, claimed, lease):
+                    if len(batch):
+                        # remove anything staged by a worker whose lease on these captures expired
+                        io.remove_staged_outputs(batch.output_path)
+                        corrected.append(correct_batch(batch))
+                    for kind, key in kinds:
+                        if kind == "lwir":
+                            convert_lwir(io.parse_shard(key))
+            except BaseException:
+                io.remove_staged_outputs(batch.output_path)
+                broker.release(worker, claimed)
+                raise
+            broker.ack(worker, claimed)
+        counts = broker.counts()
+        logger.info("Queue %s complete: %s", queue, counts)
+        if counts[work_queue.FAILED]:
+            raise ValueError(
+                f"{counts[work_queue.FAILED]} tasks of queue {queue} failed after "
+                f"{work_queue.MAX_ATTEMPTS} attempts."
+            )
+    finally:
+        broker.close()
+    return pd.concat(corrected)
+
+
+def _prepare_output(
+    output_path, shard, queue, resume, delete_original, incremental_run, rescale
+):
+    """
+    Remove staged images left in the output folder by an interrupted run, unless other runs share it or it is resumed.
+
+    :return: Shard parsed as (i, N), if given
+    """
+    if shard and queue:
+        raise ValueError("Runs can either be sharded or use a queue, not both.")
+    if resume and queue:
+        raise ValueError(
+            "Queued runs are resumed by running them again with the same queue."
+        )
+    if resume and delete_original:
+        raise ValueError(
+            "Runs deleting their original images can't be resumed, as their inputs have changed."
+        )
+    if incremental_run and (queue or delete_original):
+        raise ValueError(
+            "Incremental runs can't use a queue, or delete their original images."
+        )
+    if rescale and not incremental_run:
+        raise ValueError("Only incremental runs can rescale their outputs in place.")
+    if shard:
+        return io.parse_shard(shard)
+    if not (queue or resume):
+        io.remove_staged_images(output_path)
+    return None
+
+
+def _wait_for_thermal(thermal_future):
+    """Wait for the LWIR conversion of a failed run to stop, so its staged images are no longer written to."""
+    if thermal_future is not None:
+        wait([thermal_future])
+        if thermal_future.exception() is not None:
+            logger.error("LWIR conversion failed: %s", thermal_future.exception())
+
+
+def _find_lwir_folder(input_path):
+    """Return the LWIR folder in (or at) input_path, or None if there is none."""
+    lwir_folder_path = None
+    input_folders = [
+        f for f in os.listdir(input_path) if os.path.isdir(os.path.join(input_path, f))
+    ]
+    if not input_folders:
+        if "lwir" in os.path.split(input_path)[1].lower():
+            lwir_folder_path = input_path
+    for folder in input_folders:
+        if "lwir" in folder.lower():
+            lwir_folder_path = os.path.join(input_path, folder)
+    return lwir_folder_path
+
+
+def _copy_all_exif(exif_df, exiftool_path, batch_exif, exif_workers, exif_timeout):
+    """Copy EXIF, reusing one exiftool process for the whole run, for each batch or for each worker."""
+    if batch_exif:
+        failed = metadata.copy_exif_batch(exif_df, exiftool_path)
+        if failed:
+            logger.warning("Retrying EXIF copy for %d images", len(failed))
+        exif_df = exif_df.iloc[failed]
+    if exif_workers > 1:
+        failed = metadata.copy_exif_concurrent(
+            exif_df, exiftool_path, exif_workers, exif_timeout
+        )
+        if failed:
+            raise ValueError(
+                f"Exiftool could not copy metadata for {len(failed)} images."
+            )
+    else:
+        # progress_apply is tqdm version of apply
+        exif_df.progress_apply(
+            lambda row: metadata.copy_exif(
+                row, exiftool_path, metadata.get_session(exiftool_path)
+            ),
+            axis=1,
+        )
+
+
+class _OutputSettings(NamedTuple):
+    """Settings of a correction run that determine how corrected images are written, and their metadata copied."""
+
+    no_reflectance_correct: bool
+    uint16_output: bool
+    native_metadata: bool
+    compression: Optional[str]
+    compression_level: Optional[int]
+    tile_size: Optional[int]
+    overviews: int
+    streaming: bool
+    delete_original: bool
+    exiftool_path: str
+    batch_exif: bool
+    exif_workers: int
+    exif_timeout: float
+
+    @property
+    def adjust_output_scale(self):
+        """If the scale needs adjusting, the output layout and metadata are only applied once final values are written."""
+        return self.no_reflectance_correct or self.uint16_output
+
+    def journaled(self):
+        """Return the settings determining output values and layout, which a resumed run must share."""
+        return {
+            name: getattr(self, name)
+            for name in (
+                "no_reflectance_correct",
+                "uint16_output",
+                "native_metadata",
+                "compression",
+                "compression_level",
+                "tile_size",
+                "overviews",
+            )
+        }
+
+
+def _final_write_options(row, settings):
+    """Return the write options of the final values of an image."""
+    return {
+        "compression": settings.compression,
+        "compression_level": settings.compression_level,
+        "tile_size": settings.tile_size,
+        "overviews": settings.overviews,
+        "tiff_metadata": metadata.build_tiff_metadata(row)
+        if settings.native_metadata
+        else None,
+    }
+
+
+def _write_row(row, settings, run_journal):
+    """Write the corrected image of a row to its staging path."""
+    written = io.write_image(
+        apply_corrections(row, settings.streaming),
+        row,
+        **({} if settings.adjust_output_scale else _final_write_options(row, settings)),
+    )
+    run_journal.record(
+        [row.output_path],
+        journal.STAGED if settings.adjust_output_scale else journal.WRITTEN,
+        max_val=[float(written.max_val)],
+        exif_embedded=[bool(written.exif_embedded)],
+    )
+
+
+def _adjust_row_scale(row, max_val, settings, run_journal):
+    """
+    Adjust the scale of the staged image of a row, writing it with its final write options.
+
+    The staged image is only replaced once this is journaled, so that a resumed run never scales it twice.
+    """
+    write_options = _final_write_options(row, settings)
+    scaled_path = row.staging_path + io.SCALED_SUFFIX
+    adjust_scale(
+        row.staging_path,
+        max_val,
+        settings.no_reflectance_correct,
+        settings.uint16_output,
+        settings.streaming,
+        scaled_path=scaled_path,
+        **write_options,
+    )
+    run_journal.record(
+        [row.output_path],
+        journal.WRITTEN,
+        exif_embedded=[write_options["tiff_metadata"] is not None],
+    )
+    os.replace(scaled_path, row.staging_path)
+
+
+def _replace_scaled(image_df):
+    """Replace the staged images of image_df by their scaled copies left by an interrupted run, if any."""
+    for staging_path in image_df.staging_path:
+        scaled_path = staging_path + io.SCALED_SUFFIX
+        if os.path.exists(scaled_path):
+            os.replace(scaled_path, staging_path)
+
+
+def _move_into_place(image_df):
+    """Move the staged images of image_df into place, except those an interrupted run already moved."""
+    moved = np.array(
+        [
+            not os.path.exists(staging_path) and os.path.exists(output_path)
+            for staging_path, output_path in zip(
+                image_df.staging_path, image_df.output_path
+            )
+        ],
+        dtype=bool,
+    )
+    io.move_corrected_images(image_df.loc[~moved])
+
+
+def _todo(image_df, run_journal, state):
+    """Select the rows of the image dataframe that haven't reached a state yet."""
+    progress = np.array(run_journal.progress(image_df.output_path), dtype=int)
+    return image_df.loc[progress < journal.STATES.index(state)]
+
+
+def _chunks(image_df):
+    """Split the image dataframe into chunks of rows, recorded in the journal at once."""
+    for start in range(0, len(image_df), journal.JOURNAL_CHUNK):
+        yield image_df.iloc[start : start + journal.JOURNAL_CHUNK]
+
+
+def _correct_batch(image_df, settings, run_journal, max_val=None):
+    """
+    Write, adjust the scale of, copy the metadata of and move into place the images of image_df.
+
+    Each step is recorded in the run's journal, and skipped for images the journal shows have already
+    been through it. Output images are scaled by ``max_val`` if given, or by the maximum over image_df.
+    """
+    # Apply corrections:
+    logger.info("Applying image corrections...")
+    todo = _todo(image_df, run_journal, journal.STAGED)
+    if len(todo):
+        todo.progress_apply(_write_row, axis=1, args=(settings, run_journal))
+    image_df = image_df.assign(
+        staging_path=image_df.output_path.map(io.get_staging_path),
+        max_val=run_journal.values(image_df.output_path, "max_val"),
+    )
+
+    # Adjust scale if necessary:
+    todo = _todo(image_df, run_journal, journal.WRITTEN)
+    if len(todo):
+        logger.info("Adjusting output scale...")
+        if max_val is None:
+            # corrected images are float32, and are scaled by their maximum as such
+            max_val = np.float32(image_df.max_val.max())
+        todo.progress_apply(
+            _adjust_row_scale, axis=1, args=(max_val, settings, run_journal)
+        )
+    image_df["exif_embedded"] = run_journal.values(
+        image_df.output_path, "exif_embedded"
+    )
+
+    # Copy EXIF not already embedded natively:
+    logger.info("Writing EXIF data...")
+    todo = _todo(image_df, run_journal, journal.METADATA)
+    _replace_scaled(todo)
+    run_journal.record(
+        todo.output_path[todo.exif_embedded.astype(bool)], journal.METADATA
+    )
+    for chunk in _chunks(todo.loc[~todo.exif_embedded.astype(bool)]):
+        _copy_all_exif(
+            chunk,
+            settings.exiftool_path,
+            settings.batch_exif,
+            settings.exif_workers,
+            settings.exif_timeout,
+        )
+        run_journal.record(chunk.output_path, journal.METADATA)
+
+    # Delete input imagery if requested:
+    todo = _todo(image_df, run_journal, journal.MOVED)
+    if settings.delete_original:
+        io.delete_all_originals(todo)
+
+    # Move completed output imagery from staging paths into place:
+    for chunk in _chunks(todo):
+        _move_into_place(chunk)
+        run_journal.record(chunk.output_path, journal.MOVED)
+    return image_df
+
+
+def _select_changed(image_df, manifest, settings, max_val, provisional, rescale):
+    """
+    Select the rows of the image dataframe whose output changed since the previous incremental run.
+
+    If output is scaled, its scale is the maximum over the values recorded for unchanged outputs and those
+    of the changed images, which are read to find them. If that is not the scale unchanged outputs were
+    written with, every output has changed, unless the run is provisional.
+
+    If ``rescale`` is set, outputs of unchanged input images are instead kept even if their corrections or
+    scale changed, and rescaled in place (see ``_rescale_outputs``), unless the run is provisional.
+
+    :param manifest: Manifest of the previous incremental runs, ``incremental.Manifest``
+    :return: Tuple of the changed rows, and the maximum value to scale output by
+    """
+    image_df = image_df.assign(
+        output_key=incremental.output_keys(
+            image_df,
+            settings.journaled(),
+            fingerprint_of=manifest.fingerprint,
+        ),
+        input_key=incremental.output_keys(
+            image_df,
+            settings.journaled(),
+            incremental.INPUT_KEY_COLUMNS,
+            manifest.fingerprint,
+        ),
+    )
+    rescale = rescale and not provisional
+    unchanged = np.array(
+        manifest.unchanged(image_df, provisional or rescale), dtype=bool
+    )
+    # ratio of the values of the kept outputs to those they were written with
+    ratios = np.ones(unchanged.sum())
+    if rescale:
+        ratios = image_df.correction_coefficient[unchanged].to_numpy(
+            dtype=float
+        ) / np.array(manifest.values(image_df.output_path[unchanged], "coefficient"))
+    # there is no scale to find without images
+    if settings.adjust_output_scale and len(image_df):
+        if max_val is None:
+            max_vals = list(
+                np.array(manifest.values(image_df.output_path[unchanged], "max_val"))
+                * ratios
+            )
+            if not unchanged.all():
+                max_vals.extend(compute_max_values(image_df.loc[~unchanged]))
+            max_val = np.float32(max(max_vals))
+        scales = np.array(
+            manifest.values(image_df.output_path[unchanged], "scale"), dtype=float
+        )
+        if rescale:
+            ratios *= scales / float(max_val)
+        elif not provisional and (scales != float(max_val)).any():
+            logger.info("Maximum value changed, so all outputs are rewritten")
+            unchanged[:] = False
+    if rescale:
+        _rescale_outputs(image_df.loc[unchanged], ratios, manifest)
+    logger.info(
+        "Incremental run: skipping %d unchanged of %d outputs",
+        unchanged.sum(),
+        len(unchanged),
+    )
+    return image_df.loc[~unchanged], max_val
+
+
+def _rescale_outputs(image_df, factors, manifest):
+    """
+    Rescale the outputs of the image dataframe in place by factors, wherever they aren't already.
+
+    Rather than rewriting an output whose values changed by a factor, e.g. with the ILS normalization of a
+    provisional run, the factor is recorded in its GDAL_METADATA tag (see ``io.write_gdal_scale``), which
+    readers must apply to its stored values.
+    """
+    rescaled = factors != np.array(manifest.values(image_df.output_path, "rescale"))
+    for output_path, factor in zip(image_df.output_path[rescaled], factors[rescaled]):
+        io.write_gdal_scale(output_path, factor)
+    manifest.rescale(image_df, factors)
+    logger.info("Incremental run: rescaled %d outputs in place", rescaled.sum())
+    if (factors != 1).any():
+        logger.warning(
+            "%d outputs store values that are only final once multiplied by the scale in their GDAL_METADATA "
+            "tag, which GDAL and rasterio report but don't apply. A run without --incremental rewrites them.",
+            (factors != 1).sum(),
+        )
+
+
+def _start_journal(
+    image_df, input_path, output_path, shard, plan_file, options, settings
+):
+    """Start the journal of a run, saving its correction plan to the output folder unless it applies one."""
+    if not plan_file:
+        plan_file = journal.plan_path(output_path, shard)
+        os.makedirs(output_path, exist_ok=True)
+        plan.write_plan(plan_file, image_df, input_path, output_path, options)
+    return journal.Journal.create(
+        journal.journal_path(output_path, shard),
+        {"plan_file": os.path.abspath(plan_file), "settings": settings.journaled()},
+    )
 
 
 def correct_images(
@@ -292,6 +895,26 @@ def correct_images(
     delete_original,
     exiftool_path,
     uint16_output,
+    streaming=False,
+    compression=None,
+    compression_level=None,
+    tile_size=None,
+    overviews=0,
+    batch_exif=False,
+    native_metadata=False,
+    exif_workers=1,
+    exif_timeout=metadata.EXIFTOOL_TIMEOUT,
+    thermal_format="float32",
+    panels_file=None,
+    plan_file=None,
+    shard=None,
+    queue=None,
+    queue_lease=work_queue.LEASE_SECONDS,
+    queue_name=None,
+    resume=False,
+    incremental_run=False,
+    provisional=False,
+    rescale=False,
 ):
     """
     Radiometrically correct images.
@@ -300,61 +923,160 @@ def correct_images(
     autoexposure and incidental lighting variance, and scale to mean reflectance of a calibration
     panel with known reflectance.
 
-    The result is applied to each image before the image is re-saved.
+    The result is applied to each image before the image is re-saved, to a staging path next to its output
+    path, and moved into place once complete. LWIR images are converted concurrently with the multispectral
+    correction, and any error converting them is raised once the multispectral images are done. The other
+    options are those of ``scripts/correct_images.py``:
+
+    - ``streaming``: correct images strip-wise, see ``apply_corrections``
+    - ``compression``, ``compression_level``: output TIFF compression, see ``io.tiff_write_options``
+    - ``tile_size``, ``overviews``: output TIFF tiles and overviews, see ``io.write_image``
+    - ``batch_exif``: copy metadata with an exiftool invocation per batch, see ``metadata.copy_exif_batch``
+    - ``native_metadata``: embed metadata as outputs are written, see ``metadata.build_tiff_metadata``
+    - ``exif_workers``, ``exif_timeout``: concurrent exiftool sessions, see
+      ``metadata.copy_exif_concurrent``
+    - ``thermal_format``: format LWIR images are converted to, see ``thermal_convert.convert_thermal``
+    - ``panels_file``: user panels file, see ``panels.load_panels``
+    - ``plan_file``: correction plan to apply rather than computing the corrections, see ``plan``
+    - ``shard``: "i/N", to correct only the i-th of N shards of the captures, see ``io.parse_shard``
+    - ``queue``, ``queue_lease``, ``queue_name``: queue to claim captures from, shared by runs, under a name
+      that defaults to ``_queue_name``, see ``work_queue``
+    - ``resume``: resume an interrupted run from its journal, see ``journal``
+    - ``incremental_run``: skip outputs unchanged since the previous incremental run, see ``incremental``
+    - ``provisional``: skip outputs whose corrections changed too, until a final run, see ``watch``
+    - ``rescale``: rescale outputs whose corrections changed in place, see ``io.write_gdal_scale``
     """
-    image_df, calibration_sets, selected_set_id = get_corrections(
-        input_path, calibration_id, output_path, no_ils_correct, no_reflectance_correct
+    if not output_path:
+        output_path = input_path
+    shard = _prepare_output(
+        output_path, shard, queue, resume, delete_original, incremental_run, rescale
+    )
+    settings = _OutputSettings(
+        no_reflectance_correct,
+        uint16_output,
+        native_metadata,
+        compression,
+        compression_level,
+        tile_size,
+        overviews,
+        streaming,
+        delete_original,
+        exiftool_path,
+        batch_exif,
+        exif_workers,
+        exif_timeout,
+    )
+    options = plan_options(calibration_id, no_ils_correct, no_reflectance_correct)
+    manifest = (
+        incremental.Manifest(incremental.manifest_path(output_path, shard))
+        if incremental_run
+        else None
     )
-    logger.info("Delete original: %s", "Enabled" if delete_original else "Disabled")
 
-    # Check for LWIR folder and convert images
-    lwir_folder_path = None
-    input_folders = [
-        f for f in os.listdir(input_path) if os.path.isdir(os.path.join(input_path, f))
-    ]
-    if not input_folders:
-        if "lwir" in os.path.split(input_path)[1].lower():
-            lwir_folder_path = input_path
-    for folder in input_folders:
-        if "lwir" in folder.lower():
-            lwir_folder_path = os.path.join(input_path, folder)
+    if resume:
+        run_journal = journal.Journal.resume(
+            journal.journal_path(output_path, shard), settings.journaled()
+        )
+        plan_file = run_journal.header["plan_file"]
 
-    if lwir_folder_path is not None:
-        lwir_output_path = os.path.join(output_path, os.path.split(lwir_folder_path)[1])
-        if not os.path.exists(output_path):
-            os.mkdir(output_path)
-        thermal_convert.convert_thermal(
-            lwir_folder_path, lwir_output_path, exiftool_path
+    if plan_file:
+        image_df = _read_plan(
+            plan_file, input_path, output_path, options, native_metadata
+        )
+        calibration_sets, selected_set_id = None, None
+    else:
+        image_df, calibration_sets, selected_set_id = get_corrections(
+            input_path,
+            calibration_id,
+            output_path,
+            no_ils_correct,
+            no_reflectance_correct,
+            panels_file,
+            manifest,
+        )
+
+    if queue:
+        # queues keep track of progress themselves
+        run_journal = journal.Journal()
+    elif not resume:
+        run_journal = _start_journal(
+            image_df, input_path, output_path, shard, plan_file, options, settings
         )
+    logger.info("Delete original: %s", "Enabled" if delete_original else "Disabled")
+    image_df = io.compact_image_df(image_df, keep_exif=native_metadata)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Apply corrections:
-        logger.info("Applying image corrections...")
-        image_df = image_df.progress_apply(
-            lambda row: io.write_image(apply_corrections(row), row, temp_dir), axis=1
+    # Runs correcting part of the images scale them by the maximum over all images
+    max_val = (
+        _global_max_val(image_df)
+        if settings.adjust_output_scale and (shard or queue)
+        else None
+    )
+    if shard:
+        image_df = _select_shard(image_df, shard)
+        if not resume:
+            io.remove_staged_outputs(image_df.output_path)
+    if incremental_run:
+        image_df, max_val = _select_changed(
+            image_df, manifest, settings, max_val, provisional, rescale
         )
 
-        # Adjust scale if necessary:
-        if no_reflectance_correct or uint16_output:
-            logger.info("Adjusting output scale...")
-            image_df.temp_path.progress_apply(
-                lambda path: adjust_scale(
-                    path, image_df.max_val.max(), no_reflectance_correct, uint16_output
-                )
-            )
+    # Check for LWIR folder and convert images
+    lwir_folder_path = _find_lwir_folder(input_path)
 
-        # Copy EXIF:
-        logger.info("Writing EXIF data...")
-        # progress_apply is tqdm version of apply
-        image_df.progress_apply(
-            lambda row: metadata.copy_exif(row, exiftool_path), axis=1
+    def _convert_lwir(lwir_shard, share=1):
+        # convert with 1/share of the workers
+        lwir_output_path = os.path.join(output_path, os.path.split(lwir_folder_path)[1])
+        os.makedirs(output_path, exist_ok=True)
+        thermal_convert.convert_thermal(
+            lwir_folder_path,
+            lwir_output_path,
+            exiftool_path,
+            max(1, exif_workers // share),
+            exif_timeout,
+            workers=max(1, (os.cpu_count() or 1) // share),
+            thermal_format=thermal_format,
+            compression=compression,
+            compression_level=compression_level,
+            shard=lwir_shard,
+            incremental_run=incremental_run,
         )
 
-        # Delete input imagery if requested:
-        if delete_original:
-            io.delete_all_originals(image_df)
+    # Convert LWIR images alongside the multispectral correction, with half of the workers
+    thermal_executor = ThreadPoolExecutor(max_workers=1)
+    thermal_future = None
+    if lwir_folder_path is not None and not queue:
+        thermal_future = thermal_executor.submit(_convert_lwir, shard, 2)
 
-        # Move output imagery to correct output directory:
-        io.move_corrected_images(image_df)
+    try:
+        if queue:
+            image_df = _run_queue(
+                queue,
+                queue_name or _queue_name(image_df, output_path, settings),
+                image_df,
+                lambda batch: _correct_batch(batch, settings, run_journal, max_val),
+                _convert_lwir if lwir_folder_path is not None else None,
+                queue_lease,
+            )
+        else:
+            image_df = _correct_batch(image_df, settings, run_journal, max_val)
+            if incremental_run:
+                manifest.update(image_df, max_val)
+                manifest.save()
+
+        # Report any LWIR conversion error once the multispectral imagery is done:
+        if thermal_future is not None:
+            thermal_future.result()
+
+        if shard:
+            io.write_shard_marker(output_path, shard, image_df, max_val)
+    except BaseException:
+        # Staged images are kept for the run to be resumed, once LWIR conversion has stopped writing them
+        _wait_for_thermal(thermal_future)
+        raise
+    finally:
+        thermal_executor.shutdown()
+        metadata.close_sessions()
+        metadata.clear_band_info()
+        run_journal.close()
 
     return image_df, calibration_sets, selected_set_id
@@ -3,11 +3,11 @@
 import logging
 from typing import NamedTuple, Tuple
 
-import cv2 as cv
 import numpy as np
-from PIL import Image
 
-# Constants
+from imgcorrect import io, panels
+
+# Constants, used for markers that are not in the panel registry
 ARUCO_SIDE_LENGTH_M = 0.07
 ARUCO_TOP_TO_PANEL_CENTER_M = 0.06
 
@@ -49,7 +49,9 @@ def extract_panel_bounds(image):
     """
     Detect an Aruco marker attached to a reflectance calibration panel and calculates the location of the panel itself.
 
-    It is important to note that the function relies on an orientation of the calibration panel in which:
+    The position of the panel relative to the marker, and the size of its sampled area, are taken from the
+    panel registry entry of the marker's ID. By default, the function relies on an orientation of the
+    calibration panel in which:
     (1) The orientation of the Aruco marker is rotated 90 degrees clock-wise from the standard orientation,
     with its top left corner forming the top right of the marker in the image.
     (2) The reflectance panel itself is situated directly above the Aruco marker in the image.
@@ -57,6 +59,9 @@ def extract_panel_bounds(image):
     :param image: The NumPy array of the image
     :return: The non-rotated bounding box of the panel, as a BoundingBox object
     """
+    # OpenCV is slow to import, so it is only imported once panels are detected
+    import cv2 as cv
+
     # o------>  +X
     # |
     # |
@@ -66,40 +71,53 @@ def extract_panel_bounds(image):
 
     # if at least one marker detected
     if ids is not None:
+        panel = panels.get_panel(ids[0][0])
+        if panel is None:
+            logger.warning(
+                "Aruco ID: %s is not a known panel. Assuming default geometry.",
+                ids[0][0],
+            )
+            panel = panels.Panel(
+                aruco_id=int(ids[0][0]),
+                name="unknown",
+                spectrum=None,
+                panel_edge=(3, 0),
+                marker_side_length_m=ARUCO_SIDE_LENGTH_M,
+                marker_to_panel_center_m=ARUCO_TOP_TO_PANEL_CENTER_M,
+                sample_width_m=SAMPLE_RECT_WIDTH,
+                sample_height_m=SAMPLE_RECT_HEIGHT,
+            )
+        logger.debug("Aruco ID: %s detected (%s).", ids[0][0], panel.name)
+
         aruco_side_length_p = cv.norm(corners[0][0][1] - corners[0][0][0])
-        gsd = ARUCO_SIDE_LENGTH_M / aruco_side_length_p
+        gsd = panel.marker_side_length_m / aruco_side_length_p
         logger.debug("Calibration image GSD: %10.5f m/pixel", gsd)
 
-        # by default, expects panel to left of aruco marker
-        top_aruco_line = corners[0][0][0] - corners[0][0][3]
-        top_aruco_line_middle = top_aruco_line / 2.0 + corners[0][0][3]
-
-        # panels with markers of id:63 are incorrectly oriented
-        # in this case, panel is beneath marker
-        if ids[0][0] == 63:
-            logger.info("Aruco ID: 63 detected. Adjusting for panel beneath marker.")
-            top_aruco_line = corners[0][0][3] - corners[0][0][2]
-            top_aruco_line_middle = top_aruco_line / 2.0 + corners[0][0][2]
+        # by default, expects panel to left of aruco marker (panel_edge (3, 0));
+        # panels with markers of id:63 are beneath their marker instead (panel_edge (2, 3))
+        edge_start, edge_end = panel.panel_edge
+        top_aruco_line = corners[0][0][edge_end] - corners[0][0][edge_start]
+        top_aruco_line_middle = top_aruco_line / 2.0 + corners[0][0][edge_start]
 
         top_aruco_line_normal = np.array([top_aruco_line[1], -top_aruco_line[0]])
 
         top_aruco_line_normal /= cv.norm(top_aruco_line_normal)
         top_aruco_line_normal_scaled_pixels = (
-            ARUCO_TOP_TO_PANEL_CENTER_M / gsd
+            panel.marker_to_panel_center_m / gsd
         ) * top_aruco_line_normal
 
         sample_center = top_aruco_line_middle + top_aruco_line_normal_scaled_pixels
         sample_top_left_corner = np.array(
             [
-                sample_center[0] - (SAMPLE_RECT_HEIGHT / 2.0) / gsd,
-                sample_center[1] - (SAMPLE_RECT_WIDTH / 2.0) / gsd,
+                sample_center[0] - (panel.sample_height_m / 2.0) / gsd,
+                sample_center[1] - (panel.sample_width_m / 2.0) / gsd,
             ]
         )
 
         top_left = (int(sample_top_left_corner[0]), int(sample_top_left_corner[1]))
         bottom_right = (
-            int(top_left[0] + SAMPLE_RECT_WIDTH / gsd),
-            int(top_left[1] + SAMPLE_RECT_HEIGHT / gsd),
+            int(top_left[0] + panel.sample_width_m / gsd),
+            int(top_left[1] + panel.sample_height_m / gsd),
         )
         return BoundingBox(
             top_left=top_left, bottom_right=bottom_right, aruco_id=ids[0][0]
@@ -116,6 +134,8 @@ def isolate_band(image, band_math_arr):
     :param band_math_arr: Describes the band math required to isolate the desired band
     :return: The isolated band
     """
+    import cv2 as cv
+
     red_ch, green_ch, blue_ch = cv.split(image)
     return (
         (band_math_arr[0] * red_ch if band_math_arr[0] != 0 else 0)
@@ -132,11 +152,11 @@ def get_reflectance(row):
     :return: The average value of the reflectance panel a valid calibration image, NaN if image is invalid
     """
     if "band_math" not in row.index:
-        image = np.asarray(Image.open(row["image_path"])).astype(np.uint16)
+        image = io.read_image(row["image_path"]).astype(np.uint16, copy=False)
         # OpenCV aruco detection only accepts 8-bit data
         panel = extract_panel_bounds(convert_to_type(image, row.max_val, np.uint8))
     else:
-        image = np.asarray(Image.open(row["image_path"])).astype(np.uint8)
+        image = io.read_image(row["image_path"]).astype(np.uint8)
         panel = extract_panel_bounds(image)
         # Change array type to float so saturated values can be ignored during reflectance calculation
         image = image.astype(np.float32)
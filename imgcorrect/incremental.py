@@ -0,0 +1,221 @@
+"""
+Skip the outputs of a correction run that are unchanged since the previous run writing to the same folder.
+
+Incremental runs keep a manifest in the output folder, recording for each output image a key of everything
+its values depend on: a fingerprint of its input image (size, modification time and a hash of its first
+and last blocks), its corrections and the output settings. Outputs whose key and file size match the
+manifest are skipped. Provisional runs, e.g. of images still arriving, only skip outputs whose input image
+and output settings are unchanged, even if their corrections changed, until a final run brings them up to
+date. Output that is normalized or scaled to uint16 also depends on the maximum value over
+all images, so the maximum value of each image and the maximum it was scaled by are recorded as well.
+
+The correction coefficient each output was written with is recorded too, so that rather than being
+rewritten, an output whose corrections or scale changed can be rescaled in place by the ratio of its final
+to its written values (see ``io.write_gdal_scale``). The rescale factor recorded in each output is kept.
+
+The fingerprint of each input image, and the calibration panels detected in it, are recorded as well, and
+reused by later runs while the image's size, modification and change times and inode are unchanged, so that
+runs over a growing set of images (e.g. those of ``watch``) only read the images that arrived since.
+"""
+import hashlib
+import json
+import logging
+import os
+
+from imgcorrect import journal
+from imgcorrect._version import __version__
+
+MANIFEST_FILE = ".imgcorrect-manifest{}.json"
+
+# Bytes hashed at the start and at the end of each input image
+HASH_BLOCK = 1 << 16
+
+# Image dataframe columns the values of an output image depend on, besides its input image, and the ones
+# that determine which input values it holds
+KEY_COLUMNS = (
+    "band",
+    "band_math",
+    "XMP_index",
+    "reduce_xmp",
+    "correction_coefficient",
+)
+INPUT_KEY_COLUMNS = ("band", "band_math", "XMP_index", "reduce_xmp")
+
+logger = logging.getLogger(__name__)
+
+
+def manifest_path(output_path, shard=None):
+    """Return the path of the manifest of incremental runs, or of a shard of them, writing to output_path."""
+    return os.path.join(output_path, MANIFEST_FILE.format(journal.shard_suffix(shard)))
+
+
+def fingerprint(path):
+    """Return the size, modification time in ns and a hash of the first and last blocks of a file."""
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        digest.update(f.read(HASH_BLOCK))
+        if stat.st_size > HASH_BLOCK:
+            f.seek(max(HASH_BLOCK, stat.st_size - HASH_BLOCK))
+            digest.update(f.read())
+    return [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+
+
+def output_keys(
+    image_df, settings, key_columns=KEY_COLUMNS, fingerprint_of=fingerprint
+):
+    """
+    Return the key of each output image of the image dataframe.
+
+    :param settings: Output settings, as a JSON-serializable dictionary
+    :param key_columns: Image dataframe columns included in the key, besides the input image fingerprint
+    :param fingerprint_of: Function returning the fingerprint of an input image, e.g. ``Manifest.fingerprint``
+    """
+    fingerprints = {path: fingerprint_of(path) for path in image_df.image_path.unique()}
+    columns = [column for column in key_columns if column in image_df]
+    # to_dict returns no records at all for no columns
+    records = image_df[columns].to_dict("records") if columns else [{}] * len(image_df)
+    return [
+        hashlib.blake2b(
+            json.dumps(
+                [__version__, settings, fingerprints[path], record], sort_keys=True
+            ).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        for path, record in zip(image_df.image_path, records)
+    ]
+
+
+class Manifest:
+    """Manifest of the outputs of the incremental runs writing to an output folder."""
+
+    def __init__(self, path):
+        """Read the manifest at path, which is empty if there is none yet."""
+        self.path = path
+        self._entries = {}
+        self._inputs = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                manifest = json.load(f)
+            # manifests of other versions are taken as empty, so their outputs are rewritten
+            self._entries = manifest.get("outputs", {})
+            self._inputs = manifest.get("inputs", {})
+        self._outputs = None
+        self._seen = set()
+
+    def fingerprint(self, path):
+        """Return the fingerprint of an input image, reusing the recorded one if the image is unchanged."""
+        return self._input(path)["fingerprint"]
+
+    def detected_panel(self, row, detect):
+        """
+        Return the mean reflectance and ArUco ID of the panel in an image dataframe row, as found by detect(row).
+
+        Detection is skipped if a panel was recorded for the band of the same, unchanged input image.
+        """
+        panels = self._input(row["image_path"]).setdefault("panels", {})
+        band = str(row["band"])
+        if band not in panels:
+            panels[band] = [float(value) for value in detect(row)]
+        return tuple(panels[band])
+
+    def unchanged(self, image_df, provisional=False):
+        """
+        Return, for each row of the image dataframe, whether its output is unchanged since it was recorded.
+
+        Outputs are unchanged if their key, in the ``output_key`` column, is the recorded one, and their file
+        has the recorded size. If ``provisional`` is set, their ``input_key`` is compared instead. The outputs
+        of image_df are the ones kept by ``save``.
+        """
+        self._outputs = [self._key(path) for path in image_df.output_path]
+        key_name = "input_key" if provisional else "output_key"
+        unchanged = []
+        for output_path, key, output_key in zip(
+            image_df.output_path, self._outputs, image_df[key_name]
+        ):
+            entry = self._entries.get(key)
+            unchanged.append(
+                entry is not None
+                and entry.get(key_name) == output_key
+                and os.path.exists(output_path)
+                and os.path.getsize(output_path) == entry["size"]
+            )
+        return unchanged
+
+    def values(self, output_paths, name):
+        """Return the value of name recorded for each output path."""
+        return [self._entries[self._key(path)][name] for path in output_paths]
+
+    def update(self, image_df, scale=None):
+        """Record the outputs of the image dataframe, written by the current run, scaled by the maximum scale."""
+        for output_path, output_key, input_key, max_val, coefficient in zip(
+            image_df.output_path,
+            image_df.output_key,
+            image_df.input_key,
+            image_df.max_val,
+            image_df.correction_coefficient,
+        ):
+            self._entries[self._key(output_path)] = {
+                "output_key": output_key,
+                "input_key": input_key,
+                "size": os.path.getsize(output_path),
+                "max_val": float(max_val),
+                "scale": None if scale is None else float(scale),
+                "coefficient": float(coefficient),
+                "rescale": 1.0,
+            }
+
+    def record(self, image_df):
+        """Record the outputs of the image dataframe, written by the current run, whose values aren't scaled."""
+        for output_path, output_key in zip(image_df.output_path, image_df.output_key):
+            self._entries[self._key(output_path)] = {
+                "output_key": output_key,
+                "input_key": output_key,
+                "size": os.path.getsize(output_path),
+            }
+
+    def rescale(self, image_df, factors):
+        """Record that the outputs of the image dataframe were rescaled in place, to be up to date."""
+        for output_path, output_key, factor in zip(
+            image_df.output_path, image_df.output_key, factors
+        ):
+            entry = self._entries[self._key(output_path)]
+            entry.update(
+                output_key=output_key,
+                size=os.path.getsize(output_path),
+                rescale=float(factor),
+            )
+
+    def save(self):
+        """Write the manifest, dropping outputs and input images that are no longer part of the run."""
+        if self._outputs is not None:
+            self._entries = {
+                key: self._entries[key] for key in self._outputs if key in self._entries
+            }
+            self._inputs = {
+                path: entry
+                for path, entry in self._inputs.items()
+                if path in self._seen
+            }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w") as f:
+            json.dump({"outputs": self._entries, "inputs": self._inputs}, f)
+        os.replace(temporary_path, self.path)
+
+    def _key(self, output_path):
+        return journal.relative_output(output_path, self.path)
+
+    def _input(self, path):
+        # the change time and inode change whenever the file is written, even by tools that keep its mtime
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        state = [stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino]
+        entry = self._inputs.get(path)
+        if entry is None or entry["stat"] != state:
+            entry = self._inputs[path] = {
+                "stat": state,
+                "fingerprint": fingerprint(path),
+            }
+        self._seen.add(path)
+        return entry
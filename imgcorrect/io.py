@@ -1,21 +1,57 @@
 """Input/output operations for Sentera imagery."""
 
+import importlib.util
+import json
 import logging
 import os
-import shutil
+import struct
+import zlib
+from functools import lru_cache
+from glob import escape as glob_escape
 from glob import glob
+from typing import Iterator, NamedTuple, Tuple
 
 import imgparse
 import numpy as np
 import pandas as pd
 import tifffile as tf
 
-from imgcorrect import detect_panel
+from imgcorrect import detect_panel, metadata
 from imgcorrect.sensor_defs import sensor_defs
 
+# Number of rows held in memory at once when streaming an image strip-wise
+STREAMING_ROWS_PER_STRIP = 256
+
+# Marker added to the name of corrected images until they are complete and moved into place
+STAGING_SUFFIX = ".imgcorrect-staging"
+# Suffix of the scaled copy of a staged image, which replaces it once complete
+SCALED_SUFFIX = ".scaled"
+
+# File written to the output folder by each shard of a sharded run once its images are complete
+SHARD_MARKER = ".imgcorrect-shard-{}-of-{}.json"
+
+# Output compression options, mapped to their tifffile names
+COMPRESSION_CODECS = {"deflate": "zlib", "zstd": "zstd", "lzw": "lzw"}
+# Number of threads used to encode the strips of a compressed output image
+WRITE_MAXWORKERS = max(1, (os.cpu_count() or 1) // 2)
+
+# GDAL_METADATA TIFF tag, holding the scale of stored values
+GDAL_METADATA_TAG = 42112
+
+# Image dataframe columns with few distinct values per row, stored dictionary-encoded by compact_image_df
+CATEGORICAL_COLUMNS = ("image_path", "image_root", "band", "sensor", "ID")
+
 logger = logging.getLogger(__name__)
 
 
+class ImageStrips(NamedTuple):
+    """Lazily evaluated image, represented as an iterator over horizontal strips of ``rowsperstrip`` rows."""
+
+    shape: Tuple[int, ...]
+    rowsperstrip: int
+    strips: Iterator[np.ndarray]
+
+
 def apply_sensor_settings(image_df):
     """Rebuild image dataframe with settings based on sensor model."""
     rows = []
@@ -93,9 +129,12 @@ def create_image_df(input_path, output_path):
 
     image_df = pd.DataFrame()
 
-    image_df["image_path"] = glob(
-        input_path + "/**/*.[Tt][Ii][Ff]", recursive=True
-    ) + glob(input_path + "/**/*.[Jj][Pp][Gg]", recursive=True)
+    image_paths = glob(input_path + "/**/*.[Tt][Ii][Ff]", recursive=True) + glob(
+        input_path + "/**/*.[Jj][Pp][Gg]", recursive=True
+    )
+    image_df["image_path"] = [
+        path for path in image_paths if STAGING_SUFFIX not in os.path.basename(path)
+    ]
     image_df["image_root"] = image_df.image_path.apply(os.path.dirname)
     image_df["output_path"] = image_df.image_path.str.replace(
         input_path, output_path, regex=False
@@ -104,10 +143,18 @@ def create_image_df(input_path, output_path):
     return image_df
 
 
-def reflectance_if_panel(row):
-    """If reflectance panel images are not identifiable by filename, try computing panel reflectance for all images."""
+def reflectance_if_panel(row, manifest=None):
+    """
+    If reflectance panel images are not identifiable by filename, try computing panel reflectance for all images.
+
+    If the ``incremental.Manifest`` of an incremental run is given, the panels it records are reused.
+    """
     if not row["cal_in_path"]:
-        row["mean_reflectance"], row["aruco_id"] = detect_panel.get_reflectance(row)
+        if manifest is None:
+            panel = detect_panel.get_reflectance(row)
+        else:
+            panel = manifest.detected_panel(row, detect_panel.get_reflectance)
+        row["mean_reflectance"], row["aruco_id"] = panel
     return row
 
 
@@ -118,17 +165,38 @@ def detect_cal(row, calibration_id):
     return not np.isnan(row["mean_reflectance"])
 
 
-def create_cal_df(image_df, calibration_id):
-    """Build calibration image dataframe."""
-    image_df = image_df.apply(reflectance_if_panel, axis=1)
+def create_cal_df(image_df, calibration_id, manifest=None):
+    """Build calibration image dataframe, reusing the panels recorded in manifest if given (see reflectance_if_panel)."""
+    image_df = image_df.apply(reflectance_if_panel, axis=1, args=(manifest,))
     is_cal_image = image_df.apply(lambda row: detect_cal(row, calibration_id), axis=1)
 
     return image_df.loc[is_cal_image], image_df.loc[~is_cal_image]
 
 
+def compact_image_df(image_df, keep_exif=False):
+    """
+    Reduce the memory used by the image dataframe of a large campaign once its corrections are known.
+
+    Repeated strings (the paths shared by the band rows of an image, band and sensor names) are
+    dictionary-encoded as categoricals, the XMP index is downcast, and the parsed EXIF of each image is
+    dropped unless ``keep_exif`` is set. Values, and so corrected output, are unchanged.
+    """
+    if not keep_exif:
+        image_df = image_df.drop(columns="EXIF", errors="ignore")
+    columns = {
+        column: image_df[column].astype("category")
+        for column in CATEGORICAL_COLUMNS
+        if column in image_df
+    }
+    if "XMP_index" in image_df:
+        columns["XMP_index"] = pd.to_numeric(image_df.XMP_index, downcast="integer")
+    return image_df.assign(**columns)
+
+
 def delete_all_originals(image_df):
-    """Delete all input images."""
-    image_df.image_path.apply(os.remove)
+    """Delete all input images, once each even if they hold several bands."""
+    for path in image_df.image_path.unique():
+        os.remove(path)
 
 
 def add_band_to_path(path, band):
@@ -137,36 +205,463 @@ def add_band_to_path(path, band):
     return os.path.join(dirname, band, base)
 
 
-def move_images(image_df_row):
-    """Move corrected image to final destination."""
-    shutil.move(image_df_row.temp_path, image_df_row.output_path)
+def get_staging_path(output_path):
+    """Return the path a corrected image is written to before it is complete, next to its final destination."""
+    root, ext = os.path.splitext(output_path)
+    return root + STAGING_SUFFIX + ext
+
+
+def remove_staged_images(path):
+    """Delete staged images left behind under path by an interrupted run."""
+    for staging_path in glob(
+        os.path.join(glob_escape(path), "**", f"*{STAGING_SUFFIX}*"), recursive=True
+    ):
+        logger.warning("Removing incomplete image %s", staging_path)
+        os.remove(staging_path)
+
+
+def remove_staged_outputs(output_paths):
+    """Delete staged images of the given output paths only, leaving those of other concurrent runs alone."""
+    for staging_path in map(get_staging_path, output_paths):
+        for path in (staging_path, staging_path + SCALED_SUFFIX):
+            if os.path.exists(path):
+                logger.warning("Removing incomplete image %s", path)
+                os.remove(path)
+
+
+def parse_shard(shard):
+    """
+    Parse a shard given as "i/N", the i-th of N shards counting from 1.
+
+    :return: Tuple of (i, N)
+    :raises ValueError: If shard is not of that form
+    """
+    try:
+        index, count = (int(part) for part in str(shard).split("/"))
+    except ValueError:
+        raise ValueError(f'Shard must be given as "i/N", not "{shard}".') from None
+    if not 1 <= index <= count:
+        raise ValueError(
+            f"Shard {shard} is not one of shards 1/{count} to {count}/{count}."
+        )
+    return index, count
+
+
+def shard_of(key, count):
+    """Return the shard, from 1 to count, that a capture ID or file name belongs to, the same on every machine."""
+    return zlib.crc32(str(key).encode("utf-8")) % count + 1
+
+
+def write_shard_marker(output_path, shard, image_df, max_val=None):
+    """Record in output_path that a shard of a sharded run has written its images."""
+    index, count = shard
+    marker_path = os.path.join(output_path, SHARD_MARKER.format(index, count))
+    with open(marker_path, "w") as f:
+        json.dump(
+            {
+                "shard": f"{index}/{count}",
+                "images": int(image_df.image_path.nunique()),
+                "outputs": len(image_df),
+                "max_val": None if max_val is None else float(max_val),
+            },
+            f,
+        )
+    logger.info("Shard %d/%d complete", index, count)
 
 
 def move_corrected_images(image_df):
-    """Create output directories if necessary, then move corrected images to final destination."""
-    for folder in image_df.output_path.apply(os.path.dirname).unique():
-        os.makedirs(folder, exist_ok=True)
-    image_df.apply(lambda row: move_images(row), axis=1)
-
-
-def write_image(image_arr_corrected, image_df_row, temp_dir):
-    """Write corrected image to temporary location and record maximum value in case normalization is required."""
-    path_list = os.path.normpath(image_df_row.image_path).split(os.path.sep)
-    path_list[0] = temp_dir
-    temp_path = os.path.join(*path_list)
-    if "band_math" in image_df_row.index:
-        temp_path = add_band_to_path(temp_path, image_df_row.band).replace(
-            ".jpg", ".tif"
+    """Move corrected images to their final destination. Staging paths are on the same filesystem, so nothing is copied."""
+    for staging_path, output_path in zip(image_df.staging_path, image_df.output_path):
+        os.replace(staging_path, output_path)
+
+
+def read_image(path):
+    """
+    Read the pixel data of an input image.
+
+    Uncompressed single-page TIFFs (e.g. 6x band images) are memory-mapped instead of decoded, so pixel
+    data is read straight from the page cache without an intermediate copy. PIL is only used for
+    compressed or otherwise unsupported layouts.
+
+    :param path: Path to the input image
+    :return: The image as a read-only numpy.memmap, or numpy.array if it could not be memory-mapped
+    """
+    if path.lower().endswith(".tif"):
+        try:
+            return tf.memmap(path, mode="r")
+        except ValueError:
+            logger.debug("%s is not memory-mappable, decoding with PIL", path)
+    # PIL is only needed for images tifffile can't memory-map, so it is imported on first use
+    from PIL import Image
+
+    return np.asarray(Image.open(path))
+
+
+@lru_cache(maxsize=None)
+def _imagecodecs_installed():
+    """Return whether imagecodecs, which tifffile needs to encode LZW, zstd and the predictors, is installed."""
+    installed = importlib.util.find_spec("imagecodecs") is not None
+    if not installed:
+        logger.warning(
+            "imagecodecs is not installed, so compressed output is written without a predictor "
+            "(pip install imagecodecs)."
+        )
+    return installed
+
+
+def tiff_write_options(compression=None, compression_level=None, tile_size=None):
+    """
+    Build the ``tifffile.imwrite`` keyword arguments for the requested output compression and layout.
+
+    A floating-point (float32 output) or horizontal differencing (uint16 output) predictor is applied
+    to all codecs, and strips are encoded on multiple threads. LZW and zstd, as well as the
+    predictors, require ``imagecodecs`` to be installed. Without it, deflate output is written without
+    a predictor.
+
+    :param compression: One of ``COMPRESSION_CODECS``, or None for uncompressed output
+    :param compression_level: Codec specific compression level. Ignored for LZW
+    :param tile_size: Side length of square output tiles (a multiple of 16), or None for a stripped layout
+    :return: Dictionary of keyword arguments
+    """
+    options = {}
+    if tile_size:
+        if tile_size % 16:
+            raise ValueError(f"Tile size must be a multiple of 16, not {tile_size}")
+        options["tile"] = (tile_size, tile_size)
+
+    if compression is None or compression == "none":
+        return options
+    if compression not in COMPRESSION_CODECS:
+        raise ValueError(
+            f"Unsupported compression {compression}. Options are: {', '.join(COMPRESSION_CODECS)}"
         )
-    os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-    # noinspection PyTypeChecker
-    tf.imwrite(temp_path, image_arr_corrected)
 
-    image_df_row["max_val"] = np.max(image_arr_corrected)
-    image_df_row["temp_path"] = temp_path
+    if not _imagecodecs_installed():
+        if compression != "deflate":
+            raise ImportError(
+                f"{compression} compression requires imagecodecs (pip install imagecodecs)."
+            )
+    else:
+        options["predictor"] = True
+    options.update(
+        compression=COMPRESSION_CODECS[compression], maxworkers=WRITE_MAXWORKERS
+    )
+    if compression_level is not None:
+        if compression == "lzw":
+            logger.warning("LZW does not support compression levels, ignoring.")
+        else:
+            options["compressionargs"] = {"level": compression_level}
+    return options
+
+
+def _downsample(image_arr):
+    """Halve the resolution of an image (or strip of an image with an even number of rows) by 2x2 averaging."""
+    rows, cols = image_arr.shape[0] // 2 * 2, image_arr.shape[1] // 2 * 2
+    blocks = image_arr[:rows, :cols].astype(np.float32)
+    downsampled = (
+        blocks[0::2, 0::2]
+        + blocks[1::2, 0::2]
+        + blocks[0::2, 1::2]
+        + blocks[1::2, 1::2]
+    ) / 4
+    if np.issubdtype(image_arr.dtype, np.integer):
+        downsampled = np.rint(downsampled)
+    return downsampled
+
+
+def _write_overviews(tif, overview_arr, overviews, dtype, write_options):
+    """Append ``overviews`` reduced-resolution pages, starting from the half resolution ``overview_arr``."""
+    for level in range(overviews):
+        if level:
+            overview_arr = _downsample(overview_arr)
+        if min(overview_arr.shape) < 1:
+            break
+        tif.write(
+            overview_arr.astype(dtype, copy=False), subfiletype=1, **write_options
+        )
+
+
+def _metadata_options(tiff_metadata):
+    """Return the tifffile keyword arguments that embed tiff_metadata in the first page."""
+    if tiff_metadata is None:
+        return {}
+    return {"extratags": tiff_metadata.extratags, "software": tiff_metadata.software}
+
+
+def write_tiff(path, image_arr, overviews=0, tiff_metadata=None, **write_options):
+    """
+    Write an image to disk, followed by ``overviews`` internal reduced-resolution pages of halving size.
+
+    Each overview is built from the previous level in the same pass. Overview pages are marked as
+    reduced-resolution images (NewSubfileType 1) and share the compression and tiling of the main image.
+
+    :param path: Output path
+    :param image_arr: Image to write
+    :param overviews: Number of overview levels to append
+    :param tiff_metadata: Optional metadata.TiffMetadata to embed in the image
+    :param write_options: Additional keyword arguments from ``tiff_write_options``
+    """
+    with tf.TiffWriter(path) as tif:
+        # noinspection PyTypeChecker
+        tif.write(image_arr, **write_options, **_metadata_options(tiff_metadata))
+        if overviews:
+            _write_overviews(
+                tif, _downsample(image_arr), overviews, image_arr.dtype, write_options
+            )
+    if tiff_metadata is not None:
+        metadata.write_exif_ifds(path, tiff_metadata)
+
+
+def _rechunk_strips(strips, rowsperstrip):
+    """Yield strips of exactly ``rowsperstrip`` rows (the last one may be shorter) from strips of any height."""
+    buffered, buffered_rows = [], 0
+    for strip in strips:
+        buffered.append(strip)
+        buffered_rows += strip.shape[0]
+        while buffered_rows >= rowsperstrip:
+            joined = np.concatenate(buffered) if len(buffered) > 1 else buffered[0]
+            yield joined[:rowsperstrip]
+            buffered, buffered_rows = [
+                joined[rowsperstrip:]
+            ], buffered_rows - rowsperstrip
+    if buffered_rows:
+        yield np.concatenate(buffered)
+
+
+def _iter_tiff_segments(path):
+    """Yield the decoded strips of a TIFF one at a time."""
+    with tf.TiffFile(path) as tif:
+        page = tif.pages[0]
+        for segment, _, _ in page.segments():
+            yield segment[0].reshape(-1, *page.shape[1:])
+
+
+def _iter_array_strips(image_arr, rowsperstrip):
+    """Yield strips of ``rowsperstrip`` rows from an image that is already in memory or memory-mapped."""
+    for row in range(0, image_arr.shape[0], rowsperstrip):
+        yield image_arr[row : row + rowsperstrip]
+
+
+def iter_image_strips(path):
+    """
+    Open an image for strip-wise processing.
+
+    Uncompressed TIFFs are memory-mapped and compressed stripped TIFFs are decoded one strip at a
+    time, with output strips aligned to the input's RowsPerStrip. Other layouts (JPEG, tiled TIFF) are
+    decoded in full and then sliced, so only the corrected float data is bounded.
+
+    :param path: Path to the input image
+    :return: ImageStrips over the raw pixel data of the image
+    """
+    if path.lower().endswith(".tif"):
+        with tf.TiffFile(path) as tif:
+            page = tif.pages[0]
+            shape, tiled, input_rows = page.shape, page.is_tiled, page.rowsperstrip
+            memmappable = page.is_memmappable
+        if not tiled:
+            input_rows = min(input_rows, shape[0])
+            if memmappable or input_rows >= STREAMING_ROWS_PER_STRIP:
+                rowsperstrip = STREAMING_ROWS_PER_STRIP
+            else:
+                rowsperstrip = input_rows * -(-STREAMING_ROWS_PER_STRIP // input_rows)
+            if memmappable:
+                strips = _iter_array_strips(tf.memmap(path, mode="r"), rowsperstrip)
+            else:
+                strips = _rechunk_strips(_iter_tiff_segments(path), rowsperstrip)
+            return ImageStrips(shape, rowsperstrip, strips)
+
+    from PIL import Image
+
+    image_arr = np.asarray(Image.open(path))
+    return ImageStrips(
+        image_arr.shape,
+        STREAMING_ROWS_PER_STRIP,
+        _iter_array_strips(image_arr, STREAMING_ROWS_PER_STRIP),
+    )
+
+
+def _iter_tiles(strips, tile):
+    """Split strips of ``tile[0]`` rows into tiles, in the row-major order tifffile expects."""
+    for strip in strips:
+        for col in range(0, strip.shape[1], tile[1]):
+            yield strip[:, col : col + tile[1]]
+
+
+def write_strips(
+    path, image, dtype=np.float32, overviews=0, tiff_metadata=None, **write_options
+):
+    """
+    Write an image to disk one strip at a time, so that only a single strip is ever held in memory.
+
+    Uncompressed images are written as strips. Compressed images without a requested tile size are
+    written as full-width tiles of ``rowsperstrip`` rows (rounded up to a multiple of 16), so that tifffile
+    can encode them as they arrive. If ``overviews`` are requested, the first overview level is built
+    from each strip as it passes through and held in memory (a quarter of the full image) until the
+    main image has been written.
+
+    :param path: Output path
+    :param image: ImageStrips to consume
+    :param dtype: Data type of the output image
+    :param overviews: Number of overview levels to append, see ``write_tiff``
+    :param tiff_metadata: Optional metadata.TiffMetadata to embed in the image
+    :param write_options: Additional keyword arguments from ``tiff_write_options``
+    :return: The maximum value of the written image
+    """
+    max_vals, overview_strips = [], []
+
+    def _check_strips(strips):
+        for strip in strips:
+            strip = np.ascontiguousarray(strip, dtype=dtype)
+            max_vals.append(np.max(strip))
+            if overviews:
+                overview_strips.append(_downsample(strip))
+            yield strip
+
+    tile = write_options.get("tile")
+    if tile is None and write_options.get("compression"):
+        tile = (-(-image.rowsperstrip // 16) * 16, -(-image.shape[1] // 16) * 16)
+    # overviews are built from strips, so their rows must stay even
+    rowsperstrip = tile[0] if tile else image.rowsperstrip + image.rowsperstrip % 2
+
+    with tf.TiffWriter(path) as tif:
+        if tile:
+            tif.write(
+                _iter_tiles(
+                    _check_strips(_rechunk_strips(image.strips, rowsperstrip)), tile
+                ),
+                shape=image.shape,
+                dtype=dtype,
+                **{**write_options, "tile": tile},
+                **_metadata_options(tiff_metadata),
+            )
+        else:
+            tif.write(
+                (
+                    strip.tobytes()
+                    for strip in _check_strips(
+                        _rechunk_strips(image.strips, rowsperstrip)
+                    )
+                ),
+                shape=image.shape,
+                dtype=dtype,
+                rowsperstrip=rowsperstrip,
+                **write_options,
+                **_metadata_options(tiff_metadata),
+            )
+        if overviews:
+            _write_overviews(
+                tif, np.concatenate(overview_strips), overviews, dtype, write_options
+            )
+    if tiff_metadata is not None:
+        metadata.write_exif_ifds(path, tiff_metadata)
+    return max(max_vals)
+
+
+def write_image(
+    image_arr_corrected,
+    image_df_row,
+    compression=None,
+    compression_level=None,
+    tile_size=None,
+    overviews=0,
+    tiff_metadata=None,
+):
+    """
+    Write corrected image to its staging path and record maximum value in case normalization is required.
+
+    The staging path sits next to the image's final output path, so it can be moved into place without
+    copying once its metadata has been written.
+    ``image_arr_corrected`` may either be an array or ImageStrips, in which case the image is written strip-wise.
+    See ``tiff_write_options`` and ``write_tiff`` for the available compression and layout settings.
+    If ``tiff_metadata`` is given, it is embedded in the image and exif_embedded is set on the row.
+    """
+    staging_path = get_staging_path(image_df_row.output_path)
+    os.makedirs(os.path.dirname(staging_path), exist_ok=True)
+    write_options = tiff_write_options(compression, compression_level, tile_size)
+    if isinstance(image_arr_corrected, ImageStrips):
+        image_df_row["max_val"] = write_strips(
+            staging_path,
+            image_arr_corrected,
+            overviews=overviews,
+            tiff_metadata=tiff_metadata,
+            **write_options,
+        )
+    else:
+        write_tiff(
+            staging_path, image_arr_corrected, overviews, tiff_metadata, **write_options
+        )
+        image_df_row["max_val"] = np.max(image_arr_corrected)
+    image_df_row["staging_path"] = staging_path
+    image_df_row["exif_embedded"] = tiff_metadata is not None
     return image_df_row
 
 
+def write_gdal_scale(path, scale):
+    """
+    Record in place that the values stored in a TIFF are to be multiplied by scale, in its GDAL_METADATA tag.
+
+    Rather than rewriting the file, a copy of its first IFD holding the tag, and the tag's value, are appended
+    to it, and its header is pointed to the copy. Any previous GDAL_METADATA tag is replaced. The previous IFD
+    is left unreferenced in the file, which so grows by an IFD each time it is rescaled.
+
+    The scale is advisory: GDAL reports it as the band's scale, and rasterio in its ``scales``, but both read
+    the stored values unchanged, so readers must multiply them by the scale themselves to get final values.
+    """
+    value = (
+        "<GDALMetadata>"
+        f'<Item name="SCALE" sample="0" role="scale">{float(scale)!r}</Item>'
+        "</GDALMetadata>\0"
+    ).encode("ascii")
+    with open(path, "r+b") as f:
+        header = f.read(16)
+        byteorder = "<" if header[:2] == b"II" else ">"
+        (version,) = struct.unpack(byteorder + "H", header[2:4])
+        if version == 43:
+            # BigTIFF: 8-byte counts and offsets, 20-byte entries
+            count_format, offset_format, entry_size, header_offset = "Q", "Q", 20, 8
+            (ifd_offset,) = struct.unpack(byteorder + "Q", header[8:16])
+        else:
+            count_format, offset_format, entry_size, header_offset = "H", "I", 12, 4
+            (ifd_offset,) = struct.unpack(byteorder + "I", header[4:8])
+        count_size = struct.calcsize(count_format)
+        offset_size = struct.calcsize(offset_format)
+
+        f.seek(ifd_offset)
+        (count,) = struct.unpack(byteorder + count_format, f.read(count_size))
+        entries = [f.read(entry_size) for _ in range(count)]
+        next_ifd = f.read(offset_size)
+        entries = [
+            entry
+            for entry in entries
+            if struct.unpack(byteorder + "H", entry[:2])[0] != GDAL_METADATA_TAG
+        ]
+
+        # IFDs and values must start on word boundaries
+        value_offset = f.seek(0, os.SEEK_END)
+        value_offset += value_offset % 2
+        new_ifd_offset = value_offset + len(value) + len(value) % 2
+        entries.append(
+            struct.pack(
+                byteorder + "HH" + offset_format + offset_format,
+                GDAL_METADATA_TAG,
+                2,
+                len(value),
+                value_offset,
+            )
+        )
+        entries.sort(key=lambda entry: struct.unpack(byteorder + "H", entry[:2])[0])
+
+        f.seek(value_offset)
+        f.write(value.ljust(new_ifd_offset - value_offset, b"\0"))
+        f.write(struct.pack(byteorder + count_format, len(entries)))
+        f.writelines(entries)
+        f.write(next_ifd)
+        f.flush()
+        # the new IFD is complete before the header points to it
+        f.seek(header_offset)
+        f.write(struct.pack(byteorder + offset_format, new_ifd_offset))
+
+
 def write_corrections_csv(image_df, file):
     """Write vital correction data from the dataframe to the given csv file."""
     columns = [
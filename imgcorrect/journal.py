@@ -0,0 +1,143 @@
+"""
+Record the progress of correction runs, so that interrupted runs can be resumed.
+
+The journal is an append-only file of JSON lines in the output folder. Its first line holds the correction
+plan and output settings of the run, and each following line records that an output image reached a state:
+
+- ``staged``: written to its staging path, before its scale is adjusted (only when it is)
+- ``written``: written to its staging path with its final values
+- ``metadata``: metadata copied to its staged image
+- ``moved``: moved from its staging path into place
+
+Lines are flushed as they are written, so that the journal survives a crash of the run.
+"""
+import json
+import logging
+import os
+
+JOURNAL_FILE = ".imgcorrect-journal{}.jsonl"
+PLAN_FILE = ".imgcorrect-plan{}.json.gz"
+
+# Number of images whose metadata is copied, or that are moved, between journal records
+JOURNAL_CHUNK = 500
+
+STAGED = "staged"
+WRITTEN = "written"
+METADATA = "metadata"
+MOVED = "moved"
+STATES = (STAGED, WRITTEN, METADATA, MOVED)
+
+logger = logging.getLogger(__name__)
+
+
+def shard_suffix(shard):
+    """Return the suffix of the files a shard of a sharded run keeps in the output folder, or "" if unsharded."""
+    return "" if shard is None else "-{}-of-{}".format(*shard)
+
+
+def relative_output(output_path, state_path):
+    """
+    Return the path of an output image relative to the folder of a file recording it, e.g. a journal.
+
+    Outputs are identified by it in such files, so that they are the same across runs.
+    """
+    return os.path.relpath(output_path, os.path.dirname(state_path))
+
+
+def journal_path(output_path, shard=None):
+    """Return the path of the journal of a run, or of a shard of a sharded run, writing to output_path."""
+    return os.path.join(output_path, JOURNAL_FILE.format(shard_suffix(shard)))
+
+
+def plan_path(output_path, shard=None):
+    """Return the path a run, or a shard of a sharded run, saves its correction plan to for resuming."""
+    return os.path.join(output_path, PLAN_FILE.format(shard_suffix(shard)))
+
+
+class Journal:
+    """Journal of an output folder, holding the latest state recorded for each output image."""
+
+    def __init__(self, path=None, header=None, records=None):
+        """
+        Append to the journal at path, or only keep records in memory if path is None.
+
+        Use ``create`` and ``resume`` rather than this directly.
+        """
+        self.path = path
+        self.header = header
+        self._records = records or {}
+        self._file = open(path, "a") if path else None
+
+    @classmethod
+    def create(cls, path, header):
+        """Start a new journal at path, replacing any previous one."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(json.dumps(header) + "\n")
+        return cls(path, header)
+
+    @classmethod
+    def resume(cls, path, settings):
+        """
+        Open the journal at path to resume its run.
+
+        :param settings: Output settings of the resumed run, which must be those of the journal's run
+        :raises ValueError: If there is no journal at path, or it was written with other settings
+        """
+        if not os.path.exists(path):
+            raise ValueError(f"There is no journal to resume at {path}.")
+        records = {}
+        with open(path) as f:
+            header = json.loads(f.readline())
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # the last line may be incomplete if the run crashed while writing it
+                    break
+                records[record.pop("output")] = record
+        if header["settings"] != settings:
+            raise ValueError(
+                f"The run journaled at {path} used settings {header['settings']}, not {settings}."
+            )
+        logger.info(
+            "Resuming run journaled at %s: %d images moved into place",
+            path,
+            sum(record["state"] == MOVED for record in records.values()),
+        )
+        return cls(path, header, records)
+
+    def progress(self, output_paths):
+        """Return the index in ``STATES`` of the state recorded for each output path, or -1 if there is none."""
+        return [
+            STATES.index(self._records[path]["state"]) if path in self._records else -1
+            for path in map(self._key, output_paths)
+        ]
+
+    def values(self, output_paths, name):
+        """Return the last value of name recorded for each output path."""
+        return [self._records[self._key(path)][name] for path in output_paths]
+
+    def record(self, output_paths, state, **values):
+        """Record that output images reached a state, along with values of each, given as lists."""
+        lines = []
+        for i, path in enumerate(output_paths):
+            key = self._key(path)
+            record = self._records.get(key, {})
+            record.update({name: value[i] for name, value in values.items()})
+            record["state"] = state
+            self._records[key] = record
+            lines.append(json.dumps({"output": key, **record}) + "\n")
+        if self._file is not None:
+            self._file.writelines(lines)
+            self._file.flush()
+
+    def close(self):
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+
+    def _key(self, output_path):
+        if self.path is None:
+            return output_path
+        return relative_output(output_path, self.path)
@@ -1,43 +1,794 @@
 """Copy and modify image metadata."""
 
+import asyncio
 import logging
+import os
+import struct
 import subprocess
+import tempfile
+import threading
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, NamedTuple, Tuple
+from xml.etree import ElementTree
 
 import imgparse
+import tifffile as tf
+from tqdm import tqdm
+
+EXIFTOOL_CONFIG = "cfg/exiftool.cfg"
+
+XMP_NAMESPACES = {
+    "x": "adobe:ns:meta/",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "Camera": "http://pix4d.com/camera/1.0/",
+}
+XMP_JPEG_HEADER = b"http://ns.adobe.com/xap/1.0/\x00"
+
+# TIFF tags describing image structure, which are written by tifffile itself and never copied
+TIFF_STRUCTURE_TAGS = {
+    254,
+    255,
+    256,
+    257,
+    258,
+    259,
+    262,
+    266,
+    273,
+    277,
+    278,
+    279,
+    282,
+    283,
+    284,
+    296,
+    305,
+    317,
+    320,
+    322,
+    323,
+    324,
+    325,
+    330,
+    338,
+    339,
+    340,
+    341,
+    513,
+    514,
+    530,
+    531,
+    532,
+    700,
+    34665,
+    34853,
+}
+EXIF_IFD_TAG = 34665
+GPS_IFD_TAG = 34853
+INTEROPERABILITY_IFD_TAG = 40965
+# Unused IFD0 codes that sort like the pointer tags, written in their place and renamed once the sub-IFDs exist
+# (newer tifffile versions refuse to write the pointer tags themselves)
+IFD_POINTER_PLACEHOLDERS = {EXIF_IFD_TAG: 34664, GPS_IFD_TAG: 34852}
+
+# struct formats of the TIFF field types, by type code
+TIFF_FIELD_FORMATS = {
+    1: "B",
+    2: "s",
+    3: "H",
+    4: "I",
+    5: "II",
+    6: "b",
+    7: "B",
+    8: "h",
+    9: "i",
+    10: "ii",
+    11: "f",
+    12: "d",
+}
+
+# Limits on the number of images and argfile size of a single batched exiftool invocation
+EXIF_BATCH_SIZE = 500
+EXIF_BATCH_MAX_BYTES = 1 << 20
+
+# Default number of concurrent exiftool sessions, and seconds allowed for a single exiftool command
+EXIFTOOL_WORKERS = os.cpu_count() or 1
+EXIFTOOL_TIMEOUT = 120
 
 logger = logging.getLogger(__name__)
 
+_local = threading.local()
 
-def copy_exif(image_df_row, exiftool_path):
-    """Copy image metadata with necessary changes from original image to corrected image."""
-    command = [
-        exiftool_path,
-        "-config",
-        "cfg/exiftool.cfg",
-        "-overwrite_original",
-        "-TagsFromFile",
-        image_df_row.image_path,
+# Band name, central wavelength and FWHM, keyed by sensor and XMP index
+_band_info = {}
+
+
+class TiffMetadata(NamedTuple):
+    """Metadata to embed in a corrected TIFF as it is written, in place of copying it with exiftool."""
+
+    # extra IFD0 tags, in tifffile extratags format, including the XMP packet
+    extratags: List[Tuple]
+    software: str
+    # EXIF and GPS sub-IFDs, as lists of (code, type, count, value) entries keyed by their pointer tag
+    ifds: Dict[int, List[Tuple]]
+
+
+_sessions = []
+_sessions_lock = threading.Lock()
+
+
+class ExifToolSession:
+    """
+    Long-lived exiftool process, driven through ``-stay_open True -@ -``.
+
+    Each command is written to the process's stdin followed by ``-executeNUM``, and its result is read
+    back up to the ``{readyNUM}`` marker exiftool prints on completion, so the Perl interpreter and config
+    are only loaded once. If the process dies, it is restarted and the command retried once.
+    """
+
+    def __init__(self, exiftool_path):
+        """Start an exiftool process at exiftool_path."""
+        self.exiftool_path = exiftool_path
+        self.owner_pid = os.getpid()
+        self._process = None
+        self._count = 0
+        self._start()
+
+    def __enter__(self):
+        """Use the session as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the session."""
+        self.close()
+
+    def _start(self):
+        self._process = subprocess.Popen(
+            [
+                self.exiftool_path,
+                "-config",
+                EXIFTOOL_CONFIG,
+                "-stay_open",
+                "True",
+                "-@",
+                "-",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def _read_until(self, stream, marker):
+        lines = []
+        for line in iter(stream.readline, b""):
+            line = line.decode("utf-8", errors="replace").rstrip("\r\n")
+            if line == marker:
+                return "\n".join(lines)
+            lines.append(line)
+        raise BrokenPipeError("Exiftool process exited unexpectedly.")
+
+    def _run(self, args):
+        self._count += 1
+        marker = f"{{ready{self._count}}}"
+        command = ["-charset", "filename=utf8", *args, "-echo4", marker]
+        command.append(f"-execute{self._count}")
+        self._process.stdin.write(
+            "".join(f"{arg}\n" for arg in command).encode("utf-8")
+        )
+        self._process.stdin.flush()
+        stdout = self._read_until(self._process.stdout, marker)
+        stderr = self._read_until(self._process.stderr, marker)
+        return stdout, stderr
+
+    def execute(self, args):
+        """
+        Run one exiftool command in the session.
+
+        :param args: Exiftool arguments, excluding the executable and config
+        :return: The stdout of the command
+        :raises ValueError: If exiftool reports an error for the command
+        """
+        if self._process is None or self._process.poll() is not None:
+            logger.warning("Exiftool process is not running, restarting.")
+            self._start()
+        try:
+            stdout, stderr = self._run(args)
+        except (BrokenPipeError, OSError):
+            logger.warning("Exiftool process died, restarting and retrying command.")
+            self.close()
+            self._start()
+            stdout, stderr = self._run(args)
+
+        if any(line.startswith("Error") for line in stderr.splitlines()):
+            raise ValueError(f"Exiftool command did not run successfully: {stderr}")
+        return stdout
+
+    def close(self):
+        """Ask the exiftool process to exit, and wait for it to do so."""
+        if self._process is None:
+            return
+        try:
+            if self._process.poll() is None:
+                self._process.stdin.write(b"-stay_open\nFalse\n")
+                self._process.stdin.flush()
+            self._process.communicate(timeout=10)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self._process.kill()
+            self._process.wait()
+        self._process = None
+
+
+def get_session(exiftool_path):
+    """
+    Return the exiftool session of the calling worker, starting one if necessary.
+
+    Sessions are kept per process and thread, so each parallel worker drives its own exiftool process.
+    """
+    session = getattr(_local, "session", None)
+    if (
+        session is None
+        or session.owner_pid != os.getpid()
+        or session.exiftool_path != exiftool_path
+    ):
+        session = ExifToolSession(exiftool_path)
+        _local.session = session
+        with _sessions_lock:
+            _sessions.append(session)
+    return session
+
+
+def close_sessions():
+    """Close all exiftool sessions started by this process."""
+    with _sessions_lock:
+        for session in _sessions:
+            if session.owner_pid == os.getpid():
+                session.close()
+        _sessions.clear()
+    _local.session = None
+
+
+def clear_band_info():
+    """Forget the band information read by get_band_info, so that the next run reads it from its own images."""
+    _band_info.clear()
+
+
+def get_band_info(image_df_row):
+    """
+    Return the band name, central wavelength and FWHM at the XMP index of an image.
+
+    These only depend on the sensor, so they are read once, from the first image of each sensor, and
+    reused for every other image until clear_band_info is called at the end of the run.
+    """
+    key = (image_df_row.sensor, int(image_df_row.XMP_index))
+    if key not in _band_info:
+        cent_arr, fwhm_arr = imgparse.get_wavelength_data(image_df_row.image_path)
+        band_arr = imgparse.get_bandnames(image_df_row.image_path)
+        for i, band in enumerate(zip(band_arr, cent_arr, fwhm_arr)):
+            _band_info[(image_df_row.sensor, i)] = band
+    return _band_info[key]
+
+
+@lru_cache(maxsize=None)
+def _copy_exif_template(band):
+    """Build the exiftool arguments of copy_exif_args that don't depend on the image paths."""
+    args = (
         "-all",
         "--xmp-Camera:ColorTransform",
         "--xmp-Camera:SunSensor",
         "-xmp-Camera:IsNormalized=1",
         "-xmp-Camera:BlackCurrent=",
         "-xmp-Camera:BlackCurrent=0",
-    ]
-    if image_df_row.reduce_xmp:
-        cent_arr, fwhm_arr = imgparse.get_wavelength_data(image_df_row.image_path)
-        band_arr = imgparse.get_bandnames(image_df_row.image_path)
-        i = int(image_df_row.XMP_index)
-        command += [
+    )
+    if band is not None:
+        band_name, cent, fwhm = band
+        args += (
             "-xmp-Camera:BandName=",
             "-xmp-Camera:CentralWavelength=",
             "-xmp-Camera:WavelengthFWHM=",
-            f"-xmp-Camera:BandName={band_arr[i]}",
-            f"-xmp-Camera:CentralWavelength={cent_arr[i]}",
-            f"-xmp-Camera:WavelengthFWHM={fwhm_arr[i]}",
-        ]
-    command.append(image_df_row.temp_path)
+            f"-xmp-Camera:BandName={band_name}",
+            f"-xmp-Camera:CentralWavelength={cent}",
+            f"-xmp-Camera:WavelengthFWHM={fwhm}",
+        )
+    return args
+
+
+def copy_exif_args(image_df_row):
+    """Build the exiftool arguments that copy metadata from the original image to the corrected image."""
+    band = get_band_info(image_df_row) if image_df_row.reduce_xmp else None
+    return [
+        "-overwrite_original",
+        "-TagsFromFile",
+        image_df_row.image_path,
+        *_copy_exif_template(band),
+        image_df_row.staging_path,
+    ]
+
+
+def copy_exif(image_df_row, exiftool_path, session=None):
+    """
+    Copy image metadata with necessary changes from original image to corrected image.
+
+    If an ExifToolSession is given, the command is run in it rather than in a new exiftool process.
+    """
+    args = copy_exif_args(image_df_row)
+    if session is not None:
+        session.execute(args)
+        return
 
-    results = subprocess.run(command, capture_output=True)
+    results = subprocess.run(
+        [exiftool_path, "-config", EXIFTOOL_CONFIG, *args], capture_output=True
+    )
     if results.returncode != 0:
         raise ValueError("Exiftool command did not run successfully.")
+
+
+def _run_exif_batch(batch, exiftool_path):
+    """
+    Run a batch of exiftool commands from a single argfile, in a single exiftool process.
+
+    Commands are separated with ``-execute`` and each echoes a marker to stderr once it has finished, so
+    errors can be attributed to the command (and so the image) they were reported for.
+
+    :param batch: List of (position, args) tuples
+    :param exiftool_path: Path to the exiftool executable
+    :return: Indices of the commands that failed or did not finish
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".args", encoding="utf-8", delete=False
+    ) as argfile:
+        for i, (_, args) in enumerate(batch):
+            if i:
+                argfile.write("-execute\n")
+            for arg in ["-charset", "filename=utf8", *args, "-echo4", f"{{done{i}}}"]:
+                argfile.write(f"{arg}\n")
+    try:
+        results = subprocess.run(
+            [exiftool_path, "-config", EXIFTOOL_CONFIG, "-@", argfile.name],
+            capture_output=True,
+        )
+    finally:
+        os.remove(argfile.name)
+
+    succeeded = set()
+    command_failed = False
+    for line in results.stderr.decode("utf-8", errors="replace").splitlines():
+        if line.startswith("{done") and line.endswith("}"):
+            if not command_failed:
+                succeeded.add(int(line[5:-1]))
+            command_failed = False
+        elif line.startswith("Error"):
+            logger.error(line)
+            command_failed = True
+    return [position for i, (position, _) in enumerate(batch) if i not in succeeded]
+
+
+def copy_exif_batch(image_df, exiftool_path):
+    """
+    Copy image metadata for many images at once, with one exiftool invocation per batch of images.
+
+    Batches hold at most ``EXIF_BATCH_SIZE`` images and ``EXIF_BATCH_MAX_BYTES`` of arguments. Failures
+    are reported per image, so only the failed images need to be re-run.
+
+    :param image_df: Image dataframe with image_path and staging_path columns
+    :param exiftool_path: Path to the exiftool executable
+    :return: List of positions in image_df of the images whose metadata could not be copied
+    """
+    failed = []
+    batch, batch_bytes = [], 0
+    with tqdm(total=len(image_df.index)) as progress:
+        for position, (_, row) in enumerate(image_df.iterrows()):
+            args = copy_exif_args(row)
+            args_bytes = sum(len(arg.encode("utf-8")) + 1 for arg in args)
+            if batch and (
+                len(batch) >= EXIF_BATCH_SIZE
+                or batch_bytes + args_bytes > EXIF_BATCH_MAX_BYTES
+            ):
+                failed += _run_exif_batch(batch, exiftool_path)
+                progress.update(len(batch))
+                batch, batch_bytes = [], 0
+            batch.append((position, args))
+            batch_bytes += args_bytes
+        if batch:
+            failed += _run_exif_batch(batch, exiftool_path)
+            progress.update(len(batch))
+    return failed
+
+
+class AsyncExifToolSession:
+    """
+    Long-lived exiftool process driven from asyncio, with the same protocol as ExifToolSession.
+
+    Commands that take longer than their timeout kill the process, which is restarted for the next command.
+    """
+
+    def __init__(self, exiftool_path):
+        """Prepare a session for the exiftool executable at exiftool_path, started on first use."""
+        self.exiftool_path = exiftool_path
+        self._process = None
+        self._count = 0
+
+    async def _start(self):
+        self._process = await asyncio.create_subprocess_exec(
+            self.exiftool_path,
+            "-config",
+            EXIFTOOL_CONFIG,
+            "-stay_open",
+            "True",
+            "-@",
+            "-",
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    @staticmethod
+    async def _read_until(stream, marker):
+        lines = []
+        while True:
+            line = await stream.readline()
+            if not line:
+                raise BrokenPipeError("Exiftool process exited unexpectedly.")
+            line = line.decode("utf-8", errors="replace").rstrip("\r\n")
+            if line == marker:
+                return "\n".join(lines)
+            lines.append(line)
+
+    async def _run(self, args):
+        self._count += 1
+        marker = f"{{ready{self._count}}}"
+        command = ["-charset", "filename=utf8", *args, "-echo4", marker]
+        command.append(f"-execute{self._count}")
+        self._process.stdin.write(
+            "".join(f"{arg}\n" for arg in command).encode("utf-8")
+        )
+        await self._process.stdin.drain()
+        stdout = await self._read_until(self._process.stdout, marker)
+        stderr = await self._read_until(self._process.stderr, marker)
+        return stdout, stderr
+
+    async def _run_with_restart(self, args):
+        if self._process is None or self._process.returncode is not None:
+            await self._start()
+        try:
+            return await self._run(args)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.warning("Exiftool process died, restarting and retrying command.")
+            await self.close()
+            await self._start()
+            return await self._run(args)
+
+    async def execute(self, args, timeout=None):
+        """
+        Run one exiftool command in the session.
+
+        :param args: Exiftool arguments, excluding the executable and config
+        :param timeout: Seconds to wait for the command before killing the process, or None to wait indefinitely
+        :return: The stdout of the command
+        :raises ValueError: If exiftool reports an error for the command
+        :raises TimeoutError: If the command does not finish within timeout
+        """
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                self._run_with_restart(args), timeout
+            )
+        except asyncio.TimeoutError:
+            await self._kill()
+            raise TimeoutError(f"Exiftool command timed out after {timeout}s")
+
+        if any(line.startswith("Error") for line in stderr.splitlines()):
+            raise ValueError(f"Exiftool command did not run successfully: {stderr}")
+        return stdout
+
+    async def _kill(self):
+        if self._process is None:
+            return
+        if self._process.returncode is None:
+            self._process.kill()
+        await self._process.wait()
+        self._process = None
+
+    async def close(self):
+        """Ask the exiftool process to exit, and wait for it to do so."""
+        if self._process is None:
+            return
+        try:
+            if self._process.returncode is None:
+                self._process.stdin.write(b"-stay_open\nFalse\n")
+                await self._process.stdin.drain()
+            await asyncio.wait_for(self._process.communicate(), 10)
+        except (OSError, asyncio.TimeoutError):
+            await self._kill()
+        self._process = None
+
+
+async def _execute_concurrent(commands, exiftool_path, workers, timeout, progress):
+    semaphore = asyncio.Semaphore(workers)
+    sessions, idle = [], []
+
+    async def execute(key, args):
+        async with semaphore:
+            if idle:
+                session = idle.pop()
+            else:
+                session = AsyncExifToolSession(exiftool_path)
+                sessions.append(session)
+            try:
+                await session.execute(args, timeout)
+                return key, None
+            except (ValueError, TimeoutError) as e:
+                return key, e
+            finally:
+                idle.append(session)
+
+    failed = []
+    try:
+        for result in asyncio.as_completed(
+            [execute(key, args) for key, args in commands]
+        ):
+            key, error = await result
+            if error is not None:
+                logger.error("Exiftool command for %s failed: %s", key, error)
+                failed.append(key)
+            progress.update()
+    finally:
+        await asyncio.gather(*(session.close() for session in sessions))
+    return failed
+
+
+def run_exiftool_concurrent(
+    commands, exiftool_path, workers=EXIFTOOL_WORKERS, timeout=EXIFTOOL_TIMEOUT
+):
+    """
+    Run many exiftool commands on up to ``workers`` concurrent exiftool sessions.
+
+    Each command is given ``timeout`` seconds to finish. Progress is reported as commands complete, in
+    whatever order that happens.
+
+    :param commands: List of (key, args) tuples, where key identifies the command in the returned failures
+    :param exiftool_path: Path to the exiftool executable
+    :param workers: Maximum number of exiftool processes running at once
+    :param timeout: Seconds allowed for each command, or None to wait indefinitely
+    :return: Keys of the commands that failed or timed out
+    """
+    if not commands:
+        return []
+    with tqdm(total=len(commands)) as progress:
+        return asyncio.run(
+            _execute_concurrent(
+                commands, exiftool_path, max(1, workers), timeout, progress
+            )
+        )
+
+
+def copy_exif_concurrent(
+    image_df, exiftool_path, workers=EXIFTOOL_WORKERS, timeout=EXIFTOOL_TIMEOUT
+):
+    """
+    Copy image metadata for many images at once, on up to ``workers`` concurrent exiftool sessions.
+
+    :param image_df: Image dataframe with image_path and staging_path columns
+    :param exiftool_path: Path to the exiftool executable
+    :param workers: Maximum number of exiftool processes running at once
+    :param timeout: Seconds allowed for each image, or None to wait indefinitely
+    :return: List of positions in image_df of the images whose metadata could not be copied
+    """
+    commands = [
+        (position, copy_exif_args(row))
+        for position, (_, row) in enumerate(image_df.iterrows())
+    ]
+    return sorted(run_exiftool_concurrent(commands, exiftool_path, workers, timeout))
+
+
+def read_xmp_packet(path):
+    """Read the raw XMP packet of a TIFF or JPEG image, or return None if it has none."""
+    if path.lower().endswith(".tif"):
+        with tf.TiffFile(path) as tif:
+            tag = tif.pages[0].tags.get(700)
+            if tag is None:
+                return None
+            return (
+                tag.value.encode("utf-8") if isinstance(tag.value, str) else tag.value
+            )
+
+    with open(path, "rb") as f:
+        if f.read(2) != b"\xff\xd8":
+            return None
+        while True:
+            marker, length = struct.unpack(">2sH", f.read(4))
+            # stop at start of scan, as no metadata follows it
+            if marker[0] != 0xFF or marker[1] == 0xDA:
+                return None
+            segment = f.read(length - 2)
+            if marker[1] == 0xE1 and segment.startswith(XMP_JPEG_HEADER):
+                return segment[len(XMP_JPEG_HEADER) :]
+
+
+def _set_xmp_tag(descriptions, tag, values):
+    """Replace an XMP tag in every rdf:Description, writing it to the first one. A list is written as an rdf:Seq."""
+    for description in descriptions:
+        description.attrib.pop(tag, None)
+        for element in description.findall(tag):
+            description.remove(element)
+    if values is None:
+        return
+    if not isinstance(values, list):
+        descriptions[0].set(tag, str(values))
+        return
+    sequence = ElementTree.SubElement(
+        ElementTree.SubElement(descriptions[0], tag), f"{{{XMP_NAMESPACES['rdf']}}}Seq"
+    )
+    for value in values:
+        ElementTree.SubElement(sequence, f"{{{XMP_NAMESPACES['rdf']}}}li").text = str(
+            value
+        )
+
+
+def edit_xmp_packet(packet, band=None):
+    """
+    Apply the XMP changes that ``copy_exif`` makes with exiftool to a raw XMP packet.
+
+    Camera:ColorTransform and Camera:SunSensor are removed, Camera:IsNormalized is set to 1 and
+    Camera:BlackCurrent to 0. If band is given as a (name, central wavelength, FWHM) tuple, the band
+    tags are reduced to that single band.
+
+    :param packet: The XMP packet of the original image
+    :param band: Optional band to reduce the XMP to
+    :return: The edited XMP packet
+    """
+    for _, (prefix, uri) in ElementTree.iterparse(
+        BytesIO(packet), events=("start-ns",)
+    ):
+        if prefix and not prefix.startswith("ns"):
+            ElementTree.register_namespace(prefix, uri)
+    root = ElementTree.fromstring(packet)
+    descriptions = root.findall(f".//{{{XMP_NAMESPACES['rdf']}}}Description")
+    if not descriptions:
+        raise ValueError("XMP packet has no rdf:Description")
+
+    def _camera(name):
+        return f"{{{XMP_NAMESPACES['Camera']}}}{name}"
+
+    _set_xmp_tag(descriptions, _camera("ColorTransform"), None)
+    _set_xmp_tag(descriptions, _camera("SunSensor"), None)
+    _set_xmp_tag(descriptions, _camera("IsNormalized"), 1)
+    _set_xmp_tag(descriptions, _camera("BlackCurrent"), [0])
+    if band is not None:
+        for name, value in zip(
+            ["BandName", "CentralWavelength", "WavelengthFWHM"], band
+        ):
+            _set_xmp_tag(descriptions, _camera(name), [value])
+
+    return (
+        '<?xpacket begin="\ufeff" id="W5M0MpCehiHzreSzNTczkc9d"?>'
+        + ElementTree.tostring(root, encoding="unicode")
+        + '<?xpacket end="w"?>'
+    ).encode("utf-8")
+
+
+def _exif_entry(ifd_tag):
+    """Convert a tag parsed by exifread to a (code, type, count, value) entry, or None if it is unsupported."""
+    field_type = ifd_tag.field_type
+    if field_type not in TIFF_FIELD_FORMATS:
+        return None
+    values = ifd_tag.values
+    if field_type == 2:
+        value = values.encode("utf-8") if isinstance(values, str) else bytes(values)
+        return ifd_tag.tag, field_type, len(value) + 1, value + b"\x00"
+    if field_type in (5, 10):
+        values = [
+            component
+            for ratio in values
+            for component in (
+                getattr(ratio, "numerator", getattr(ratio, "num", None)),
+                getattr(ratio, "denominator", getattr(ratio, "den", None)),
+            )
+        ]
+        return ifd_tag.tag, field_type, len(values) // 2, values
+    return ifd_tag.tag, field_type, len(values), list(values)
+
+
+def build_tiff_metadata(image_df_row):
+    """
+    Build the metadata of a corrected TIFF from the already-parsed metadata of its original image.
+
+    The EXIF IFD0, EXIF and GPS tags are taken from the image's EXIF column, and the XMP packet is read
+    from the original image and edited as ``copy_exif`` would. Maker notes and thumbnails are not copied.
+
+    :param image_df_row: Row of the image dataframe
+    :return: TiffMetadata, or None if the metadata can't be embedded natively and exiftool must be used
+    """
+    try:
+        packet = read_xmp_packet(image_df_row.image_path)
+        if packet is None:
+            logger.debug("No XMP in %s", image_df_row.image_path)
+            return None
+        band = get_band_info(image_df_row) if image_df_row.reduce_xmp else None
+        packet = edit_xmp_packet(packet, band)
+
+        extratags = [(700, 1, len(packet), packet, True)]
+        software = ""
+        ifds = {EXIF_IFD_TAG: [], GPS_IFD_TAG: []}
+        for key, ifd_tag in image_df_row.EXIF.items():
+            group = key.split(" ", 1)[0]
+            if group == "Image" and ifd_tag.tag == 305:
+                software = ifd_tag.values
+                continue
+            if group == "Image" and ifd_tag.tag in TIFF_STRUCTURE_TAGS:
+                continue
+            if group == "EXIF" and ifd_tag.tag == INTEROPERABILITY_IFD_TAG:
+                continue
+            if group not in ("Image", "EXIF", "GPS"):
+                continue
+            entry = _exif_entry(ifd_tag)
+            if entry is None:
+                logger.debug("Skipping unsupported tag %s", key)
+            elif group == "Image":
+                code, field_type, count, value = entry
+                if field_type in (1, 2, 7):
+                    value = bytes(value)
+                extratags.append((code, field_type, count, value, True))
+            else:
+                ifds[EXIF_IFD_TAG if group == "EXIF" else GPS_IFD_TAG].append(entry)
+
+        ifds = {code: entries for code, entries in ifds.items() if entries}
+        extratags += [(IFD_POINTER_PLACEHOLDERS[code], 4, 1, 0, True) for code in ifds]
+        return TiffMetadata(extratags, software, ifds)
+    except Exception as e:
+        logger.warning(
+            "Can't embed metadata of %s natively, falling back to exiftool: %s",
+            image_df_row.image_path,
+            e,
+        )
+        return None
+
+
+def _pack_ifd(entries, offset, byteorder):
+    """Serialize a classic TIFF IFD with its out-of-line values, to be written at offset."""
+    entries = sorted(entries)
+    data_offset = offset + 2 + 12 * len(entries) + 4
+    ifd = struct.pack(byteorder + "H", len(entries))
+    data = b""
+    for code, field_type, count, value in entries:
+        if field_type in (1, 2, 7):
+            value_bytes = bytes(value)
+        else:
+            value_bytes = struct.pack(
+                byteorder + TIFF_FIELD_FORMATS[field_type] * count, *value
+            )
+        if len(value_bytes) <= 4:
+            value_field = value_bytes.ljust(4, b"\x00")
+        else:
+            value_field = struct.pack(byteorder + "I", data_offset + len(data))
+            data += value_bytes + b"\x00" * (len(value_bytes) % 2)
+        ifd += struct.pack(byteorder + "HHI", code, field_type, count) + value_field
+    return ifd + struct.pack(byteorder + "I", 0) + data
+
+
+def write_exif_ifds(path, tiff_metadata):
+    """
+    Append the EXIF and GPS sub-IFDs of tiff_metadata to a TIFF written with its extratags.
+
+    tifffile can't write sub-IFDs itself, so they are appended to the end of the file and the placeholder
+    tags written with the first page are turned into pointers to them.
+    """
+    if not tiff_metadata.ifds:
+        return
+    with tf.TiffFile(path) as tif:
+        if tif.is_bigtiff:
+            raise ValueError("EXIF IFDs can't be appended to BigTIFF files")
+        byteorder = tif.byteorder
+        ifd_offset = tif.pages[0].offset
+    with open(path, "r+b") as f:
+        f.seek(ifd_offset)
+        (entry_count,) = struct.unpack(byteorder + "H", f.read(2))
+        entry_offsets = {}
+        for i in range(entry_count):
+            (code,) = struct.unpack(byteorder + "H", f.read(12)[:2])
+            entry_offsets[code] = ifd_offset + 2 + 12 * i
+        for code, entries in tiff_metadata.ifds.items():
+            offset = f.seek(0, os.SEEK_END)
+            if offset % 2:
+                offset += f.write(b"\x00")
+            f.write(_pack_ifd(entries, offset, byteorder))
+            f.seek(entry_offsets[IFD_POINTER_PLACEHOLDERS[code]])
+            f.write(struct.pack(byteorder + "HHII", code, 4, 1, offset))
@@ -0,0 +1,92 @@
+"""
+Define reflectance calibration panels, keyed by the ID of the ArUco marker attached to them.
+
+Usage; add entries of the following format to ``panels.json``, or to a user panels file:
+{
+    "aruco_id": ID of the ArUco marker (DICT_6X6_250) attached to the panel,
+    "name": panel name, for logging,
+    "spectrum": name of a spectrum in zenith_co.npz, or path (relative to the panels file) of a .npy
+                array holding the panel's reflectance at each wavelength in nanometers from 0 nm,
+    "panel_edge": [a, b], indices of the two marker corners, as returned by OpenCV, of the marker edge
+                  facing the panel, ordered so the panel lies to the left of the edge from a to b,
+    "marker_side_length_m": side length of the marker,
+    "marker_to_panel_center_m": distance from the middle of panel_edge to the center of the sample,
+    "sample_width_m": width of the sampled area of the panel,
+    "sample_height_m": height of the sampled area of the panel
+}
+"""
+import json
+import logging
+import os
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from imgcorrect import zenith_co
+
+PANELS_FILE = os.path.join(os.path.dirname(__file__), "panels.json")
+
+logger = logging.getLogger(__name__)
+
+_panels: Optional[Dict[int, "Panel"]] = None
+
+
+class Panel(NamedTuple):
+    """Reflectance calibration panel, with the geometry of its sampled area relative to its ArUco marker."""
+
+    aruco_id: int
+    name: str
+    spectrum: str
+    panel_edge: Tuple[int, int]
+    marker_side_length_m: float
+    marker_to_panel_center_m: float
+    sample_width_m: float
+    sample_height_m: float
+
+    def reflectance(self, start, stop):
+        """Return the average reflectance of the panel over the wavelengths ``[start, stop)``, in constant time."""
+        return zenith_co.window_average(self.spectrum, start, stop)
+
+
+def _read_panels_file(path):
+    with open(path) as f:
+        entries = json.load(f)
+    panels = {}
+    for entry in entries:
+        spectrum = entry["spectrum"]
+        if spectrum not in zenith_co.PANELS:
+            spectrum = os.path.join(os.path.dirname(os.path.abspath(path)), spectrum)
+        panel = Panel(
+            aruco_id=int(entry["aruco_id"]),
+            name=entry["name"],
+            spectrum=spectrum,
+            panel_edge=tuple(entry["panel_edge"]),
+            marker_side_length_m=float(entry["marker_side_length_m"]),
+            marker_to_panel_center_m=float(entry["marker_to_panel_center_m"]),
+            sample_width_m=float(entry["sample_width_m"]),
+            sample_height_m=float(entry["sample_height_m"]),
+        )
+        panels[panel.aruco_id] = panel
+    return panels
+
+
+def load_panels(panels_file=None):
+    """
+    Load the panel registry from package data, and make it the registry used by ``get_panel``.
+
+    :param panels_file: Optional path of a user panels file, whose panels are added to the packaged ones
+                        (replacing any with the same ArUco ID)
+    :return: Dictionary of panels keyed by ArUco ID
+    """
+    global _panels
+    panels = _read_panels_file(PANELS_FILE)
+    if panels_file:
+        logger.info("Loading panels from %s", panels_file)
+        panels.update(_read_panels_file(panels_file))
+    _panels = panels
+    return panels
+
+
+def get_panel(aruco_id):
+    """Return the panel with the given ArUco ID, or None if it is not in the registry."""
+    if _panels is None:
+        load_panels()
+    return _panels.get(int(aruco_id))
@@ -0,0 +1,163 @@
+"""
+Save and load correction plans.
+
+A correction plan holds the per-image corrections found by ``get_corrections``, along with the planning
+options and a fingerprint of every input image, so the corrections can be applied later (or again)
+by ``correct_images`` without re-planning. Plans are versioned JSON documents, gzipped if their file
+name ends with ``.gz``. Image paths are stored relative to the input and output folders.
+"""
+import gzip
+import json
+import logging
+import math
+import os
+
+import pandas as pd
+
+from imgcorrect import io
+from imgcorrect._version import __version__
+
+PLAN_FORMAT = "imgcorrect-plan"
+PLAN_VERSION = 2
+
+# Image dataframe columns stored for each band image, besides its paths and timestamp
+PLAN_COLUMNS = (
+    "band",
+    "band_math",
+    "XMP_index",
+    "reduce_xmp",
+    "sensor",
+    "ID",
+    "independent_ils",
+    "autoexposure",
+    "ILS_ratio",
+    "slope_coefficient",
+    "correction_coefficient",
+    "corrected_max_val",
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _open(plan_file, mode):
+    if plan_file.endswith(".gz"):
+        return gzip.open(plan_file, mode + "t", encoding="utf-8")
+    return open(plan_file, mode, encoding="utf-8")
+
+
+def fingerprint_inputs(input_path):
+    """
+    Fingerprint every input image under input_path, including calibration images.
+
+    :return: Dictionary of [size, modification time in ns] keyed by path relative to input_path
+    """
+    fingerprints = {}
+    for path in io.create_image_df(input_path, input_path).image_path:
+        stat = os.stat(path)
+        fingerprints[os.path.relpath(path, input_path)] = [
+            stat.st_size,
+            stat.st_mtime_ns,
+        ]
+    return fingerprints
+
+
+def write_plan(plan_file, image_df, input_path, output_path, options):
+    """
+    Write the corrections of an image dataframe, as returned by ``get_corrections``, to a plan file.
+
+    :param plan_file: Path of the plan file to write
+    :param image_df: Image dataframe, with the timestamp of each image in its timestamp column
+    :param input_path: Input folder the image dataframe was built from
+    :param output_path: Output folder the image dataframe was built for, or None for the input folder
+    :param options: Planning options (calibration_id, no_ils_correct, no_reflectance_correct)
+    """
+    output_path = output_path or input_path
+    columns = [column for column in PLAN_COLUMNS if column in image_df]
+    rows = []
+    for timestamp, image_path, image_output_path, record in zip(
+        image_df.timestamp,
+        image_df.image_path,
+        image_df.output_path,
+        image_df[columns].to_dict("records"),
+    ):
+        row = {
+            "timestamp": timestamp.isoformat(),
+            "image_path": os.path.relpath(image_path, input_path),
+            "output_path": os.path.relpath(image_output_path, output_path),
+        }
+        # band math is only set for the band rows of multi-band sensors, and is NaN otherwise
+        row.update(
+            {
+                key: value
+                for key, value in record.items()
+                if not (isinstance(value, float) and math.isnan(value))
+            }
+        )
+        rows.append(row)
+
+    plan = {
+        "format": PLAN_FORMAT,
+        "version": PLAN_VERSION,
+        "imgcorrect_version": __version__,
+        "options": options,
+        "inputs": fingerprint_inputs(input_path),
+        "rows": rows,
+    }
+    with _open(plan_file, "w") as f:
+        json.dump(plan, f)
+    logger.info("Wrote correction plan for %d images to %s", len(rows), plan_file)
+
+
+def read_plan(plan_file, input_path, output_path, options):
+    """
+    Read the image dataframe of a plan file, for images in input_path to be written to output_path.
+
+    :param plan_file: Path of the plan file to read
+    :param input_path: Input folder the plan is applied to
+    :param output_path: Output folder, or None for the input folder
+    :param options: Options the plan must have been made with (calibration_id, no_ils_correct,
+                    no_reflectance_correct)
+    :return: Image dataframe, indexed by timestamp
+    :raises ValueError: If the plan is not a supported plan, was made with other options, or if the input
+                        images have changed since it was made
+    """
+    with _open(plan_file, "r") as f:
+        plan = json.load(f)
+    if plan.get("format") != PLAN_FORMAT or plan.get("version") != PLAN_VERSION:
+        raise ValueError(
+            f"{plan_file} is not a version {PLAN_VERSION} correction plan, and must be re-created."
+        )
+    if plan["options"] != options:
+        raise ValueError(
+            f"{plan_file} was made with options {plan['options']}, not {options}."
+        )
+
+    output_path = output_path or input_path
+    # output images written to the input folder are not inputs
+    outputs = {
+        os.path.relpath(os.path.join(output_path, row["output_path"]), input_path)
+        for row in plan["rows"]
+    }
+    fingerprints = fingerprint_inputs(input_path)
+    changed = sorted(
+        path
+        for path in set(fingerprints) | set(plan["inputs"])
+        if path not in outputs and fingerprints.get(path) != plan["inputs"].get(path)
+    )
+    if changed:
+        raise ValueError(
+            f"{len(changed)} input images were added, removed or modified since {plan_file} was made "
+            f"(e.g. {changed[0]}). The correction plan must be re-created."
+        )
+
+    image_df = pd.DataFrame(plan["rows"])
+    image_df["image_path"] = [
+        os.path.join(input_path, path) for path in image_df.image_path
+    ]
+    image_df["image_root"] = image_df.image_path.apply(os.path.dirname)
+    image_df["output_path"] = [
+        os.path.join(output_path, path) for path in image_df.output_path
+    ]
+    image_df["timestamp"] = pd.to_datetime(image_df.timestamp)
+    logger.info("Read correction plan for %d images from %s", len(image_df), plan_file)
+    return image_df.set_index("timestamp", drop=False)
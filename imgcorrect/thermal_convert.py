@@ -1,72 +1,219 @@
 """Processing for 6x thermal imagery."""
 import logging
 import os
-import shutil
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-import imageio
 import numpy as np
+import pandas as pd
+
+from imgcorrect import incremental, io, metadata
 
 ## 12-bit support requires pip install imagecodecs
 
 logger = logging.getLogger(__name__)
 
+# Integer output formats: dtype, centi-Kelvin value subtracted from raw pixel values, and offset in Celsius.
+# Stored values v are converted to Celsius as v * THERMAL_SCALE + offset. Readers must apply this themselves:
+# GDAL reports the scale and offset recorded in the GDAL_METADATA tag, but reads the stored values unchanged.
+THERMAL_FORMATS = {
+    "uint16": (np.uint16, 0, -273.15),
+    "int16": (np.int16, 27315, 0.0),
+}
+THERMAL_SCALE = 0.01
 
-def convert_thermal(input_path, output_path, exiftool_path):
-    """Convert 6x thermal."""
-    if not os.path.exists(output_path):
-        os.mkdir(output_path)
+LWIR_BAND_ARGS = [
+    "-xmp-Camera:BandName=",
+    "-xmp-Camera:CentralWavelength=",
+    "-xmp-Camera:WavelengthFWHM=",
+    "-xmp-Camera:BandName=LWIR",
+    "-xmp-Camera:CentralWavelength=11000",
+    "-xmp-Camera:WavelengthFWHM=6000",
+]
 
-    images = [
-        f
-        for f in os.listdir(input_path)
-        if os.path.isfile(os.path.join(input_path, f)) and f.endswith(".tif")
+
+def _scale_args(thermal_format):
+    """Build the exiftool arguments recording the scale and offset of integer output in XMP."""
+    if thermal_format == "float32":
+        return []
+    return [
+        f"-xmp-Sentera:ThermalScale={THERMAL_SCALE}",
+        f"-xmp-Sentera:ThermalOffset={THERMAL_FORMATS[thermal_format][2]}",
     ]
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # copy image to output location
-        for image in images:
-            if "CAL" not in image:
-                # Copy image to temporary directory
-                output_image_path = os.path.join(temp_dir, image)
-                shutil.copy(os.path.join(input_path, image), output_image_path)
 
-                # open image in output folder and get image pixel data
-                image_io_reader = imageio.get_reader(output_image_path, format="tif")
-                image_io = image_io_reader.get_data(0)
+def _scale_extratags(thermal_format):
+    """Build the GDAL_METADATA tag recording the scale and offset of integer output."""
+    if thermal_format == "float32":
+        return []
+    gdal_metadata = (
+        "<GDALMetadata>"
+        f'<Item name="SCALE" sample="0" role="scale">{THERMAL_SCALE}</Item>'
+        f'<Item name="OFFSET" sample="0" role="offset">{THERMAL_FORMATS[thermal_format][2]}</Item>'
+        "</GDALMetadata>"
+    )
+    return [(io.GDAL_METADATA_TAG, "s", 0, gdal_metadata, True)]
+
+
+def _keyed_image_df(input_path, output_path, images, settings, manifest):
+    """Build the image dataframe of LWIR images, keyed for incremental runs by their input and settings."""
+    image_df = pd.DataFrame(
+        {
+            "image_path": [os.path.join(input_path, image) for image in images],
+            "output_path": [os.path.join(output_path, image) for image in images],
+        }
+    )
+    image_df["output_key"] = incremental.output_keys(
+        image_df, settings, (), manifest.fingerprint
+    )
+    return image_df.assign(input_key=image_df.output_key)
+
+
+def _convert_image(input_image_path, staging_path, thermal_format, write_options):
+    """
+    Convert the centi-Kelvin pixel data of a thermal image, written to staging_path.
+
+    float32 output is in Celsius. Integer output keeps centi-degree precision, scaled as described in
+    ``THERMAL_FORMATS``.
+    """
+    image_arr = io.read_image(input_image_path)
+    if thermal_format == "float32":
+        image_arr = (image_arr / 100 - 273.15).astype(np.float32)
+    else:
+        dtype, subtracted, _ = THERMAL_FORMATS[thermal_format]
+        if subtracted:
+            limits = np.iinfo(dtype)
+            image_arr = np.clip(
+                image_arr.astype(np.int32) - subtracted, limits.min, limits.max
+            )
+        image_arr = image_arr.astype(dtype)
+    io.write_tiff(
+        staging_path,
+        image_arr,
+        extratags=_scale_extratags(thermal_format),
+        **write_options,
+    )
 
-                # multiply pixel data by scale coefficient and write to file
-                image_io_corrected = (image_io / 100 - 273.15).astype(np.float32)
 
-                image_io_writer = imageio.get_writer(output_image_path, format="tif")
-                image_io_writer.append_data(image_io_corrected)
+def convert_thermal(
+    input_path,
+    output_path,
+    exiftool_path,
+    exif_workers=1,
+    exif_timeout=metadata.EXIFTOOL_TIMEOUT,
+    workers=None,
+    thermal_format="float32",
+    compression=None,
+    compression_level=None,
+    shard=None,
+    incremental_run=False,
+):
+    """
+    Convert 6x thermal.
 
-                image_io_reader.close()
-                image_io_writer.close()
+    Images are converted straight from the input folder to staging paths next to their outputs on
+    ``workers`` threads, their metadata is copied with ``exif_workers`` concurrent exiftool processes, and
+    they are then moved into place.
 
-                # copy exif and xmp data from input image to corrected image
-                logger.info("copying exif data")
-                os.system(
-                    f'{exiftool_path} -overwrite_original -TagsFromFile "{os.path.join(input_path, image)}" "-xmp" "-exif" "-all"  "{output_image_path}"'
+    With the default ``thermal_format``, output is float32 Celsius. "uint16" keeps the raw centi-Kelvin
+    values and "int16" stores centi-Celsius, at half the size. Their scale and offset to Celsius are
+    recorded in the GDAL_METADATA TIFF tag and in the Sentera:ThermalScale and Sentera:ThermalOffset XMP
+    tags, and readers must apply them to the stored values to get Celsius, as GDAL and rasterio only report
+    them. Output is compressed with ``compression`` at ``compression_level`` if given.
+
+    If ``shard`` is given as ``(i, N)``, only the images of the i-th of N shards (see ``io.shard_of``) are
+    converted, and staged images are removed if conversion fails, as other shards may be converting
+    images to the same folder.
+
+    If ``incremental_run`` is set, images whose input image and output options are unchanged since the
+    previous incremental run are skipped, see ``incremental``.
+    """
+    if thermal_format != "float32" and thermal_format not in THERMAL_FORMATS:
+        raise ValueError(
+            f"Unsupported thermal format {thermal_format}. Options are: float32, {', '.join(THERMAL_FORMATS)}"
+        )
+    write_options = io.tiff_write_options(compression, compression_level)
+    os.makedirs(output_path, exist_ok=True)
+
+    images = [
+        f
+        for f in os.listdir(input_path)
+        if os.path.isfile(os.path.join(input_path, f))
+        and f.endswith(".tif")
+        and "CAL" not in f
+        and (shard is None or io.shard_of(f, shard[1]) == shard[0])
+    ]
+    if incremental_run:
+        manifest = incremental.Manifest(incremental.manifest_path(output_path, shard))
+        image_df = _keyed_image_df(
+            input_path,
+            output_path,
+            images,
+            {
+                "thermal_format": thermal_format,
+                "compression": compression,
+                "compression_level": compression_level,
+            },
+            manifest,
+        )
+        unchanged = np.array(manifest.unchanged(image_df), dtype=bool)
+        logger.info(
+            "Incremental run: skipping %d unchanged of %d LWIR images",
+            unchanged.sum(),
+            len(images),
+        )
+        image_df = image_df.loc[~unchanged]
+        images = [image for image, skip in zip(images, unchanged) if not skip]
+    input_image_paths = [os.path.join(input_path, image) for image in images]
+    output_image_paths = [os.path.join(output_path, image) for image in images]
+    staging_paths = [io.get_staging_path(path) for path in output_image_paths]
+
+    try:
+        with ThreadPoolExecutor(workers) as executor:
+            # list() to re-raise any conversion error
+            list(
+                executor.map(
+                    lambda paths: _convert_image(*paths, thermal_format, write_options),
+                    zip(input_image_paths, staging_paths),
                 )
+            )
 
-                logger.info("editing band info")
-                os.system(
-                    f'{exiftool_path} -config "cfg/exiftool.cfg" -overwrite_original "-xmp-Camera:BandName=LWIR" "-xmp-Camera:CentralWavelength=11000" "-xmp-Camera:WavelengthFWHM=6000" "{output_image_path}" '
+        # copy exif and xmp data from input image to corrected image, and edit band info, in one command
+        logger.info("copying exif data")
+        failed = metadata.run_exiftool_concurrent(
+            [
+                (
+                    image,
+                    [
+                        "-overwrite_original",
+                        "-TagsFromFile",
+                        input_image_path,
+                        "-xmp",
+                        "-exif",
+                        "-all",
+                        *LWIR_BAND_ARGS,
+                        *_scale_args(thermal_format),
+                        staging_path,
+                    ],
+                )
+                for image, input_image_path, staging_path in zip(
+                    images, input_image_paths, staging_paths
                 )
+            ],
+            exiftool_path,
+            exif_workers,
+            exif_timeout,
+        )
+        if failed:
+            raise ValueError(
+                f"Exiftool could not copy metadata for {len(failed)} LWIR images: {', '.join(sorted(failed))}"
+            )
+    except BaseException:
+        if shard is not None:
+            io.remove_staged_outputs(output_image_paths)
+        raise
 
-                # Copy output from temp directory to output directory
-                shutil.copy(output_image_path, os.path.join(output_path, image))
-
-                output_files = [
-                    f
-                    for f in os.listdir(output_path)
-                    if os.path.isfile(os.path.join(output_path, f))
-                ]
-                for file in output_files:
-                    if file.endswith("original"):
-                        try:
-                            os.remove(os.path.join(output_path, file))
-                            logger.info("additional file deleted")
-                        except Exception as e:
-                            logger.error(f"File delete failed with error {e}")
+    for staging_path, output_image_path in zip(staging_paths, output_image_paths):
+        os.replace(staging_path, output_image_path)
+    if incremental_run:
+        manifest.record(image_df)
+        manifest.save()
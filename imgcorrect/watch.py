@@ -0,0 +1,120 @@
+"""
+Correct images as they arrive in an input folder, e.g. while a flight is copied a card at a time.
+
+The input folder is polled for new or modified images. Once it has been unchanged for a settling period,
+the images that arrived are corrected by a provisional incremental run of ``correct_images`` (see
+``incremental``): the corrections are computed from all images so far, but earlier outputs are not
+rewritten when the ILS normalization or output scale they depend on changes. Images are not corrected
+until calibration images with a visible panel have arrived for every band. The fingerprints of input images
+and the panels detected in them are kept in the manifest of the incremental runs, so that each run only
+fingerprints, and searches for panels in, the images that arrived since the previous one. Once watching
+stops, a final incremental run rewrites the outputs whose corrections changed since they were written, or,
+if ``rescale`` is passed, rescales them in place.
+"""
+import logging
+import os
+import time
+from glob import glob
+
+from imgcorrect import corrections, io
+
+logger = logging.getLogger(__name__)
+
+# Seconds between scans of the input folder
+POLL_SECONDS = 10
+# Seconds the input folder must be unchanged before the images that arrived are corrected
+SETTLE_SECONDS = 30
+
+
+def snapshot(input_path):
+    """Return the size and modification time in ns of every image under input_path, keyed by path."""
+    files = {}
+    # the images create_image_df finds, which can't list an empty folder
+    paths = glob(input_path + "/**/*.[Tt][Ii][Ff]", recursive=True) + glob(
+        input_path + "/**/*.[Jj][Pp][Gg]", recursive=True
+    )
+    for path in paths:
+        if io.STAGING_SUFFIX in os.path.basename(path):
+            continue
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            # removed since the folder was listed
+            continue
+        files[path] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def _correct_arrived(input_path, output_path, correct_kwargs):
+    """Provisionally correct the images that arrived, unless the calibration of some band is not known yet."""
+    try:
+        corrections.correct_images(
+            input_path,
+            output_path=output_path,
+            incremental_run=True,
+            provisional=True,
+            **correct_kwargs,
+        )
+    except corrections.CalibrationNotFoundError as e:
+        logger.warning("Not correcting images until calibration is complete: %s", e)
+
+
+def watch_images(
+    input_path,
+    output_path,
+    poll_seconds=POLL_SECONDS,
+    settle_seconds=SETTLE_SECONDS,
+    idle_timeout=None,
+    **correct_kwargs,
+):
+    """
+    Correct the images in input_path as they arrive, until interrupted or idle for idle_timeout seconds.
+
+    Images are corrected once the input folder has been unchanged for settle_seconds, by provisional
+    incremental runs writing to output_path, and finally by a final incremental run. The other arguments
+    are passed to ``corrections.correct_images``.
+
+    :raises ValueError: If output_path is not given, or is inside input_path, where outputs would be
+                        taken for arriving images
+    """
+    if not output_path or not os.path.relpath(
+        os.path.abspath(output_path), os.path.abspath(input_path)
+    ).startswith(os.pardir):
+        raise ValueError(
+            "Watched runs must write to an output folder outside the input folder."
+        )
+
+    # watched runs are always incremental, and provisional until they are finalized
+    correct_kwargs.pop("incremental_run", None)
+    correct_kwargs.pop("provisional", None)
+
+    logger.info(
+        "Watching %s for images, checking every %s seconds", input_path, poll_seconds
+    )
+    corrected = {}
+    previous = snapshot(input_path)
+    changed_at = time.monotonic()
+    try:
+        while idle_timeout is None or time.monotonic() - changed_at < idle_timeout:
+            time.sleep(poll_seconds)
+            current = snapshot(input_path)
+            if current != previous:
+                previous = current
+                changed_at = time.monotonic()
+            elif (
+                current != corrected and time.monotonic() - changed_at >= settle_seconds
+            ):
+                logger.info(
+                    "Correcting %d new or modified images",
+                    sum(corrected.get(path) != stat for path, stat in current.items()),
+                )
+                _correct_arrived(input_path, output_path, correct_kwargs)
+                corrected = current
+        logger.info("No images arrived for %s seconds", idle_timeout)
+    except KeyboardInterrupt:
+        logger.info("Stopped watching %s", input_path)
+
+    logger.info("Finalizing the corrections of all images")
+    corrections.correct_images(
+        input_path, output_path=output_path, incremental_run=True, **correct_kwargs
+    )
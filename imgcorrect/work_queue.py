@@ -0,0 +1,332 @@
+"""
+Queue correction tasks shared by workers on several machines.
+
+Tasks are claimed with a lease, which their worker renews while it processes them, and must be
+acknowledged by that worker before the lease expires. Tasks whose lease expired, e.g. because their
+worker died, can be claimed again by any worker. Each queue holds the tasks of any number of runs, kept
+apart by name, so that a run only skips the tasks of the runs of the same name. Tasks are kept by a broker:
+
+- ``SQLiteBroker``, an SQLite database file, by default. To share it between machines, it must be on
+  shared storage whose file locking works (e.g. NFSv4 with locking enabled).
+- ``RedisBroker``, for ``redis://`` URLs. This requires ``pip install redis``.
+"""
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Seconds a claimed task may take before it is given to another worker
+LEASE_SECONDS = 600
+# Number of times a task is attempted before it is marked failed
+MAX_ATTEMPTS = 3
+
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+
+
+def worker_name():
+    """Return a name identifying this process among the workers of all machines."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SQLiteBroker:
+    """Task queue kept in an SQLite database file, in the rows of its tasks table named ``name``."""
+
+    def __init__(self, path, name):
+        """Open the queue in the database file at path, creating it if needed."""
+        self.path = path
+        self.name = name
+        # autocommit mode, with explicit transactions where several statements must be atomic
+        self._connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "name TEXT NOT NULL, task TEXT NOT NULL, state TEXT NOT NULL, worker TEXT, lease_until REAL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (name, task))"
+        )
+
+    def enqueue(self, tasks):
+        """Add tasks to the queue, ignoring those already in it, so that every worker may enqueue all tasks."""
+        with self._transaction():
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO tasks (name, task, state) VALUES (?, ?, ?)",
+                [(self.name, task, PENDING) for task in tasks],
+            )
+
+    def claim(self, worker, count=1, lease=LEASE_SECONDS):
+        """
+        Claim up to count pending tasks, or tasks whose lease expired, for lease seconds.
+
+        Tasks whose lease expired after MAX_ATTEMPTS attempts are marked failed instead.
+        """
+        now = time.time()
+        with self._transaction():
+            self._connection.execute(
+                "UPDATE tasks SET state = ? "
+                "WHERE name = ? AND state = ? AND lease_until < ? AND attempts >= ?",
+                (FAILED, self.name, CLAIMED, now, MAX_ATTEMPTS),
+            )
+            tasks = [
+                task
+                for (task,) in self._connection.execute(
+                    "SELECT task FROM tasks "
+                    "WHERE name = ? AND (state = ? OR (state = ? AND lease_until < ?)) LIMIT ?",
+                    (self.name, PENDING, CLAIMED, now, count),
+                )
+            ]
+            self._connection.executemany(
+                "UPDATE tasks SET state = ?, worker = ?, lease_until = ?, attempts = attempts + 1 "
+                "WHERE name = ? AND task = ?",
+                [(CLAIMED, worker, now + lease, self.name, task) for task in tasks],
+            )
+        return tasks
+
+    def renew(self, worker, tasks, lease=LEASE_SECONDS):
+        """Extend the lease of tasks still claimed by worker to lease seconds from now, returning those."""
+        lease_until = time.time() + lease
+        with self._transaction():
+            renewed = [
+                task
+                for task in tasks
+                if self._connection.execute(
+                    "UPDATE tasks SET lease_until = ? "
+                    "WHERE name = ? AND task = ? AND worker = ? AND state = ?",
+                    (lease_until, self.name, task, worker, CLAIMED),
+                ).rowcount
+            ]
+        return renewed
+
+    def ack(self, worker, tasks):
+        """Mark tasks done, unless their lease expired and they were claimed by another worker since."""
+        with self._transaction():
+            self._connection.executemany(
+                "UPDATE tasks SET state = ? WHERE name = ? AND task = ? AND worker = ? AND state = ?",
+                [(DONE, self.name, task, worker, CLAIMED) for task in tasks],
+            )
+
+    def release(self, worker, tasks):
+        """Return tasks that could not be completed to the queue, or mark them failed after MAX_ATTEMPTS."""
+        with self._transaction():
+            self._connection.executemany(
+                "UPDATE tasks SET state = CASE WHEN attempts < ? THEN ? ELSE ? END, lease_until = NULL "
+                "WHERE name = ? AND task = ? AND worker = ? AND state = ?",
+                [
+                    (MAX_ATTEMPTS, PENDING, FAILED, self.name, task, worker, CLAIMED)
+                    for task in tasks
+                ],
+            )
+
+    def counts(self):
+        """Return the number of tasks in each state."""
+        counts = dict.fromkeys((PENDING, CLAIMED, DONE, FAILED), 0)
+        counts.update(
+            self._connection.execute(
+                "SELECT state, COUNT(*) FROM tasks WHERE name = ? GROUP BY state",
+                (self.name,),
+            )
+        )
+        return counts
+
+    def close(self):
+        """Close the connection to the database."""
+        self._connection.close()
+
+    @contextmanager
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent claims can't select the same tasks
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+
+# Redis scripts, each run atomically, over the keys (pending, leases, states, workers, attempts)
+_REDIS_ENQUEUE = """
+for _, task in ipairs(ARGV) do
+    if redis.call('HSETNX', KEYS[3], task, 'pending') == 1 then
+        redis.call('RPUSH', KEYS[1], task)
+    end
+end
+"""
+# ARGV: now, lease_until, count, worker, max_attempts
+_REDIS_CLAIM = """
+for _, task in ipairs(redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])) do
+    redis.call('ZREM', KEYS[2], task)
+    if tonumber(redis.call('HGET', KEYS[5], task)) < tonumber(ARGV[5]) then
+        redis.call('HSET', KEYS[3], task, 'pending')
+        redis.call('RPUSH', KEYS[1], task)
+    else
+        redis.call('HSET', KEYS[3], task, 'failed')
+    end
+end
+local tasks = {}
+for _ = 1, tonumber(ARGV[3]) do
+    local task = redis.call('LPOP', KEYS[1])
+    if not task then
+        break
+    end
+    redis.call('ZADD', KEYS[2], ARGV[2], task)
+    redis.call('HSET', KEYS[3], task, 'claimed')
+    redis.call('HSET', KEYS[4], task, ARGV[4])
+    redis.call('HINCRBY', KEYS[5], task, 1)
+    tasks[#tasks + 1] = task
+end
+return tasks
+"""
+# ARGV: worker, lease_until, tasks...
+_REDIS_RENEW = """
+local renewed = {}
+for i = 3, #ARGV do
+    local task = ARGV[i]
+    if redis.call('HGET', KEYS[4], task) == ARGV[1] and redis.call('ZSCORE', KEYS[2], task) then
+        redis.call('ZADD', KEYS[2], ARGV[2], task)
+        renewed[#renewed + 1] = task
+    end
+end
+return renewed
+"""
+# ARGV: worker, max_attempts (or 0 to mark done), tasks...
+_REDIS_FINISH = """
+for i = 3, #ARGV do
+    local task = ARGV[i]
+    if redis.call('HGET', KEYS[4], task) == ARGV[1] and redis.call('ZREM', KEYS[2], task) == 1 then
+        if ARGV[2] == '0' then
+            redis.call('HSET', KEYS[3], task, 'done')
+        elseif tonumber(redis.call('HGET', KEYS[5], task)) < tonumber(ARGV[2]) then
+            redis.call('HSET', KEYS[3], task, 'pending')
+            redis.call('RPUSH', KEYS[1], task)
+        else
+            redis.call('HSET', KEYS[3], task, 'failed')
+        end
+    end
+end
+"""
+
+
+class RedisBroker:
+    """Task queue kept in Redis, under keys prefixed with ``imgcorrect:name``, and changed by atomic scripts only."""
+
+    def __init__(self, url, name):
+        """Connect to the Redis server at url."""
+        try:
+            import redis
+        except ImportError:
+            raise ImportError(
+                "A redis:// queue requires the redis package (pip install redis)."
+            ) from None
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
+        self.name = name
+        self._keys = [
+            f"imgcorrect:{name}:{key}"
+            for key in ("pending", "leases", "states", "workers", "attempts")
+        ]
+        self._enqueue = self._redis.register_script(_REDIS_ENQUEUE)
+        self._claim = self._redis.register_script(_REDIS_CLAIM)
+        self._renew = self._redis.register_script(_REDIS_RENEW)
+        self._finish = self._redis.register_script(_REDIS_FINISH)
+
+    def enqueue(self, tasks):
+        """Add tasks to the queue, ignoring those already in it, so that every worker may enqueue all tasks."""
+        if tasks:
+            self._enqueue(self._keys, list(tasks))
+
+    def claim(self, worker, count=1, lease=LEASE_SECONDS):
+        """
+        Claim up to count pending tasks, or tasks whose lease expired, for lease seconds.
+
+        Tasks whose lease expired after MAX_ATTEMPTS attempts are marked failed instead.
+        """
+        now = time.time()
+        return self._claim(self._keys, [now, now + lease, count, worker, MAX_ATTEMPTS])
+
+    def renew(self, worker, tasks, lease=LEASE_SECONDS):
+        """Extend the lease of tasks still claimed by worker to lease seconds from now, returning those."""
+        return self._renew(self._keys, [worker, time.time() + lease, *tasks])
+
+    def ack(self, worker, tasks):
+        """Mark tasks done, unless their lease expired and they were claimed by another worker since."""
+        if tasks:
+            self._finish(self._keys, [worker, 0, *tasks])
+
+    def release(self, worker, tasks):
+        """Return tasks that could not be completed to the queue, or mark them failed after MAX_ATTEMPTS."""
+        if tasks:
+            self._finish(self._keys, [worker, MAX_ATTEMPTS, *tasks])
+
+    def counts(self):
+        """Return the number of tasks in each state."""
+        counts = dict.fromkeys((PENDING, CLAIMED, DONE, FAILED), 0)
+        for state in self._redis.hvals(self._keys[2]):
+            counts[state] += 1
+        return counts
+
+    def close(self):
+        """Close the connection to Redis."""
+        self._redis.close()
+
+
+def open_broker(queue, name):
+    """Open the tasks named name of a queue given as a redis:// URL or the path of an SQLite database file."""
+    if queue.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBroker(queue, name)
+    return SQLiteBroker(queue, name)
+
+
+def iter_claims(broker, worker, count=1, lease=LEASE_SECONDS, poll_seconds=5):
+    """
+    Claim and yield batches of up to count tasks until none are left, then stop.
+
+    Once no task can be claimed, this waits for the tasks claimed by other workers to be acknowledged, or for
+    their leases to expire, so they can be claimed again. The caller must ``ack`` or ``release`` each batch.
+    """
+    while True:
+        tasks = broker.claim(worker, count, lease)
+        if tasks:
+            yield tasks
+            continue
+        counts = broker.counts()
+        if not counts[PENDING] and not counts[CLAIMED]:
+            return
+        logger.debug("Waiting for %d tasks claimed by other workers", counts[CLAIMED])
+        time.sleep(poll_seconds)
+
+
+@contextmanager
+def renewing_leases(queue, name, worker, tasks, lease=LEASE_SECONDS):
+    """
+    Renew the lease of tasks every third of a lease while the body runs, so they aren't given to another worker.
+
+    Leases are renewed from a thread with its own connection to the queue.
+    """
+    stop = threading.Event()
+
+    def _renew():
+        broker = open_broker(queue, name)
+        try:
+            while not stop.wait(lease / 3):
+                lost = set(tasks) - set(broker.renew(worker, tasks, lease))
+                if lost:
+                    logger.warning(
+                        "Lost the lease of %d tasks to other workers: %s",
+                        len(lost),
+                        ", ".join(sorted(lost)),
+                    )
+        finally:
+            broker.close()
+
+    thread = threading.Thread(target=_renew, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
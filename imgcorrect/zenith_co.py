@@ -1,4466 +1,65 @@
-"""Define reflectance panel coefficients."""
+"""
+Define reflectance panel coefficients.
 
-sg3144_batch1_coefficients = [0.0] * 250
-sg3144_batch1_coefficients.extend(
-    [
-        0.1239909,  # 250
-        0.12358087,  # 251
-        0.12321741,  # 252
-        0.12293496,  # 253
-        0.12261412,  # 254
-        0.12226715,  # 255
-        0.12194253,  # 256
-        0.12180449,  # 257
-        0.12150535,  # 258
-        0.12121996,  # 259
-        0.12092023,  # 260
-        0.12057016,  # 261
-        0.12021663,  # 262
-        0.11995006,  # 263
-        0.11963142,  # 264
-        0.1193328,  # 265
-        0.11898869,  # 266
-        0.11888725,  # 267
-        0.11860223,  # 268
-        0.11839515,  # 269
-        0.11840207,  # 270
-        0.11819089,  # 271
-        0.11793796,  # 272
-        0.1177848,  # 273
-        0.11769142,  # 274
-        0.1174619,  # 275
-        0.11715421,  # 276
-        0.11704459,  # 277
-        0.11700184,  # 278
-        0.11673068,  # 279
-        0.1165147,  # 280
-        0.11636195,  # 281
-        0.11634871,  # 282
-        0.11620164,  # 283
-        0.11597965,  # 284
-        0.11591061,  # 285
-        0.11581108,  # 286
-        0.11563603,  # 287
-        0.11546509,  # 288
-        0.11548492,  # 289
-        0.11533826,  # 290
-        0.11510526,  # 291
-        0.1150361,  # 292
-        0.11490321,  # 293
-        0.1147232,  # 294
-        0.11451418,  # 295
-        0.11446057,  # 296
-        0.1144242,  # 297
-        0.11413061,  # 298
-        0.11406418,  # 299
-        0.1140407,  # 300
-        0.11382466,  # 301
-        0.11355819,  # 302
-        0.11344193,  # 303
-        0.11337586,  # 304
-        0.11338079,  # 305
-        0.11338031,  # 306
-        0.11329353,  # 307
-        0.11317017,  # 308
-        0.1129759,  # 309
-        0.11287199,  # 310
-        0.11282127,  # 311
-        0.11287088,  # 312
-        0.11300126,  # 313
-        0.112742,  # 314
-        0.11241086,  # 315
-        0.1124142,  # 316
-        0.1123366,  # 317
-        0.11239309,  # 318
-        0.1122572,  # 319
-        0.11213031,  # 320
-        0.11200899,  # 321
-        0.11187748,  # 322
-        0.11185963,  # 323
-        0.11160217,  # 324
-        0.11147721,  # 325
-        0.11142858,  # 326
-        0.11147535,  # 327
-        0.11151706,  # 328
-        0.11111625,  # 329
-        0.11106956,  # 330
-        0.11136869,  # 331
-        0.11099854,  # 332
-        0.11085307,  # 333
-        0.11068871,  # 334
-        0.11068,  # 335
-        0.11078814,  # 336
-        0.11078536,  # 337
-        0.11063413,  # 338
-        0.11052408,  # 339
-        0.11040066,  # 340
-        0.11055614,  # 341
-        0.11045689,  # 342
-        0.11027907,  # 343
-        0.11017464,  # 344
-        0.11011244,  # 345
-        0.10996207,  # 346
-        0.10993207,  # 347
-        0.10988131,  # 348
-        0.10991364,  # 349
-        0.10975573,  # 350
-        0.10969101,  # 351
-        0.1096155,  # 352
-        0.1096667,  # 353
-        0.10949449,  # 354
-        0.10951309,  # 355
-        0.10951843,  # 356
-        0.10953243,  # 357
-        0.1093555,  # 358
-        0.10921117,  # 359
-        0.10909725,  # 360
-        0.10920567,  # 361
-        0.10909512,  # 362
-        0.10905639,  # 363
-        0.10900022,  # 364
-        0.10894626,  # 365
-        0.10890168,  # 366
-        0.10881771,  # 367
-        0.10869426,  # 368
-        0.10889071,  # 369
-        0.10881041,  # 370
-        0.10868174,  # 371
-        0.1086789,  # 372
-        0.10850928,  # 373
-        0.10844242,  # 374
-        0.10845854,  # 375
-        0.10812432,  # 376
-        0.10818161,  # 377
-        0.10792571,  # 378
-        0.10800973,  # 379
-        0.10809919,  # 380
-        0.10806392,  # 381
-        0.10801548,  # 382
-        0.10799105,  # 383
-        0.10798258,  # 384
-        0.10778815,  # 385
-        0.10781891,  # 386
-        0.10780575,  # 387
-        0.10763816,  # 388
-        0.10766333,  # 389
-        0.10769613,  # 390
-        0.10762064,  # 391
-        0.1073396,  # 392
-        0.10738054,  # 393
-        0.10747272,  # 394
-        0.10736452,  # 395
-        0.10726494,  # 396
-        0.10727111,  # 397
-        0.10710456,  # 398
-        0.10700638,  # 399
-        0.10708955,  # 400
-        0.10690982,  # 401
-        0.10704854,  # 402
-        0.10708894,  # 403
-        0.10689879,  # 404
-        0.10706447,  # 405
-        0.10691144,  # 406
-        0.10695707,  # 407
-        0.1069673,  # 408
-        0.10702064,  # 409
-        0.10713246,  # 410
-        0.10708611,  # 411
-        0.10696406,  # 412
-        0.10694407,  # 413
-        0.1070074,  # 414
-        0.1067767,  # 415
-        0.10679741,  # 416
-        0.10685395,  # 417
-        0.10677077,  # 418
-        0.10670889,  # 419
-        0.10677916,  # 420
-        0.1068034,  # 421
-        0.10677202,  # 422
-        0.106662,  # 423
-        0.10662473,  # 424
-        0.10664711,  # 425
-        0.10669028,  # 426
-        0.10661112,  # 427
-        0.10660086,  # 428
-        0.10642994,  # 429
-        0.10650127,  # 430
-        0.10648019,  # 431
-        0.10645352,  # 432
-        0.10646404,  # 433
-        0.10650353,  # 434
-        0.10642819,  # 435
-        0.10635206,  # 436
-        0.10640725,  # 437
-        0.10652299,  # 438
-        0.10636766,  # 439
-        0.10644769,  # 440
-        0.10646813,  # 441
-        0.10631544,  # 442
-        0.10635529,  # 443
-        0.10640197,  # 444
-        0.10617708,  # 445
-        0.10632906,  # 446
-        0.1063087,  # 447
-        0.10615966,  # 448
-        0.10612712,  # 449
-        0.10616161,  # 450
-        0.10612159,  # 451
-        0.10616057,  # 452
-        0.10609222,  # 453
-        0.10603803,  # 454
-        0.10606392,  # 455
-        0.10606343,  # 456
-        0.10606006,  # 457
-        0.10604521,  # 458
-        0.10607218,  # 459
-        0.10603928,  # 460
-        0.10603652,  # 461
-        0.10594023,  # 462
-        0.10598534,  # 463
-        0.10598588,  # 464
-        0.10598543,  # 465
-        0.10589327,  # 466
-        0.10595754,  # 467
-        0.10588376,  # 468
-        0.10597217,  # 469
-        0.10587545,  # 470
-        0.10585867,  # 471
-        0.10588222,  # 472
-        0.105908,  # 473
-        0.10587201,  # 474
-        0.10584842,  # 475
-        0.10585211,  # 476
-        0.10589338,  # 477
-        0.10587926,  # 478
-        0.10588151,  # 479
-        0.10596972,  # 480
-        0.10591487,  # 481
-        0.10576631,  # 482
-        0.10580568,  # 483
-        0.10587003,  # 484
-        0.10580947,  # 485
-        0.10586022,  # 486
-        0.1058964,  # 487
-        0.10572798,  # 488
-        0.10582769,  # 489
-        0.10574988,  # 490
-        0.10576219,  # 491
-        0.1058301,  # 492
-        0.10580974,  # 493
-        0.10573208,  # 494
-        0.10575565,  # 495
-        0.10583947,  # 496
-        0.10579166,  # 497
-        0.10578558,  # 498
-        0.10577487,  # 499
-        0.10569085,  # 500
-        0.10568895,  # 501
-        0.10567987,  # 502
-        0.10570951,  # 503
-        0.10569724,  # 504
-        0.10575488,  # 505
-        0.10576129,  # 506
-        0.10570109,  # 507
-        0.10568933,  # 508
-        0.1056668,  # 509
-        0.10556896,  # 510
-        0.10560005,  # 511
-        0.10564346,  # 512
-        0.105582,  # 513
-        0.10565191,  # 514
-        0.10564949,  # 515
-        0.10559386,  # 516
-        0.10562612,  # 517
-        0.10560422,  # 518
-        0.10557245,  # 519
-        0.10556938,  # 520
-        0.10555762,  # 521
-        0.10553841,  # 522
-        0.10556825,  # 523
-        0.10552646,  # 524
-        0.10547753,  # 525
-        0.10551896,  # 526
-        0.10551485,  # 527
-        0.10551976,  # 528
-        0.10551698,  # 529
-        0.1054948,  # 530
-        0.10551675,  # 531
-        0.10554164,  # 532
-        0.10552091,  # 533
-        0.10547882,  # 534
-        0.10554293,  # 535
-        0.10554139,  # 536
-        0.10549678,  # 537
-        0.10544603,  # 538
-        0.10540629,  # 539
-        0.10553417,  # 540
-        0.10562972,  # 541
-        0.10561299,  # 542
-        0.10549973,  # 543
-        0.10542766,  # 544
-        0.10549483,  # 545
-        0.1055052,  # 546
-        0.105469,  # 547
-        0.10547019,  # 548
-        0.10547413,  # 549
-        0.10558903,  # 550
-        0.10549875,  # 551
-        0.10541174,  # 552
-        0.10548203,  # 553
-        0.10545591,  # 554
-        0.10538205,  # 555
-        0.10532623,  # 556
-        0.10533313,  # 557
-        0.10542151,  # 558
-        0.10540908,  # 559
-        0.10541804,  # 560
-        0.10548933,  # 561
-        0.1055154,  # 562
-        0.10545438,  # 563
-        0.10543275,  # 564
-        0.10540326,  # 565
-        0.10533092,  # 566
-        0.10541943,  # 567
-        0.10543285,  # 568
-        0.10541944,  # 569
-        0.10540519,  # 570
-        0.10541062,  # 571
-        0.10540728,  # 572
-        0.1053277,  # 573
-        0.10538961,  # 574
-        0.10531346,  # 575
-        0.10525304,  # 576
-        0.10539401,  # 577
-        0.10541854,  # 578
-        0.10539452,  # 579
-        0.1053723,  # 580
-        0.10532874,  # 581
-        0.10546722,  # 582
-        0.10541939,  # 583
-        0.10541988,  # 584
-        0.10537212,  # 585
-        0.10535243,  # 586
-        0.1054333,  # 587
-        0.10537056,  # 588
-        0.10524792,  # 589
-        0.10538279,  # 590
-        0.10536381,  # 591
-        0.10528381,  # 592
-        0.10532494,  # 593
-        0.1053802,  # 594
-        0.10526514,  # 595
-        0.10537604,  # 596
-        0.10533482,  # 597
-        0.10526594,  # 598
-        0.10528786,  # 599
-        0.10537689,  # 600
-        0.10543921,  # 601
-        0.10548255,  # 602
-        0.10540829,  # 603
-        0.10538296,  # 604
-        0.1053906,  # 605
-        0.10543391,  # 606
-        0.10527567,  # 607
-        0.10538489,  # 608
-        0.10534297,  # 609
-        0.10530897,  # 610
-        0.10538537,  # 611
-        0.10536501,  # 612
-        0.10544149,  # 613
-        0.10544369,  # 614
-        0.10540705,  # 615
-        0.10526042,  # 616
-        0.10538993,  # 617
-        0.10536746,  # 618
-        0.10535187,  # 619
-        0.10533234,  # 620
-        0.10531099,  # 621
-        0.10535135,  # 622
-        0.10536128,  # 623
-        0.10523302,  # 624
-        0.10516318,  # 625
-        0.10530032,  # 626
-        0.10526374,  # 627
-        0.1052909,  # 628
-        0.10531706,  # 629
-        0.10516696,  # 630
-        0.10531484,  # 631
-        0.10537319,  # 632
-        0.10528989,  # 633
-        0.10540175,  # 634
-        0.10527022,  # 635
-        0.10526584,  # 636
-        0.10529811,  # 637
-        0.10533927,  # 638
-        0.10522816,  # 639
-        0.10534346,  # 640
-        0.10550569,  # 641
-        0.10519805,  # 642
-        0.10529393,  # 643
-        0.10538474,  # 644
-        0.10537354,  # 645
-        0.10528782,  # 646
-        0.10536471,  # 647
-        0.10511839,  # 648
-        0.10532979,  # 649
-        0.10533071,  # 650
-        0.10532445,  # 651
-        0.10534888,  # 652
-        0.10526588,  # 653
-        0.10533057,  # 654
-        0.10514773,  # 655
-        0.10527775,  # 656
-        0.10532771,  # 657
-        0.10529283,  # 658
-        0.10521464,  # 659
-        0.10503852,  # 660
-        0.10510855,  # 661
-        0.10522799,  # 662
-        0.10525857,  # 663
-        0.1052362,  # 664
-        0.10530135,  # 665
-        0.10526923,  # 666
-        0.10506281,  # 667
-        0.1053215,  # 668
-        0.10510698,  # 669
-        0.10526725,  # 670
-        0.10522069,  # 671
-        0.10503595,  # 672
-        0.10540738,  # 673
-        0.10525636,  # 674
-        0.10515334,  # 675
-        0.10517622,  # 676
-        0.10523082,  # 677
-        0.10497597,  # 678
-        0.10521412,  # 679
-        0.10510306,  # 680
-        0.1051747,  # 681
-        0.10518981,  # 682
-        0.10524006,  # 683
-        0.10530703,  # 684
-        0.10519932,  # 685
-        0.10516369,  # 686
-        0.10514977,  # 687
-        0.10521846,  # 688
-        0.10544146,  # 689
-        0.10523998,  # 690
-        0.10521334,  # 691
-        0.10529183,  # 692
-        0.10523422,  # 693
-        0.10521266,  # 694
-        0.10532217,  # 695
-        0.10521754,  # 696
-        0.10520216,  # 697
-        0.10510388,  # 698
-        0.10519488,  # 699
-        0.10521393,  # 700
-        0.10530692,  # 701
-        0.10517978,  # 702
-        0.1052681,  # 703
-        0.10521646,  # 704
-        0.10520902,  # 705
-        0.10522729,  # 706
-        0.1051175,  # 707
-        0.10513533,  # 708
-        0.10504204,  # 709
-        0.10489181,  # 710
-        0.10514478,  # 711
-        0.10526555,  # 712
-        0.10526563,  # 713
-        0.10528331,  # 714
-        0.10508387,  # 715
-        0.1050554,  # 716
-        0.10517985,  # 717
-        0.10521812,  # 718
-        0.10521355,  # 719
-        0.10526933,  # 720
-        0.10517147,  # 721
-        0.10532848,  # 722
-        0.10521743,  # 723
-        0.10517586,  # 724
-        0.1052214,  # 725
-        0.1052054,  # 726
-        0.10521014,  # 727
-        0.10521649,  # 728
-        0.10511551,  # 729
-        0.10511254,  # 730
-        0.10525303,  # 731
-        0.10526355,  # 732
-        0.10524807,  # 733
-        0.10503885,  # 734
-        0.10508434,  # 735
-        0.10517031,  # 736
-        0.10525715,  # 737
-        0.10521264,  # 738
-        0.10514891,  # 739
-        0.10501129,  # 740
-        0.10499399,  # 741
-        0.10507377,  # 742
-        0.10506959,  # 743
-        0.10509944,  # 744
-        0.10502726,  # 745
-        0.10506668,  # 746
-        0.10523536,  # 747
-        0.10520755,  # 748
-        0.10534846,  # 749
-        0.10525413,  # 750
-        0.10507771,  # 751
-        0.10515762,  # 752
-        0.10509674,  # 753
-        0.10515042,  # 754
-        0.1051173,  # 755
-        0.10521644,  # 756
-        0.10513331,  # 757
-        0.10521869,  # 758
-        0.10538711,  # 759
-        0.10519897,  # 760
-        0.10509638,  # 761
-        0.10506599,  # 762
-        0.10519258,  # 763
-        0.10529732,  # 764
-        0.10509728,  # 765
-        0.10523391,  # 766
-        0.10534803,  # 767
-        0.10526904,  # 768
-        0.10533552,  # 769
-        0.10537026,  # 770
-        0.10535859,  # 771
-        0.10528165,  # 772
-        0.1052581,  # 773
-        0.1052727,  # 774
-        0.10536561,  # 775
-        0.10536989,  # 776
-        0.10531675,  # 777
-        0.10517119,  # 778
-        0.10509667,  # 779
-        0.10525392,  # 780
-        0.10527315,  # 781
-        0.10527952,  # 782
-        0.1053693,  # 783
-        0.10528091,  # 784
-        0.10527501,  # 785
-        0.1051938,  # 786
-        0.10506068,  # 787
-        0.10511435,  # 788
-        0.10527947,  # 789
-        0.10521575,  # 790
-        0.10522636,  # 791
-        0.10512288,  # 792
-        0.1050566,  # 793
-        0.10521681,  # 794
-        0.10529749,  # 795
-        0.10526959,  # 796
-        0.10535552,  # 797
-        0.10516201,  # 798
-        0.1051285,  # 799
-        0.10490456,  # 800
-        0.10507924,  # 801
-        0.10491343,  # 802
-        0.10504829,  # 803
-        0.10520103,  # 804
-        0.10525188,  # 805
-        0.10509264,  # 806
-        0.10510134,  # 807
-        0.10523764,  # 808
-        0.10530138,  # 809
-        0.10547816,  # 810
-        0.10511374,  # 811
-        0.10484742,  # 812
-        0.10498649,  # 813
-        0.10524116,  # 814
-        0.10532547,  # 815
-        0.10528236,  # 816
-        0.10510333,  # 817
-        0.10512166,  # 818
-        0.1049415,  # 819
-        0.10515738,  # 820
-        0.10518479,  # 821
-        0.10544175,  # 822
-        0.10548046,  # 823
-        0.10549531,  # 824
-        0.10542871,  # 825
-        0.10536701,  # 826
-        0.10546418,  # 827
-        0.10537584,  # 828
-        0.10555087,  # 829
-        0.10544813,  # 830
-        0.105476,  # 831
-        0.10554846,  # 832
-        0.10535298,  # 833
-        0.10568193,  # 834
-        0.10557658,  # 835
-        0.10541456,  # 836
-        0.10540967,  # 837
-        0.10553056,  # 838
-        0.10572164,  # 839
-        0.10561862,  # 840
-        0.10553151,  # 841
-        0.10563463,  # 842
-        0.10525134,  # 843
-        0.10544854,  # 844
-        0.10524517,  # 845
-        0.10534498,  # 846
-        0.10548806,  # 847
-        0.10525223,  # 848
-        0.10533054,  # 849
-        0.10522052,  # 850
-        0.10544889,  # 851
-        0.10526664,  # 852
-        0.10526267,  # 853
-        0.10522544,  # 854
-        0.1054131,  # 855
-        0.10527046,  # 856
-        0.10536316,  # 857
-        0.10510517,  # 858
-        0.10534223,  # 859
-        0.10519429,  # 860
-        0.10525271,  # 861
-        0.1051721,  # 862
-        0.10510066,  # 863
-        0.10517764,  # 864
-        0.10524671,  # 865
-        0.10527988,  # 866
-        0.10509128,  # 867
-        0.10517227,  # 868
-        0.10529559,  # 869
-        0.10512083,  # 870
-        0.10501173,  # 871
-        0.10518395,  # 872
-        0.10519205,  # 873
-        0.10514116,  # 874
-        0.10495787,  # 875
-        0.10529242,  # 876
-        0.10513335,  # 877
-        0.1053279,  # 878
-        0.10512382,  # 879
-        0.10496639,  # 880
-        0.10517873,  # 881
-        0.10535108,  # 882
-        0.10519806,  # 883
-        0.1050703,  # 884
-        0.10518509,  # 885
-        0.10484843,  # 886
-        0.10516037,  # 887
-        0.10500616,  # 888
-        0.10507251,  # 889
-        0.10524081,  # 890
-        0.10517746,  # 891
-        0.10519511,  # 892
-        0.10526073,  # 893
-        0.10510352,  # 894
-        0.10522971,  # 895
-        0.10517934,  # 896
-        0.10531303,  # 897
-        0.10501927,  # 898
-        0.10505766,  # 899
-        0.10504684,  # 900
-        0.10516327,  # 901
-        0.1052045,  # 902
-        0.10538815,  # 903
-        0.10511629,  # 904
-        0.10508043,  # 905
-        0.10498847,  # 906
-        0.10517112,  # 907
-        0.10514393,  # 908
-        0.10518885,  # 909
-        0.10511969,  # 910
-        0.10517248,  # 911
-        0.10517643,  # 912
-        0.10513902,  # 913
-        0.10533465,  # 914
-        0.10522046,  # 915
-        0.10522755,  # 916
-        0.10502226,  # 917
-        0.10501349,  # 918
-        0.10524744,  # 919
-        0.10503126,  # 920
-        0.10512716,  # 921
-        0.10533612,  # 922
-        0.1050979,  # 923
-        0.10524679,  # 924
-        0.10524225,  # 925
-        0.10523629,  # 926
-        0.10512093,  # 927
-        0.10523359,  # 928
-        0.10513037,  # 929
-        0.10517631,  # 930
-        0.10509287,  # 931
-        0.1051531,  # 932
-        0.10510858,  # 933
-        0.10509345,  # 934
-        0.1052557,  # 935
-        0.10521642,  # 936
-        0.10519792,  # 937
-        0.10487498,  # 938
-        0.10508981,  # 939
-        0.10507568,  # 940
-        0.10508027,  # 941
-        0.10512228,  # 942
-        0.1051909,  # 943
-        0.10529216,  # 944
-        0.10542296,  # 945
-        0.10520487,  # 946
-        0.10505059,  # 947
-        0.10515456,  # 948
-        0.10524008,  # 949
-        0.1051885,  # 950
-        0.10513019,  # 951
-        0.10515143,  # 952
-        0.10528205,  # 953
-        0.10515467,  # 954
-        0.10505863,  # 955
-        0.10509556,  # 956
-        0.10522196,  # 957
-        0.10529856,  # 958
-        0.1050291,  # 959
-        0.1051137,  # 960
-        0.10515075,  # 961
-        0.10529846,  # 962
-        0.10496747,  # 963
-        0.10491885,  # 964
-        0.10515481,  # 965
-        0.1052406,  # 966
-        0.10514048,  # 967
-        0.10521495,  # 968
-        0.10524017,  # 969
-        0.10530318,  # 970
-        0.10535029,  # 971
-        0.10518119,  # 972
-        0.1052674,  # 973
-        0.10531205,  # 974
-        0.10536628,  # 975
-        0.10531737,  # 976
-        0.10519237,  # 977
-        0.10525413,  # 978
-        0.10535909,  # 979
-        0.10531508,  # 980
-        0.10522124,  # 981
-        0.10523975,  # 982
-        0.10534761,  # 983
-        0.10524754,  # 984
-        0.10530802,  # 985
-        0.10551091,  # 986
-        0.10541504,  # 987
-        0.10536521,  # 988
-        0.10534458,  # 989
-        0.10534318,  # 990
-        0.10542465,  # 991
-        0.10536084,  # 992
-        0.10518077,  # 993
-        0.10523053,  # 994
-        0.10528494,  # 995
-        0.10525234,  # 996
-        0.10526238,  # 997
-        0.10511248,  # 998
-        0.10514631,  # 999
-        0.1052211,  # 1000
-        0.10529925,  # 1001
-        0.10525959,  # 1002
-        0.10512289,  # 1003
-        0.10532163,  # 1004
-        0.10534275,  # 1005
-        0.10519977,  # 1006
-        0.10525662,  # 1007
-        0.10560293,  # 1008
-        0.10552091,  # 1009
-        0.10528723,  # 1010
-        0.10535764,  # 1011
-        0.10525476,  # 1012
-        0.10525946,  # 1013
-        0.1052994,  # 1014
-        0.10561188,  # 1015
-        0.10552051,  # 1016
-        0.10522999,  # 1017
-        0.10521473,  # 1018
-        0.10532952,  # 1019
-        0.10527545,  # 1020
-        0.1050754,  # 1021
-        0.10536242,  # 1022
-        0.10557951,  # 1023
-        0.10528242,  # 1024
-        0.10502453,  # 1025
-        0.10528122,  # 1026
-        0.1054639,  # 1027
-        0.10524139,  # 1028
-        0.10538675,  # 1029
-        0.10533909,  # 1030
-        0.10542001,  # 1031
-        0.10547277,  # 1032
-        0.10539124,  # 1033
-        0.10533796,  # 1034
-        0.10526997,  # 1035
-        0.10543195,  # 1036
-        0.1050824,  # 1037
-        0.10523167,  # 1038
-        0.1053768,  # 1039
-        0.10517403,  # 1040
-        0.10550104,  # 1041
-        0.10521658,  # 1042
-        0.10526442,  # 1043
-        0.10531574,  # 1044
-        0.10533689,  # 1045
-        0.10515452,  # 1046
-        0.10521907,  # 1047
-        0.10527317,  # 1048
-        0.10545132,  # 1049
-        0.10568386,  # 1050
-        0.10537051,  # 1051
-        0.10537124,  # 1052
-        0.10528485,  # 1053
-        0.10523654,  # 1054
-        0.10540664,  # 1055
-        0.10533216,  # 1056
-        0.105405,  # 1057
-        0.10529591,  # 1058
-        0.10517241,  # 1059
-        0.10534452,  # 1060
-        0.10516888,  # 1061
-        0.10531421,  # 1062
-        0.10528522,  # 1063
-        0.10518174,  # 1064
-        0.10517379,  # 1065
-        0.10515275,  # 1066
-        0.10533268,  # 1067
-        0.10536912,  # 1068
-        0.10544608,  # 1069
-        0.10563082,  # 1070
-        0.10549092,  # 1071
-        0.10535374,  # 1072
-        0.10518938,  # 1073
-        0.10551569,  # 1074
-        0.10533824,  # 1075
-        0.10551192,  # 1076
-        0.1055729,  # 1077
-        0.10554894,  # 1078
-        0.10523414,  # 1079
-        0.10534874,  # 1080
-        0.10538419,  # 1081
-        0.10528576,  # 1082
-        0.10557799,  # 1083
-        0.10539881,  # 1084
-        0.10552222,  # 1085
-        0.10529177,  # 1086
-        0.10527603,  # 1087
-        0.10545144,  # 1088
-        0.10538216,  # 1089
-        0.10563164,  # 1090
-        0.10543917,  # 1091
-        0.10540914,  # 1092
-        0.10566529,  # 1093
-        0.10524536,  # 1094
-        0.10531888,  # 1095
-        0.10541779,  # 1096
-        0.10515746,  # 1097
-        0.10527444,  # 1098
-        0.10559477,  # 1099
-        0.10564246,  # 1100
-        0.10532736,  # 1101
-        0.10549786,  # 1102
-        0.10544439,  # 1103
-        0.10529788,  # 1104
-        0.10551355,  # 1105
-        0.1053165,  # 1106
-        0.10555234,  # 1107
-        0.10551685,  # 1108
-        0.10530705,  # 1109
-        0.10554715,  # 1110
-        0.10555849,  # 1111
-        0.10561303,  # 1112
-        0.10532476,  # 1113
-        0.10563013,  # 1114
-        0.10557817,  # 1115
-        0.10552918,  # 1116
-        0.10569266,  # 1117
-        0.10534729,  # 1118
-        0.10549719,  # 1119
-        0.10577797,  # 1120
-        0.10550745,  # 1121
-        0.10567834,  # 1122
-        0.10538675,  # 1123
-        0.1056873,  # 1124
-        0.10551178,  # 1125
-        0.10563211,  # 1126
-        0.10588059,  # 1127
-        0.1056868,  # 1128
-        0.10574628,  # 1129
-        0.10565214,  # 1130
-        0.10552407,  # 1131
-        0.10567704,  # 1132
-        0.10534327,  # 1133
-        0.1057694,  # 1134
-        0.10540959,  # 1135
-        0.10566013,  # 1136
-        0.1054901,  # 1137
-        0.1056158,  # 1138
-        0.10544565,  # 1139
-        0.10545179,  # 1140
-        0.10551091,  # 1141
-        0.10548563,  # 1142
-        0.10552587,  # 1143
-        0.10525953,  # 1144
-        0.10533507,  # 1145
-        0.10556927,  # 1146
-        0.10547591,  # 1147
-        0.10532468,  # 1148
-        0.10567739,  # 1149
-        0.10562956,  # 1150
-        0.10547531,  # 1151
-        0.10546872,  # 1152
-        0.10550923,  # 1153
-        0.10578048,  # 1154
-        0.10574308,  # 1155
-        0.10556538,  # 1156
-        0.10538584,  # 1157
-        0.10525274,  # 1158
-        0.10549933,  # 1159
-        0.10557894,  # 1160
-        0.10555809,  # 1161
-        0.10546405,  # 1162
-        0.10571596,  # 1163
-        0.10550589,  # 1164
-        0.10555932,  # 1165
-        0.10574197,  # 1166
-        0.10554263,  # 1167
-        0.10562374,  # 1168
-        0.10562292,  # 1169
-        0.10567621,  # 1170
-        0.1056569,  # 1171
-        0.10548973,  # 1172
-        0.10558132,  # 1173
-        0.10553111,  # 1174
-        0.10552896,  # 1175
-        0.10553591,  # 1176
-        0.10559499,  # 1177
-        0.10562741,  # 1178
-        0.10555056,  # 1179
-        0.10566899,  # 1180
-        0.10565978,  # 1181
-        0.1056363,  # 1182
-        0.10566777,  # 1183
-        0.10548416,  # 1184
-        0.10568322,  # 1185
-        0.10554576,  # 1186
-        0.10542334,  # 1187
-        0.1055028,  # 1188
-        0.10547901,  # 1189
-        0.10546581,  # 1190
-        0.1054054,  # 1191
-        0.10540572,  # 1192
-        0.10559614,  # 1193
-        0.10559688,  # 1194
-        0.10551862,  # 1195
-        0.10554515,  # 1196
-        0.10574915,  # 1197
-        0.10553004,  # 1198
-        0.10560968,  # 1199
-        0.10541262,  # 1200
-        0.10553666,  # 1201
-        0.10567156,  # 1202
-        0.10565695,  # 1203
-        0.10567307,  # 1204
-        0.1054775,  # 1205
-        0.10555285,  # 1206
-        0.1054988,  # 1207
-        0.10554598,  # 1208
-        0.10583804,  # 1209
-        0.10568253,  # 1210
-        0.10549714,  # 1211
-        0.10555602,  # 1212
-        0.10559815,  # 1213
-        0.1055759,  # 1214
-        0.10567156,  # 1215
-        0.1056715,  # 1216
-        0.10553835,  # 1217
-        0.1055464,  # 1218
-        0.10548821,  # 1219
-        0.10550855,  # 1220
-        0.10570732,  # 1221
-        0.1058114,  # 1222
-        0.10544712,  # 1223
-        0.10549584,  # 1224
-        0.10556582,  # 1225
-        0.10557276,  # 1226
-        0.10570978,  # 1227
-        0.10554414,  # 1228
-        0.10555733,  # 1229
-        0.10559371,  # 1230
-        0.10551779,  # 1231
-        0.10584072,  # 1232
-        0.10571216,  # 1233
-        0.10545282,  # 1234
-        0.10555619,  # 1235
-        0.10536964,  # 1236
-        0.10546808,  # 1237
-        0.10567861,  # 1238
-        0.10558881,  # 1239
-        0.105581,  # 1240
-        0.10566293,  # 1241
-        0.10555744,  # 1242
-        0.10555162,  # 1243
-        0.10565885,  # 1244
-        0.10554782,  # 1245
-        0.105593,  # 1246
-        0.10553461,  # 1247
-        0.10567676,  # 1248
-        0.10562454,  # 1249
-        0.10572631,  # 1250
-        0.10579137,  # 1251
-        0.10583703,  # 1252
-        0.10582908,  # 1253
-        0.10571207,  # 1254
-        0.10573509,  # 1255
-        0.10573749,  # 1256
-        0.10588296,  # 1257
-        0.10583173,  # 1258
-        0.10567479,  # 1259
-        0.10566281,  # 1260
-        0.10566852,  # 1261
-        0.10595388,  # 1262
-        0.10580908,  # 1263
-        0.10584504,  # 1264
-        0.10568094,  # 1265
-        0.10552903,  # 1266
-        0.10563392,  # 1267
-        0.10583259,  # 1268
-        0.10582945,  # 1269
-        0.10567338,  # 1270
-        0.10565262,  # 1271
-        0.10567787,  # 1272
-        0.10569805,  # 1273
-        0.10567349,  # 1274
-        0.10560604,  # 1275
-        0.10569334,  # 1276
-        0.10554402,  # 1277
-        0.10547694,  # 1278
-        0.10548962,  # 1279
-        0.1054745,  # 1280
-        0.10571919,  # 1281
-        0.10569325,  # 1282
-        0.10544785,  # 1283
-        0.10567123,  # 1284
-        0.10568245,  # 1285
-        0.10569223,  # 1286
-        0.10558142,  # 1287
-        0.10577107,  # 1288
-        0.10594791,  # 1289
-        0.10576996,  # 1290
-        0.10570317,  # 1291
-        0.10564204,  # 1292
-        0.10574432,  # 1293
-        0.10562489,  # 1294
-        0.10577249,  # 1295
-        0.10578375,  # 1296
-        0.10566474,  # 1297
-        0.10572753,  # 1298
-        0.10565339,  # 1299
-        0.10572303,  # 1300
-        0.1055967,  # 1301
-        0.10574473,  # 1302
-        0.10581821,  # 1303
-        0.10559082,  # 1304
-        0.10560684,  # 1305
-        0.10577652,  # 1306
-        0.10578697,  # 1307
-        0.10561782,  # 1308
-        0.10572077,  # 1309
-        0.10566205,  # 1310
-        0.10583721,  # 1311
-        0.10576303,  # 1312
-        0.10556778,  # 1313
-        0.10584184,  # 1314
-        0.10569951,  # 1315
-        0.10582762,  # 1316
-        0.105649,  # 1317
-        0.10579091,  # 1318
-        0.1056568,  # 1319
-        0.10576624,  # 1320
-        0.10568943,  # 1321
-        0.1058762,  # 1322
-        0.10575009,  # 1323
-        0.10568741,  # 1324
-        0.1056327,  # 1325
-        0.10568447,  # 1326
-        0.10555258,  # 1327
-        0.10567005,  # 1328
-        0.1057258,  # 1329
-        0.10558361,  # 1330
-        0.10569871,  # 1331
-        0.10579705,  # 1332
-        0.10584441,  # 1333
-        0.10559345,  # 1334
-        0.10553827,  # 1335
-        0.10568974,  # 1336
-        0.1055582,  # 1337
-        0.10587184,  # 1338
-        0.10572892,  # 1339
-        0.10564964,  # 1340
-        0.10565837,  # 1341
-        0.10570521,  # 1342
-        0.10542847,  # 1343
-        0.10580383,  # 1344
-        0.10579843,  # 1345
-        0.10570193,  # 1346
-        0.10564876,  # 1347
-        0.10567835,  # 1348
-        0.10563324,  # 1349
-        0.10563165,  # 1350
-        0.10552847,  # 1351
-        0.10570042,  # 1352
-        0.10560518,  # 1353
-        0.10555792,  # 1354
-        0.1055572,  # 1355
-        0.10586727,  # 1356
-        0.10572054,  # 1357
-        0.105843,  # 1358
-        0.10556698,  # 1359
-        0.10562771,  # 1360
-        0.10579047,  # 1361
-        0.10582898,  # 1362
-        0.10570831,  # 1363
-        0.1055499,  # 1364
-        0.10583357,  # 1365
-        0.10574927,  # 1366
-        0.10581782,  # 1367
-        0.1060444,  # 1368
-        0.1058424,  # 1369
-        0.10582143,  # 1370
-        0.10564635,  # 1371
-        0.10588054,  # 1372
-        0.10592532,  # 1373
-        0.10598916,  # 1374
-        0.10595482,  # 1375
-        0.10585376,  # 1376
-        0.10570765,  # 1377
-        0.10578866,  # 1378
-        0.10585778,  # 1379
-        0.10600933,  # 1380
-        0.10588107,  # 1381
-        0.10591367,  # 1382
-        0.10597119,  # 1383
-        0.10607263,  # 1384
-        0.10590226,  # 1385
-        0.10579148,  # 1386
-        0.10580648,  # 1387
-        0.10593494,  # 1388
-        0.10596637,  # 1389
-        0.10569313,  # 1390
-        0.10599641,  # 1391
-        0.10587783,  # 1392
-        0.10559291,  # 1393
-        0.10576333,  # 1394
-        0.10600544,  # 1395
-        0.1057456,  # 1396
-        0.10587794,  # 1397
-        0.10610619,  # 1398
-        0.1059798,  # 1399
-        0.10580254,  # 1400
-        0.10562455,  # 1401
-        0.10594459,  # 1402
-        0.10600166,  # 1403
-        0.10599106,  # 1404
-        0.10589621,  # 1405
-        0.1059998,  # 1406
-        0.10584992,  # 1407
-        0.1058617,  # 1408
-        0.10597332,  # 1409
-        0.10603368,  # 1410
-        0.10610437,  # 1411
-        0.10603855,  # 1412
-        0.10591587,  # 1413
-        0.10598671,  # 1414
-        0.10583786,  # 1415
-        0.1059786,  # 1416
-        0.10589185,  # 1417
-        0.10574326,  # 1418
-        0.1059417,  # 1419
-        0.10570861,  # 1420
-        0.10577634,  # 1421
-        0.10582235,  # 1422
-        0.10601709,  # 1423
-        0.10613849,  # 1424
-        0.10614466,  # 1425
-        0.10614831,  # 1426
-        0.10593531,  # 1427
-        0.10599522,  # 1428
-        0.10615871,  # 1429
-        0.10607222,  # 1430
-        0.10594125,  # 1431
-        0.10601572,  # 1432
-        0.1063151,  # 1433
-        0.10615768,  # 1434
-        0.10597024,  # 1435
-        0.10594466,  # 1436
-        0.10578596,  # 1437
-        0.10604303,  # 1438
-        0.10603468,  # 1439
-        0.10597119,  # 1440
-        0.1059715,  # 1441
-        0.10594697,  # 1442
-        0.10601732,  # 1443
-        0.10589916,  # 1444
-        0.10606768,  # 1445
-        0.1061672,  # 1446
-        0.10607172,  # 1447
-        0.10598708,  # 1448
-        0.10587682,  # 1449
-        0.10607165,  # 1450
-        0.10628828,  # 1451
-        0.10617744,  # 1452
-        0.1061674,  # 1453
-        0.10606536,  # 1454
-        0.10617402,  # 1455
-        0.10620007,  # 1456
-        0.10606083,  # 1457
-        0.10592672,  # 1458
-        0.10600364,  # 1459
-        0.10617092,  # 1460
-        0.10626321,  # 1461
-        0.10637494,  # 1462
-        0.10616731,  # 1463
-        0.1061123,  # 1464
-        0.10615277,  # 1465
-        0.10589598,  # 1466
-        0.10588443,  # 1467
-        0.10611404,  # 1468
-        0.1062406,  # 1469
-        0.10607828,  # 1470
-        0.10599549,  # 1471
-        0.10609061,  # 1472
-        0.10619704,  # 1473
-        0.10613089,  # 1474
-        0.10594485,  # 1475
-        0.1059388,  # 1476
-        0.10596722,  # 1477
-        0.10600327,  # 1478
-        0.10616775,  # 1479
-        0.1062634,  # 1480
-        0.10632258,  # 1481
-        0.10617717,  # 1482
-        0.10622553,  # 1483
-        0.10622153,  # 1484
-        0.10615509,  # 1485
-        0.10626003,  # 1486
-        0.10631224,  # 1487
-        0.10616333,  # 1488
-        0.10618042,  # 1489
-        0.10609685,  # 1490
-        0.10630484,  # 1491
-        0.10640191,  # 1492
-        0.10635345,  # 1493
-        0.10630269,  # 1494
-        0.10609181,  # 1495
-        0.10623824,  # 1496
-        0.10612642,  # 1497
-        0.10614552,  # 1498
-        0.10612423,  # 1499
-        0.10615622,  # 1500
-        0.10622432,  # 1501
-        0.10608199,  # 1502
-        0.10612842,  # 1503
-        0.10622197,  # 1504
-        0.10615234,  # 1505
-        0.10603882,  # 1506
-        0.10603652,  # 1507
-        0.10616819,  # 1508
-        0.1062196,  # 1509
-        0.10620662,  # 1510
-        0.10637627,  # 1511
-        0.10614199,  # 1512
-        0.10615081,  # 1513
-        0.10622938,  # 1514
-        0.10608146,  # 1515
-        0.10621073,  # 1516
-        0.10604889,  # 1517
-        0.10632345,  # 1518
-        0.10638745,  # 1519
-        0.10639678,  # 1520
-        0.10630903,  # 1521
-        0.10632816,  # 1522
-        0.10623541,  # 1523
-        0.10603144,  # 1524
-        0.1061945,  # 1525
-        0.10629953,  # 1526
-        0.10657694,  # 1527
-        0.10638315,  # 1528
-        0.10638089,  # 1529
-        0.10624017,  # 1530
-        0.1061221,  # 1531
-        0.10639036,  # 1532
-        0.10637262,  # 1533
-        0.10624548,  # 1534
-        0.10632657,  # 1535
-        0.10630143,  # 1536
-        0.10618231,  # 1537
-        0.10613782,  # 1538
-        0.10631867,  # 1539
-        0.10627087,  # 1540
-        0.10622705,  # 1541
-        0.10626701,  # 1542
-        0.1063673,  # 1543
-        0.10622872,  # 1544
-        0.10627381,  # 1545
-        0.10593991,  # 1546
-        0.10653257,  # 1547
-        0.10638863,  # 1548
-        0.1065153,  # 1549
-        0.1063437,  # 1550
-        0.10628244,  # 1551
-        0.10609004,  # 1552
-        0.10611732,  # 1553
-        0.10633553,  # 1554
-        0.10621906,  # 1555
-        0.10640676,  # 1556
-        0.10638816,  # 1557
-        0.10610537,  # 1558
-        0.1064132,  # 1559
-        0.10635787,  # 1560
-        0.10644774,  # 1561
-        0.10634432,  # 1562
-        0.10628368,  # 1563
-        0.10655055,  # 1564
-        0.10635468,  # 1565
-        0.10645038,  # 1566
-        0.10639009,  # 1567
-        0.10639279,  # 1568
-        0.10656926,  # 1569
-        0.10633558,  # 1570
-        0.10640363,  # 1571
-        0.10635624,  # 1572
-        0.10647777,  # 1573
-        0.1064254,  # 1574
-        0.10631136,  # 1575
-        0.10665573,  # 1576
-        0.10630896,  # 1577
-        0.10660485,  # 1578
-        0.10638998,  # 1579
-        0.10661488,  # 1580
-        0.10631856,  # 1581
-        0.1063436,  # 1582
-        0.10641004,  # 1583
-        0.1065331,  # 1584
-        0.10641709,  # 1585
-        0.10656714,  # 1586
-        0.10636821,  # 1587
-        0.10612452,  # 1588
-        0.10656977,  # 1589
-        0.1065424,  # 1590
-        0.10659663,  # 1591
-        0.10668192,  # 1592
-        0.10663142,  # 1593
-        0.1062457,  # 1594
-        0.10662369,  # 1595
-        0.10653435,  # 1596
-        0.10668327,  # 1597
-        0.10642669,  # 1598
-        0.10655106,  # 1599
-        0.10630244,  # 1600
-        0.10638142,  # 1601
-        0.10654461,  # 1602
-        0.10658055,  # 1603
-        0.10640292,  # 1604
-        0.10659592,  # 1605
-        0.10633811,  # 1606
-        0.10640988,  # 1607
-        0.10627006,  # 1608
-        0.10664008,  # 1609
-        0.10652317,  # 1610
-        0.10648982,  # 1611
-        0.10658925,  # 1612
-        0.10672028,  # 1613
-        0.10646168,  # 1614
-        0.10649378,  # 1615
-        0.10643683,  # 1616
-        0.10647209,  # 1617
-        0.10661251,  # 1618
-        0.10651123,  # 1619
-        0.10645814,  # 1620
-        0.10657933,  # 1621
-        0.10656418,  # 1622
-        0.10659921,  # 1623
-        0.10641252,  # 1624
-        0.10644012,  # 1625
-        0.10641495,  # 1626
-        0.10664081,  # 1627
-        0.10668382,  # 1628
-        0.10647451,  # 1629
-        0.10657206,  # 1630
-        0.10665762,  # 1631
-        0.10648243,  # 1632
-        0.10671201,  # 1633
-        0.10692078,  # 1634
-        0.10658268,  # 1635
-        0.10654368,  # 1636
-        0.10664282,  # 1637
-        0.1067505,  # 1638
-        0.10675196,  # 1639
-        0.10653526,  # 1640
-        0.10649749,  # 1641
-        0.10664961,  # 1642
-        0.10683633,  # 1643
-        0.10651589,  # 1644
-        0.10662372,  # 1645
-        0.10664083,  # 1646
-        0.10662246,  # 1647
-        0.10665971,  # 1648
-        0.10664763,  # 1649
-        0.10663516,  # 1650
-        0.10667708,  # 1651
-        0.10663813,  # 1652
-        0.10677967,  # 1653
-        0.1065716,  # 1654
-        0.10665719,  # 1655
-        0.10672163,  # 1656
-        0.10680996,  # 1657
-        0.10646657,  # 1658
-        0.10659997,  # 1659
-        0.10680415,  # 1660
-        0.10670292,  # 1661
-        0.10652565,  # 1662
-        0.10663047,  # 1663
-        0.10661673,  # 1664
-        0.10667044,  # 1665
-        0.10668601,  # 1666
-        0.1067388,  # 1667
-        0.10652159,  # 1668
-        0.10660825,  # 1669
-        0.10667879,  # 1670
-        0.10665864,  # 1671
-        0.10665786,  # 1672
-        0.1066669,  # 1673
-        0.10661668,  # 1674
-        0.10655118,  # 1675
-        0.10670469,  # 1676
-        0.10687876,  # 1677
-        0.10683906,  # 1678
-        0.10665234,  # 1679
-        0.10656041,  # 1680
-        0.1066293,  # 1681
-        0.10670132,  # 1682
-        0.10692448,  # 1683
-        0.10687867,  # 1684
-        0.10674365,  # 1685
-        0.10670718,  # 1686
-        0.10674035,  # 1687
-        0.10669954,  # 1688
-        0.1066824,  # 1689
-        0.10689597,  # 1690
-        0.10698311,  # 1691
-        0.10687233,  # 1692
-        0.10670662,  # 1693
-        0.10670212,  # 1694
-        0.10669485,  # 1695
-        0.10662467,  # 1696
-        0.10686563,  # 1697
-        0.1069371,  # 1698
-        0.10683393,  # 1699
-        0.10692698,  # 1700
-        0.10673929,  # 1701
-        0.10665565,  # 1702
-        0.10684411,  # 1703
-        0.1069242,  # 1704
-        0.10676977,  # 1705
-        0.10677412,  # 1706
-        0.10687083,  # 1707
-        0.10673007,  # 1708
-        0.10677674,  # 1709
-        0.10675254,  # 1710
-        0.10668939,  # 1711
-        0.10685478,  # 1712
-        0.10679185,  # 1713
-        0.10682583,  # 1714
-        0.10672461,  # 1715
-        0.10665143,  # 1716
-        0.10683741,  # 1717
-        0.10680887,  # 1718
-        0.10681448,  # 1719
-        0.10678259,  # 1720
-        0.1069468,  # 1721
-        0.10694014,  # 1722
-        0.10683813,  # 1723
-        0.1069009,  # 1724
-        0.10688041,  # 1725
-        0.1068796,  # 1726
-        0.1068585,  # 1727
-        0.10680653,  # 1728
-        0.10682087,  # 1729
-        0.10676478,  # 1730
-        0.10684869,  # 1731
-        0.10678044,  # 1732
-        0.10669882,  # 1733
-        0.10684507,  # 1734
-        0.10688546,  # 1735
-        0.10702792,  # 1736
-        0.10693993,  # 1737
-        0.10699044,  # 1738
-        0.10704306,  # 1739
-        0.10683002,  # 1740
-        0.10684796,  # 1741
-        0.10697985,  # 1742
-        0.10706211,  # 1743
-        0.10708193,  # 1744
-        0.10689641,  # 1745
-        0.10695213,  # 1746
-        0.10685024,  # 1747
-        0.10683624,  # 1748
-        0.10685432,  # 1749
-        0.10678836,  # 1750
-        0.1068423,  # 1751
-        0.10695357,  # 1752
-        0.10703091,  # 1753
-        0.10691074,  # 1754
-        0.10701234,  # 1755
-        0.10707092,  # 1756
-        0.10688488,  # 1757
-        0.10695055,  # 1758
-        0.10697615,  # 1759
-        0.10699275,  # 1760
-        0.10692974,  # 1761
-        0.10703347,  # 1762
-        0.10727994,  # 1763
-        0.10724289,  # 1764
-        0.10707824,  # 1765
-        0.10700889,  # 1766
-        0.10675027,  # 1767
-        0.10685391,  # 1768
-        0.10671397,  # 1769
-        0.10667729,  # 1770
-        0.10676889,  # 1771
-        0.10700259,  # 1772
-        0.10698296,  # 1773
-        0.10711024,  # 1774
-        0.10680507,  # 1775
-        0.10690032,  # 1776
-        0.1069612,  # 1777
-        0.10696075,  # 1778
-        0.10683782,  # 1779
-        0.10728626,  # 1780
-        0.10675153,  # 1781
-        0.10681053,  # 1782
-        0.10684277,  # 1783
-        0.10710518,  # 1784
-        0.10689315,  # 1785
-        0.10698414,  # 1786
-        0.10699052,  # 1787
-        0.10688299,  # 1788
-        0.10684305,  # 1789
-        0.10728332,  # 1790
-        0.1070093,  # 1791
-        0.10666518,  # 1792
-        0.10691919,  # 1793
-        0.10702291,  # 1794
-        0.10687519,  # 1795
-        0.10722099,  # 1796
-        0.10663612,  # 1797
-        0.10700132,  # 1798
-        0.10710061,  # 1799
-        0.1066316,  # 1800
-        0.1071608,  # 1801
-        0.107227,  # 1802
-        0.10714163,  # 1803
-        0.1068487,  # 1804
-        0.10701109,  # 1805
-        0.10695594,  # 1806
-        0.10652794,  # 1807
-        0.10688538,  # 1808
-        0.10740002,  # 1809
-        0.1070752,  # 1810
-        0.10705233,  # 1811
-        0.10688969,  # 1812
-        0.10682275,  # 1813
-        0.10690253,  # 1814
-        0.10713753,  # 1815
-        0.1069892,  # 1816
-        0.10704673,  # 1817
-        0.10692708,  # 1818
-        0.1068275,  # 1819
-        0.10697313,  # 1820
-        0.10685021,  # 1821
-        0.10685214,  # 1822
-        0.10696458,  # 1823
-        0.10707321,  # 1824
-        0.10733897,  # 1825
-        0.10691563,  # 1826
-        0.10710641,  # 1827
-        0.10699357,  # 1828
-        0.10693619,  # 1829
-        0.10683093,  # 1830
-        0.10693966,  # 1831
-        0.10720677,  # 1832
-        0.10716115,  # 1833
-        0.10674242,  # 1834
-        0.10723196,  # 1835
-        0.10710266,  # 1836
-        0.10698214,  # 1837
-        0.10687609,  # 1838
-        0.10728365,  # 1839
-        0.10718228,  # 1840
-        0.10697551,  # 1841
-        0.10706161,  # 1842
-        0.10687246,  # 1843
-        0.10723475,  # 1844
-        0.10711437,  # 1845
-        0.10705015,  # 1846
-        0.10732538,  # 1847
-        0.10689924,  # 1848
-        0.10699591,  # 1849
-        0.10677751,  # 1850
-        0.10681191,  # 1851
-        0.10704165,  # 1852
-        0.10708572,  # 1853
-        0.10732518,  # 1854
-        0.10697743,  # 1855
-        0.1069167,  # 1856
-        0.10704082,  # 1857
-        0.10696822,  # 1858
-        0.1068786,  # 1859
-        0.10695389,  # 1860
-        0.10691719,  # 1861
-        0.10702033,  # 1862
-        0.10696292,  # 1863
-        0.10688264,  # 1864
-        0.10677622,  # 1865
-        0.106721,  # 1866
-        0.10685952,  # 1867
-        0.10679488,  # 1868
-        0.10704318,  # 1869
-        0.10696973,  # 1870
-        0.10693269,  # 1871
-        0.10710465,  # 1872
-        0.10704674,  # 1873
-        0.10715104,  # 1874
-        0.1070775,  # 1875
-        0.10688406,  # 1876
-        0.10697022,  # 1877
-        0.10702337,  # 1878
-        0.10703146,  # 1879
-        0.1070802,  # 1880
-        0.10712026,  # 1881
-        0.10694269,  # 1882
-        0.1069327,  # 1883
-        0.10721045,  # 1884
-        0.10678794,  # 1885
-        0.10708953,  # 1886
-        0.10710191,  # 1887
-        0.10700143,  # 1888
-        0.10701631,  # 1889
-        0.10681067,  # 1890
-        0.10705635,  # 1891
-        0.10709806,  # 1892
-        0.10709462,  # 1893
-        0.10703842,  # 1894
-        0.10706485,  # 1895
-        0.10704234,  # 1896
-        0.10704526,  # 1897
-        0.10708838,  # 1898
-        0.1071619,  # 1899
-        0.10706754,  # 1900
-        0.10694903,  # 1901
-        0.10692353,  # 1902
-        0.10705356,  # 1903
-        0.10717756,  # 1904
-        0.10732149,  # 1905
-        0.10712486,  # 1906
-        0.10719993,  # 1907
-        0.107207,  # 1908
-        0.10708508,  # 1909
-        0.10702411,  # 1910
-        0.10714187,  # 1911
-        0.10716176,  # 1912
-        0.10709837,  # 1913
-        0.10720484,  # 1914
-        0.10717642,  # 1915
-        0.10710633,  # 1916
-        0.10712675,  # 1917
-        0.10719197,  # 1918
-        0.10717437,  # 1919
-        0.10711413,  # 1920
-        0.10720094,  # 1921
-        0.10733387,  # 1922
-        0.10724499,  # 1923
-        0.10708775,  # 1924
-        0.10713599,  # 1925
-        0.10703141,  # 1926
-        0.10715724,  # 1927
-        0.10718407,  # 1928
-        0.10702836,  # 1929
-        0.1070991,  # 1930
-        0.10731316,  # 1931
-        0.10725431,  # 1932
-        0.10720961,  # 1933
-        0.10718334,  # 1934
-        0.10712505,  # 1935
-        0.10711582,  # 1936
-        0.1071014,  # 1937
-        0.10715439,  # 1938
-        0.10720138,  # 1939
-        0.1071169,  # 1940
-        0.10694883,  # 1941
-        0.10716771,  # 1942
-        0.10732445,  # 1943
-        0.10717805,  # 1944
-        0.10712745,  # 1945
-        0.10711545,  # 1946
-        0.10727744,  # 1947
-        0.1074357,  # 1948
-        0.10734327,  # 1949
-        0.10715901,  # 1950
-        0.10722474,  # 1951
-        0.10723602,  # 1952
-        0.10709532,  # 1953
-        0.10744496,  # 1954
-        0.10740183,  # 1955
-        0.1071292,  # 1956
-        0.10754416,  # 1957
-        0.10741233,  # 1958
-        0.10725659,  # 1959
-        0.10713676,  # 1960
-        0.10738343,  # 1961
-        0.10747171,  # 1962
-        0.10722083,  # 1963
-        0.10709564,  # 1964
-        0.10715795,  # 1965
-        0.10708774,  # 1966
-        0.10706697,  # 1967
-        0.10730413,  # 1968
-        0.10719347,  # 1969
-        0.10731938,  # 1970
-        0.10720139,  # 1971
-        0.10725564,  # 1972
-        0.10747022,  # 1973
-        0.10737073,  # 1974
-        0.10718374,  # 1975
-        0.10727612,  # 1976
-        0.10741736,  # 1977
-        0.10738993,  # 1978
-        0.10736312,  # 1979
-        0.10746562,  # 1980
-        0.10744212,  # 1981
-        0.10745009,  # 1982
-        0.10755806,  # 1983
-        0.10741727,  # 1984
-        0.10722941,  # 1985
-        0.10750901,  # 1986
-        0.10764061,  # 1987
-        0.10750271,  # 1988
-        0.10733506,  # 1989
-        0.10762303,  # 1990
-        0.10744811,  # 1991
-        0.10737125,  # 1992
-        0.10757366,  # 1993
-        0.10774905,  # 1994
-        0.10765645,  # 1995
-        0.10768905,  # 1996
-        0.1075036,  # 1997
-        0.10739818,  # 1998
-        0.10754229,  # 1999
-        0.10767141,  # 2000
-        0.10784579,  # 2001
-        0.10752848,  # 2002
-        0.1076384,  # 2003
-        0.10784092,  # 2004
-        0.10760026,  # 2005
-        0.1075838,  # 2006
-        0.10760611,  # 2007
-        0.10762878,  # 2008
-        0.10769111,  # 2009
-        0.10760165,  # 2010
-        0.1077512,  # 2011
-        0.10774316,  # 2012
-        0.10765354,  # 2013
-        0.10789413,  # 2014
-        0.1076776,  # 2015
-        0.10779272,  # 2016
-        0.10785497,  # 2017
-        0.10767362,  # 2018
-        0.10782289,  # 2019
-        0.10775922,  # 2020
-        0.10781576,  # 2021
-        0.10794073,  # 2022
-        0.10766171,  # 2023
-        0.1076945,  # 2024
-        0.10787475,  # 2025
-        0.10781876,  # 2026
-        0.10763595,  # 2027
-        0.10753797,  # 2028
-        0.10755731,  # 2029
-        0.10782115,  # 2030
-        0.10755378,  # 2031
-        0.10770995,  # 2032
-        0.10773454,  # 2033
-        0.10775364,  # 2034
-        0.10812237,  # 2035
-        0.10773987,  # 2036
-        0.10767535,  # 2037
-        0.10780798,  # 2038
-        0.10793615,  # 2039
-        0.10776014,  # 2040
-        0.10781733,  # 2041
-        0.10766543,  # 2042
-        0.10783026,  # 2043
-        0.1078832,  # 2044
-        0.10761514,  # 2045
-        0.10779001,  # 2046
-        0.10782489,  # 2047
-        0.10771782,  # 2048
-        0.10776563,  # 2049
-        0.10790146,  # 2050
-        0.10754503,  # 2051
-        0.10747014,  # 2052
-        0.10798355,  # 2053
-        0.1077065,  # 2054
-        0.10758812,  # 2055
-        0.10774436,  # 2056
-        0.10778967,  # 2057
-        0.10764082,  # 2058
-        0.10765476,  # 2059
-        0.1078731,  # 2060
-        0.10749921,  # 2061
-        0.10756059,  # 2062
-        0.10762823,  # 2063
-        0.10778267,  # 2064
-        0.10752426,  # 2065
-        0.10778234,  # 2066
-        0.10784632,  # 2067
-        0.10755207,  # 2068
-        0.10761596,  # 2069
-        0.10785771,  # 2070
-        0.10789195,  # 2071
-        0.10761992,  # 2072
-        0.10776508,  # 2073
-        0.10788687,  # 2074
-        0.10787632,  # 2075
-        0.10781324,  # 2076
-        0.1079753,  # 2077
-        0.1078367,  # 2078
-        0.10790042,  # 2079
-        0.1079285,  # 2080
-        0.10803069,  # 2081
-        0.10775945,  # 2082
-        0.10794884,  # 2083
-        0.10808625,  # 2084
-        0.10779928,  # 2085
-        0.10805413,  # 2086
-        0.10809901,  # 2087
-        0.1078392,  # 2088
-        0.10776619,  # 2089
-        0.10795531,  # 2090
-        0.10803348,  # 2091
-        0.10792162,  # 2092
-        0.10793694,  # 2093
-        0.10806345,  # 2094
-        0.10783973,  # 2095
-        0.10781692,  # 2096
-        0.10814197,  # 2097
-        0.10801269,  # 2098
-        0.10791005,  # 2099
-        0.10786542,  # 2100
-        0.10786407,  # 2101
-        0.10798484,  # 2102
-        0.10806564,  # 2103
-        0.10788622,  # 2104
-        0.10779757,  # 2105
-        0.1078334,  # 2106
-        0.10811286,  # 2107
-        0.10804526,  # 2108
-        0.10789043,  # 2109
-        0.10791144,  # 2110
-        0.1080446,  # 2111
-        0.10823217,  # 2112
-        0.10796106,  # 2113
-        0.10798228,  # 2114
-        0.10807847,  # 2115
-        0.10816971,  # 2116
-        0.10815622,  # 2117
-        0.10813352,  # 2118
-        0.10816559,  # 2119
-        0.10812567,  # 2120
-        0.1082579,  # 2121
-        0.10824442,  # 2122
-        0.10828123,  # 2123
-        0.1081766,  # 2124
-        0.10834399,  # 2125
-        0.10837921,  # 2126
-        0.10840029,  # 2127
-        0.10830526,  # 2128
-        0.10845185,  # 2129
-        0.10830818,  # 2130
-        0.10818616,  # 2131
-        0.10836538,  # 2132
-        0.1083288,  # 2133
-        0.10822769,  # 2134
-        0.10835768,  # 2135
-        0.10850863,  # 2136
-        0.10831245,  # 2137
-        0.10811955,  # 2138
-        0.10818172,  # 2139
-        0.10832437,  # 2140
-        0.10836689,  # 2141
-        0.10835913,  # 2142
-        0.10835107,  # 2143
-        0.10839482,  # 2144
-        0.10843999,  # 2145
-        0.10836575,  # 2146
-        0.10838138,  # 2147
-        0.10837713,  # 2148
-        0.10833784,  # 2149
-        0.10833491,  # 2150
-        0.10826728,  # 2151
-        0.10825111,  # 2152
-        0.10834528,  # 2153
-        0.10843414,  # 2154
-        0.10840119,  # 2155
-        0.10837336,  # 2156
-        0.10831971,  # 2157
-        0.10838266,  # 2158
-        0.10850705,  # 2159
-        0.10852733,  # 2160
-        0.10844391,  # 2161
-        0.10838484,  # 2162
-        0.10837336,  # 2163
-        0.10835437,  # 2164
-        0.10851631,  # 2165
-        0.10848369,  # 2166
-        0.10827889,  # 2167
-        0.10813217,  # 2168
-        0.10829622,  # 2169
-        0.10855331,  # 2170
-        0.10835326,  # 2171
-        0.10820121,  # 2172
-        0.10826551,  # 2173
-        0.10818754,  # 2174
-        0.10826769,  # 2175
-        0.10830119,  # 2176
-        0.10825004,  # 2177
-        0.10831448,  # 2178
-        0.10833002,  # 2179
-        0.10838758,  # 2180
-        0.10832736,  # 2181
-        0.10831381,  # 2182
-        0.1083111,  # 2183
-        0.10833929,  # 2184
-        0.10835706,  # 2185
-        0.10838001,  # 2186
-        0.10848821,  # 2187
-        0.10851886,  # 2188
-        0.10840916,  # 2189
-        0.10829768,  # 2190
-        0.1083904,  # 2191
-        0.10826772,  # 2192
-        0.10811397,  # 2193
-        0.10830825,  # 2194
-        0.10835603,  # 2195
-        0.10835865,  # 2196
-        0.10830464,  # 2197
-        0.10836684,  # 2198
-        0.10827467,  # 2199
-        0.10830774,  # 2200
-        0.10838052,  # 2201
-        0.10832376,  # 2202
-        0.10824001,  # 2203
-        0.10835951,  # 2204
-        0.10837,  # 2205
-        0.10827472,  # 2206
-        0.10832363,  # 2207
-        0.10822335,  # 2208
-        0.10818898,  # 2209
-        0.10817935,  # 2210
-        0.10827015,  # 2211
-        0.10834645,  # 2212
-        0.10854985,  # 2213
-        0.10829744,  # 2214
-        0.10824916,  # 2215
-        0.10834758,  # 2216
-        0.10810518,  # 2217
-        0.10813977,  # 2218
-        0.10848872,  # 2219
-        0.10848083,  # 2220
-        0.10831239,  # 2221
-        0.10821118,  # 2222
-        0.1081414,  # 2223
-        0.1084302,  # 2224
-        0.10828215,  # 2225
-        0.1084171,  # 2226
-        0.10814296,  # 2227
-        0.10826037,  # 2228
-        0.10867089,  # 2229
-        0.10826638,  # 2230
-        0.1081294,  # 2231
-        0.10841232,  # 2232
-        0.10838207,  # 2233
-        0.10811276,  # 2234
-        0.10812011,  # 2235
-        0.10818238,  # 2236
-        0.10813057,  # 2237
-        0.10823859,  # 2238
-        0.10819405,  # 2239
-        0.10810811,  # 2240
-        0.10809494,  # 2241
-        0.10827191,  # 2242
-        0.10834731,  # 2243
-        0.10816816,  # 2244
-        0.10825753,  # 2245
-        0.10822909,  # 2246
-        0.10809543,  # 2247
-        0.10851814,  # 2248
-        0.10845807,  # 2249
-        0.10837242,  # 2250
-        0.10816673,  # 2251
-        0.10824938,  # 2252
-        0.10850998,  # 2253
-        0.10833887,  # 2254
-        0.10805044,  # 2255
-        0.10821314,  # 2256
-        0.10823913,  # 2257
-        0.10815482,  # 2258
-        0.10811011,  # 2259
-        0.10816977,  # 2260
-        0.10838365,  # 2261
-        0.1083158,  # 2262
-        0.10829851,  # 2263
-        0.10811923,  # 2264
-        0.10836453,  # 2265
-        0.10833852,  # 2266
-        0.10825444,  # 2267
-        0.10864532,  # 2268
-        0.10847379,  # 2269
-        0.10853206,  # 2270
-        0.1083432,  # 2271
-        0.10855178,  # 2272
-        0.108231,  # 2273
-        0.10838259,  # 2274
-        0.10848952,  # 2275
-        0.10845697,  # 2276
-        0.10840899,  # 2277
-        0.10859456,  # 2278
-        0.10866352,  # 2279
-        0.10836,  # 2280
-        0.10831957,  # 2281
-        0.10870971,  # 2282
-        0.10869649,  # 2283
-        0.10867704,  # 2284
-        0.10891662,  # 2285
-        0.10868962,  # 2286
-        0.10901122,  # 2287
-        0.10870927,  # 2288
-        0.10870983,  # 2289
-        0.10877581,  # 2290
-        0.10863095,  # 2291
-        0.10885392,  # 2292
-        0.10868079,  # 2293
-        0.10868161,  # 2294
-        0.10855997,  # 2295
-        0.10844951,  # 2296
-        0.10856063,  # 2297
-        0.10858675,  # 2298
-        0.10868563,  # 2299
-        0.10885438,  # 2300
-        0.10851267,  # 2301
-        0.1087238,  # 2302
-        0.10849813,  # 2303
-        0.10865843,  # 2304
-        0.10881822,  # 2305
-        0.1084019,  # 2306
-        0.1086386,  # 2307
-        0.10857851,  # 2308
-        0.1087108,  # 2309
-        0.10873053,  # 2310
-        0.10855014,  # 2311
-        0.10888707,  # 2312
-        0.10877351,  # 2313
-        0.10884136,  # 2314
-        0.10888814,  # 2315
-        0.10874591,  # 2316
-        0.1089501,  # 2317
-        0.10876338,  # 2318
-        0.10865119,  # 2319
-        0.10900915,  # 2320
-        0.1089054,  # 2321
-        0.10911525,  # 2322
-        0.10910045,  # 2323
-        0.10879894,  # 2324
-        0.10906884,  # 2325
-        0.10892806,  # 2326
-        0.10942575,  # 2327
-        0.10894039,  # 2328
-        0.10896375,  # 2329
-        0.10923798,  # 2330
-        0.1089805,  # 2331
-        0.10904971,  # 2332
-        0.10896254,  # 2333
-        0.10902368,  # 2334
-        0.10884005,  # 2335
-        0.10855033,  # 2336
-        0.1086048,  # 2337
-        0.10869981,  # 2338
-        0.10870621,  # 2339
-        0.10905915,  # 2340
-        0.10898711,  # 2341
-        0.10902106,  # 2342
-        0.10910776,  # 2343
-        0.10904853,  # 2344
-        0.10914374,  # 2345
-        0.10906265,  # 2346
-        0.10943588,  # 2347
-        0.10960124,  # 2348
-        0.10933797,  # 2349
-        0.10911576,  # 2350
-        0.10904937,  # 2351
-        0.10925311,  # 2352
-        0.10899132,  # 2353
-        0.10893041,  # 2354
-        0.10921481,  # 2355
-        0.10913807,  # 2356
-        0.1089987,  # 2357
-        0.10896945,  # 2358
-        0.10874034,  # 2359
-        0.10906362,  # 2360
-        0.10908927,  # 2361
-        0.10907368,  # 2362
-        0.10903313,  # 2363
-        0.1090935,  # 2364
-        0.10898795,  # 2365
-        0.10904811,  # 2366
-        0.1094078,  # 2367
-        0.10916328,  # 2368
-        0.10901073,  # 2369
-        0.10902507,  # 2370
-        0.10899678,  # 2371
-        0.10919069,  # 2372
-        0.10904662,  # 2373
-        0.10904988,  # 2374
-        0.10908749,  # 2375
-        0.10901911,  # 2376
-        0.10909815,  # 2377
-        0.10898897,  # 2378
-        0.10931606,  # 2379
-        0.10938992,  # 2380
-        0.10900697,  # 2381
-        0.10922192,  # 2382
-        0.10927538,  # 2383
-        0.10911696,  # 2384
-        0.10891493,  # 2385
-        0.1090359,  # 2386
-        0.10923474,  # 2387
-        0.1089557,  # 2388
-        0.10901973,  # 2389
-        0.10900911,  # 2390
-        0.10903453,  # 2391
-        0.10921535,  # 2392
-        0.10901661,  # 2393
-        0.10904929,  # 2394
-        0.109078,  # 2395
-        0.10912702,  # 2396
-        0.10922911,  # 2397
-        0.10911712,  # 2398
-        0.10933987,  # 2399
-        0.10924388,  # 2400
-        0.10906095,  # 2401
-        0.10912635,  # 2402
-        0.10920544,  # 2403
-        0.10921115,  # 2404
-        0.10921323,  # 2405
-        0.10920843,  # 2406
-        0.10940225,  # 2407
-        0.10909115,  # 2408
-        0.10906261,  # 2409
-        0.10907431,  # 2410
-        0.10891713,  # 2411
-        0.10918359,  # 2412
-        0.10906319,  # 2413
-        0.10934047,  # 2414
-        0.10935202,  # 2415
-        0.10914185,  # 2416
-        0.10958004,  # 2417
-        0.10948105,  # 2418
-        0.10957952,  # 2419
-        0.10925294,  # 2420
-        0.10899997,  # 2421
-        0.10951706,  # 2422
-        0.10941544,  # 2423
-        0.10928295,  # 2424
-        0.10883824,  # 2425
-        0.1089901,  # 2426
-        0.1094891,  # 2427
-        0.10966287,  # 2428
-        0.11007351,  # 2429
-        0.10948226,  # 2430
-        0.10927846,  # 2431
-        0.10955468,  # 2432
-        0.10915505,  # 2433
-        0.1092346,  # 2434
-        0.10933444,  # 2435
-        0.10929384,  # 2436
-        0.10974372,  # 2437
-        0.10935283,  # 2438
-        0.10947537,  # 2439
-        0.10931464,  # 2440
-        0.10914784,  # 2441
-        0.10893644,  # 2442
-        0.10869006,  # 2443
-        0.10955043,  # 2444
-        0.10939284,  # 2445
-        0.10940318,  # 2446
-        0.10968768,  # 2447
-        0.10944209,  # 2448
-        0.10935233,  # 2449
-        0.10917979,  # 2450
-        0.10909622,  # 2451
-        0.10923202,  # 2452
-        0.10910192,  # 2453
-        0.10979587,  # 2454
-        0.10919521,  # 2455
-        0.10891468,  # 2456
-        0.10904429,  # 2457
-        0.10892033,  # 2458
-        0.1098755,  # 2459
-        0.10919046,  # 2460
-        0.10949208,  # 2461
-        0.10956387,  # 2462
-        0.10860772,  # 2463
-        0.10911989,  # 2464
-        0.10920609,  # 2465
-        0.10893056,  # 2466
-        0.10982531,  # 2467
-        0.10902625,  # 2468
-        0.10947616,  # 2469
-        0.10934407,  # 2470
-        0.10859206,  # 2471
-        0.10931945,  # 2472
-        0.10849672,  # 2473
-        0.10922006,  # 2474
-        0.10922615,  # 2475
-        0.10897609,  # 2476
-        0.10931886,  # 2477
-        0.10803818,  # 2478
-        0.10801206,  # 2479
-        0.10915768,  # 2480
-        0.10789583,  # 2481
-        0.10931019,  # 2482
-        0.10838625,  # 2483
-        0.10900574,  # 2484
-        0.10892012,  # 2485
-        0.10850327,  # 2486
-        0.10944952,  # 2487
-        0.10917141,  # 2488
-        0.10951911,  # 2489
-        0.10917835,  # 2490
-        0.11085572,  # 2491
-        0.10979272,  # 2492
-        0.10808998,  # 2493
-        0.10941588,  # 2494
-        0.10741386,  # 2495
-        0.1053681,  # 2496
-        0.1118269,  # 2497
-        0.10945542,  # 2498
-        0.1117092,  # 2499
-        0.1055938,  # 2500
-    ]
-)
+The reflectance spectra of the panels, one coefficient per nanometer from 0 nm, are stored in
+``zenith_co.npz`` next to this module. They are only loaded on first use.
+"""
+import os
+from functools import lru_cache
 
+import numpy as np
 
-sg3144_batch2_coefficients = [0.0] * 250
-sg3144_batch2_coefficients.extend(
-    [
-        0.13493395,  # 250
-        0.13475176,  # 251
-        0.13442809,  # 252
-        0.13409514,  # 253
-        0.13378567,  # 254
-        0.1333892,  # 255
-        0.1332102,  # 256
-        0.13313243,  # 257
-        0.13288285,  # 258
-        0.13248156,  # 259
-        0.13216567,  # 260
-        0.13186561,  # 261
-        0.13164443,  # 262
-        0.13138059,  # 263
-        0.13101274,  # 264
-        0.13063261,  # 265
-        0.13035329,  # 266
-        0.13013014,  # 267
-        0.12998193,  # 268
-        0.12983949,  # 269
-        0.12939352,  # 270
-        0.12921016,  # 271
-        0.12886639,  # 272
-        0.12867657,  # 273
-        0.1287463,  # 274
-        0.12851805,  # 275
-        0.12820832,  # 276
-        0.12791157,  # 277
-        0.12771965,  # 278
-        0.12769653,  # 279
-        0.12752481,  # 280
-        0.12728902,  # 281
-        0.12708352,  # 282
-        0.12701145,  # 283
-        0.12671819,  # 284
-        0.12663829,  # 285
-        0.12659062,  # 286
-        0.12636756,  # 287
-        0.12612305,  # 288
-        0.12623963,  # 289
-        0.12611072,  # 290
-        0.12579364,  # 291
-        0.12556392,  # 292
-        0.12554931,  # 293
-        0.12539699,  # 294
-        0.12519826,  # 295
-        0.12536651,  # 296
-        0.1252988,  # 297
-        0.12484889,  # 298
-        0.1248408,  # 299
-        0.12474133,  # 300
-        0.1246517,  # 301
-        0.12455398,  # 302
-        0.12445425,  # 303
-        0.12411238,  # 304
-        0.12398305,  # 305
-        0.12396589,  # 306
-        0.12376923,  # 307
-        0.12368764,  # 308
-        0.12356064,  # 309
-        0.12312693,  # 310
-        0.12323435,  # 311
-        0.12320067,  # 312
-        0.12288204,  # 313
-        0.1226772,  # 314
-        0.12260315,  # 315
-        0.12247164,  # 316
-        0.12213799,  # 317
-        0.12200648,  # 318
-        0.1219497,  # 319
-        0.1216138,  # 320
-        0.12138776,  # 321
-        0.12161222,  # 322
-        0.12144099,  # 323
-        0.12120494,  # 324
-        0.12080593,  # 325
-        0.1208859,  # 326
-        0.12044732,  # 327
-        0.12032447,  # 328
-        0.12027243,  # 329
-        0.12040668,  # 330
-        0.12011404,  # 331
-        0.11972068,  # 332
-        0.1194635,  # 333
-        0.11954009,  # 334
-        0.11955292,  # 335
-        0.11945399,  # 336
-        0.11939449,  # 337
-        0.1190258,  # 338
-        0.11917037,  # 339
-        0.11907208,  # 340
-        0.11894794,  # 341
-        0.1187319,  # 342
-        0.11866781,  # 343
-        0.11849059,  # 344
-        0.11868679,  # 345
-        0.11839205,  # 346
-        0.11845626,  # 347
-        0.11826966,  # 348
-        0.11820933,  # 349
-        0.11812414,  # 350
-        0.11798771,  # 351
-        0.11788173,  # 352
-        0.1178426,  # 353
-        0.11779169,  # 354
-        0.11753981,  # 355
-        0.11764428,  # 356
-        0.11730259,  # 357
-        0.11740146,  # 358
-        0.1172398,  # 359
-        0.1172519,  # 360
-        0.11710137,  # 361
-        0.11719032,  # 362
-        0.11666489,  # 363
-        0.11671117,  # 364
-        0.11653849,  # 365
-        0.11665849,  # 366
-        0.11665863,  # 367
-        0.1164414,  # 368
-        0.11636058,  # 369
-        0.11634491,  # 370
-        0.11607128,  # 371
-        0.11618501,  # 372
-        0.1162059,  # 373
-        0.11584435,  # 374
-        0.11578305,  # 375
-        0.11592173,  # 376
-        0.11569083,  # 377
-        0.11591543,  # 378
-        0.11578064,  # 379
-        0.11574135,  # 380
-        0.11553594,  # 381
-        0.1156253,  # 382
-        0.11555824,  # 383
-        0.11531495,  # 384
-        0.11532962,  # 385
-        0.11528572,  # 386
-        0.115219,  # 387
-        0.11507015,  # 388
-        0.11506762,  # 389
-        0.1151296,  # 390
-        0.1149453,  # 391
-        0.11492642,  # 392
-        0.1148535,  # 393
-        0.11482571,  # 394
-        0.11473072,  # 395
-        0.11463384,  # 396
-        0.11457099,  # 397
-        0.11459466,  # 398
-        0.11436769,  # 399
-        0.11425307,  # 400
-        0.1141753,  # 401
-        0.11407154,  # 402
-        0.11409999,  # 403
-        0.11420144,  # 404
-        0.11406021,  # 405
-        0.11404699,  # 406
-        0.11391751,  # 407
-        0.11390301,  # 408
-        0.11396207,  # 409
-        0.11410358,  # 410
-        0.11394297,  # 411
-        0.11379649,  # 412
-        0.11369751,  # 413
-        0.1137361,  # 414
-        0.11380336,  # 415
-        0.11369061,  # 416
-        0.1136629,  # 417
-        0.11356886,  # 418
-        0.11329225,  # 419
-        0.11338785,  # 420
-        0.11332404,  # 421
-        0.11321741,  # 422
-        0.11318465,  # 423
-        0.11322353,  # 424
-        0.11304222,  # 425
-        0.11294163,  # 426
-        0.1128688,  # 427
-        0.11290647,  # 428
-        0.11276533,  # 429
-        0.11267727,  # 430
-        0.11264004,  # 431
-        0.11266691,  # 432
-        0.11258395,  # 433
-        0.11253501,  # 434
-        0.11260609,  # 435
-        0.1126366,  # 436
-        0.11255211,  # 437
-        0.11252015,  # 438
-        0.11247919,  # 439
-        0.11245826,  # 440
-        0.11244494,  # 441
-        0.11252494,  # 442
-        0.11237168,  # 443
-        0.11236283,  # 444
-        0.11240498,  # 445
-        0.1123095,  # 446
-        0.11231266,  # 447
-        0.11235946,  # 448
-        0.11232659,  # 449
-        0.11234472,  # 450
-        0.11236743,  # 451
-        0.11233194,  # 452
-        0.11236429,  # 453
-        0.11228915,  # 454
-        0.11226728,  # 455
-        0.11229466,  # 456
-        0.1122174,  # 457
-        0.11213676,  # 458
-        0.11206075,  # 459
-        0.11211863,  # 460
-        0.11207525,  # 461
-        0.11198728,  # 462
-        0.11195566,  # 463
-        0.11199959,  # 464
-        0.11203768,  # 465
-        0.11195632,  # 466
-        0.1119391,  # 467
-        0.11194459,  # 468
-        0.11192146,  # 469
-        0.11186467,  # 470
-        0.11183107,  # 471
-        0.11182566,  # 472
-        0.11174392,  # 473
-        0.1116004,  # 474
-        0.11157751,  # 475
-        0.11165095,  # 476
-        0.11163005,  # 477
-        0.11155511,  # 478
-        0.11154111,  # 479
-        0.11146617,  # 480
-        0.11145883,  # 481
-        0.11142851,  # 482
-        0.11134394,  # 483
-        0.11130852,  # 484
-        0.11127147,  # 485
-        0.11115571,  # 486
-        0.11105165,  # 487
-        0.11096651,  # 488
-        0.1109595,  # 489
-        0.11082237,  # 490
-        0.11081683,  # 491
-        0.11100712,  # 492
-        0.11099571,  # 493
-        0.11093515,  # 494
-        0.11097107,  # 495
-        0.11099045,  # 496
-        0.1109823,  # 497
-        0.11105817,  # 498
-        0.11110879,  # 499
-        0.11101495,  # 500
-        0.11102613,  # 501
-        0.11105201,  # 502
-        0.11105523,  # 503
-        0.11098674,  # 504
-        0.11097518,  # 505
-        0.11095445,  # 506
-        0.11097615,  # 507
-        0.1109736,  # 508
-        0.11101074,  # 509
-        0.11096433,  # 510
-        0.110965,  # 511
-        0.11092598,  # 512
-        0.11093512,  # 513
-        0.11087417,  # 514
-        0.11081071,  # 515
-        0.11068921,  # 516
-        0.11065039,  # 517
-        0.11064293,  # 518
-        0.11068687,  # 519
-        0.11070384,  # 520
-        0.11074773,  # 521
-        0.11075827,  # 522
-        0.11070045,  # 523
-        0.11070867,  # 524
-        0.1105818,  # 525
-        0.11046888,  # 526
-        0.11048025,  # 527
-        0.11056318,  # 528
-        0.11048162,  # 529
-        0.1105093,  # 530
-        0.11045907,  # 531
-        0.11040331,  # 532
-        0.11046327,  # 533
-        0.11039869,  # 534
-        0.11023067,  # 535
-        0.11022682,  # 536
-        0.11028211,  # 537
-        0.11026358,  # 538
-        0.11029919,  # 539
-        0.11021674,  # 540
-        0.11019994,  # 541
-        0.11011338,  # 542
-        0.11007219,  # 543
-        0.10995906,  # 544
-        0.10993308,  # 545
-        0.10998331,  # 546
-        0.11007477,  # 547
-        0.10996424,  # 548
-        0.10983963,  # 549
-        0.10989422,  # 550
-        0.10995607,  # 551
-        0.10985414,  # 552
-        0.10990153,  # 553
-        0.10983341,  # 554
-        0.10986478,  # 555
-        0.10979544,  # 556
-        0.10977863,  # 557
-        0.10961769,  # 558
-        0.1097182,  # 559
-        0.1096772,  # 560
-        0.10968319,  # 561
-        0.10979578,  # 562
-        0.10969971,  # 563
-        0.10962827,  # 564
-        0.10948305,  # 565
-        0.10964471,  # 566
-        0.10965383,  # 567
-        0.10953271,  # 568
-        0.1096817,  # 569
-        0.10964079,  # 570
-        0.10959664,  # 571
-        0.10941468,  # 572
-        0.10940993,  # 573
-        0.10944022,  # 574
-        0.10939968,  # 575
-        0.10957143,  # 576
-        0.10943268,  # 577
-        0.10930161,  # 578
-        0.10932797,  # 579
-        0.10928756,  # 580
-        0.10935143,  # 581
-        0.10910493,  # 582
-        0.10915674,  # 583
-        0.10924669,  # 584
-        0.10922955,  # 585
-        0.10925075,  # 586
-        0.10920699,  # 587
-        0.1091776,  # 588
-        0.10908214,  # 589
-        0.10914699,  # 590
-        0.10924728,  # 591
-        0.10922398,  # 592
-        0.10923743,  # 593
-        0.10921529,  # 594
-        0.10904861,  # 595
-        0.10896732,  # 596
-        0.10888838,  # 597
-        0.10888082,  # 598
-        0.10877981,  # 599
-        0.10890477,  # 600
-        0.10905755,  # 601
-        0.10889833,  # 602
-        0.10903992,  # 603
-        0.10879602,  # 604
-        0.10889084,  # 605
-        0.1088231,  # 606
-        0.10874247,  # 607
-        0.10873935,  # 608
-        0.10877711,  # 609
-        0.10875855,  # 610
-        0.10879789,  # 611
-        0.10883384,  # 612
-        0.10884517,  # 613
-        0.10866636,  # 614
-        0.1085785,  # 615
-        0.1087243,  # 616
-        0.1087554,  # 617
-        0.10875301,  # 618
-        0.10863944,  # 619
-        0.10857973,  # 620
-        0.10858965,  # 621
-        0.10863814,  # 622
-        0.10859892,  # 623
-        0.1085249,  # 624
-        0.10853778,  # 625
-        0.10838112,  # 626
-        0.10837582,  # 627
-        0.10852083,  # 628
-        0.1084324,  # 629
-        0.10836865,  # 630
-        0.1084061,  # 631
-        0.10841987,  # 632
-        0.10836985,  # 633
-        0.10828718,  # 634
-        0.10829911,  # 635
-        0.10833195,  # 636
-        0.10836786,  # 637
-        0.10837753,  # 638
-        0.10837377,  # 639
-        0.10825521,  # 640
-        0.10833106,  # 641
-        0.10820748,  # 642
-        0.10825248,  # 643
-        0.10829497,  # 644
-        0.10828147,  # 645
-        0.10840362,  # 646
-        0.10826641,  # 647
-        0.1081513,  # 648
-        0.10825848,  # 649
-        0.10819064,  # 650
-        0.10813374,  # 651
-        0.10815853,  # 652
-        0.10818961,  # 653
-        0.10811192,  # 654
-        0.10807042,  # 655
-        0.1080816,  # 656
-        0.10812053,  # 657
-        0.10810137,  # 658
-        0.10800756,  # 659
-        0.10806981,  # 660
-        0.10805595,  # 661
-        0.10794443,  # 662
-        0.10796601,  # 663
-        0.10802985,  # 664
-        0.10790939,  # 665
-        0.10772843,  # 666
-        0.10785773,  # 667
-        0.10790015,  # 668
-        0.10775779,  # 669
-        0.10785082,  # 670
-        0.10785601,  # 671
-        0.10769531,  # 672
-        0.10764734,  # 673
-        0.10772209,  # 674
-        0.10774733,  # 675
-        0.10759817,  # 676
-        0.10768487,  # 677
-        0.10774666,  # 678
-        0.1076855,  # 679
-        0.10775213,  # 680
-        0.10781129,  # 681
-        0.10776625,  # 682
-        0.10769219,  # 683
-        0.10769004,  # 684
-        0.10770203,  # 685
-        0.10753803,  # 686
-        0.10762474,  # 687
-        0.10766505,  # 688
-        0.10757003,  # 689
-        0.10759184,  # 690
-        0.10755173,  # 691
-        0.10760448,  # 692
-        0.10765752,  # 693
-        0.10742627,  # 694
-        0.10740831,  # 695
-        0.10749892,  # 696
-        0.1074828,  # 697
-        0.10748751,  # 698
-        0.10733883,  # 699
-        0.10741575,  # 700
-        0.1076316,  # 701
-        0.10742601,  # 702
-        0.10732819,  # 703
-        0.10736912,  # 704
-        0.10734862,  # 705
-        0.10727153,  # 706
-        0.10724982,  # 707
-        0.10734818,  # 708
-        0.10742407,  # 709
-        0.10750359,  # 710
-        0.10754065,  # 711
-        0.1073989,  # 712
-        0.10734228,  # 713
-        0.10731713,  # 714
-        0.10713042,  # 715
-        0.1070204,  # 716
-        0.10703579,  # 717
-        0.10731255,  # 718
-        0.10723518,  # 719
-        0.10719095,  # 720
-        0.10723074,  # 721
-        0.10709199,  # 722
-        0.10713879,  # 723
-        0.10710771,  # 724
-        0.1071028,  # 725
-        0.10720862,  # 726
-        0.10730342,  # 727
-        0.10708839,  # 728
-        0.10680631,  # 729
-        0.10690784,  # 730
-        0.10696925,  # 731
-        0.10693605,  # 732
-        0.10710721,  # 733
-        0.10695901,  # 734
-        0.10687486,  # 735
-        0.10680283,  # 736
-        0.10703586,  # 737
-        0.10702383,  # 738
-        0.10698481,  # 739
-        0.10684268,  # 740
-        0.10707307,  # 741
-        0.10698716,  # 742
-        0.10685766,  # 743
-        0.10678936,  # 744
-        0.10699824,  # 745
-        0.10700363,  # 746
-        0.10672471,  # 747
-        0.1069304,  # 748
-        0.10666535,  # 749
-        0.10681725,  # 750
-        0.10669477,  # 751
-        0.10660455,  # 752
-        0.10659062,  # 753
-        0.10658483,  # 754
-        0.10649411,  # 755
-        0.10672882,  # 756
-        0.10683097,  # 757
-        0.10656875,  # 758
-        0.10660464,  # 759
-        0.10697787,  # 760
-        0.10664467,  # 761
-        0.10646891,  # 762
-        0.10632498,  # 763
-        0.10649149,  # 764
-        0.10682115,  # 765
-        0.10668535,  # 766
-        0.1067359,  # 767
-        0.10654081,  # 768
-        0.10664805,  # 769
-        0.10650426,  # 770
-        0.10635054,  # 771
-        0.10658264,  # 772
-        0.10643152,  # 773
-        0.10668005,  # 774
-        0.10667199,  # 775
-        0.10659591,  # 776
-        0.10659385,  # 777
-        0.10650069,  # 778
-        0.10642758,  # 779
-        0.10643266,  # 780
-        0.10642198,  # 781
-        0.10648476,  # 782
-        0.10626722,  # 783
-        0.10657032,  # 784
-        0.10669204,  # 785
-        0.10661047,  # 786
-        0.10639979,  # 787
-        0.1067544,  # 788
-        0.10639579,  # 789
-        0.10663832,  # 790
-        0.10636983,  # 791
-        0.1064647,  # 792
-        0.10647463,  # 793
-        0.10627504,  # 794
-        0.10624055,  # 795
-        0.10627976,  # 796
-        0.10616162,  # 797
-        0.1064094,  # 798
-        0.10622973,  # 799
-        0.10638483,  # 800
-        0.10649906,  # 801
-        0.10622722,  # 802
-        0.10628006,  # 803
-        0.10599932,  # 804
-        0.10617105,  # 805
-        0.10635295,  # 806
-        0.10652946,  # 807
-        0.10611049,  # 808
-        0.10623184,  # 809
-        0.10637648,  # 810
-        0.10638181,  # 811
-        0.10625265,  # 812
-        0.10639514,  # 813
-        0.10631905,  # 814
-        0.10636456,  # 815
-        0.1064198,  # 816
-        0.10599564,  # 817
-        0.10571217,  # 818
-        0.10626071,  # 819
-        0.10527773,  # 820
-        0.10503551,  # 821
-        0.10522881,  # 822
-        0.10525031,  # 823
-        0.10519554,  # 824
-        0.10515129,  # 825
-        0.10546841,  # 826
-        0.10517868,  # 827
-        0.10526574,  # 828
-        0.10515267,  # 829
-        0.10513645,  # 830
-        0.10508168,  # 831
-        0.10492365,  # 832
-        0.10505946,  # 833
-        0.10488665,  # 834
-        0.10505627,  # 835
-        0.10497065,  # 836
-        0.10496486,  # 837
-        0.10473968,  # 838
-        0.10496466,  # 839
-        0.1050492,  # 840
-        0.10496434,  # 841
-        0.10487104,  # 842
-        0.10484306,  # 843
-        0.10489515,  # 844
-        0.10473236,  # 845
-        0.10478773,  # 846
-        0.10475988,  # 847
-        0.1049171,  # 848
-        0.10488445,  # 849
-        0.10503796,  # 850
-        0.10490397,  # 851
-        0.10474536,  # 852
-        0.10488344,  # 853
-        0.10492132,  # 854
-        0.10503568,  # 855
-        0.10487475,  # 856
-        0.10486475,  # 857
-        0.10484292,  # 858
-        0.10482415,  # 859
-        0.10492124,  # 860
-        0.10489694,  # 861
-        0.10500494,  # 862
-        0.10485803,  # 863
-        0.10487915,  # 864
-        0.1048451,  # 865
-        0.10479038,  # 866
-        0.10488561,  # 867
-        0.10487473,  # 868
-        0.10479228,  # 869
-        0.10474003,  # 870
-        0.10481447,  # 871
-        0.10482071,  # 872
-        0.10481751,  # 873
-        0.10469212,  # 874
-        0.10471353,  # 875
-        0.10468641,  # 876
-        0.10474199,  # 877
-        0.10477956,  # 878
-        0.10470539,  # 879
-        0.10479522,  # 880
-        0.10486443,  # 881
-        0.10480567,  # 882
-        0.10477106,  # 883
-        0.1048271,  # 884
-        0.10481624,  # 885
-        0.10483812,  # 886
-        0.10478262,  # 887
-        0.10478362,  # 888
-        0.10480482,  # 889
-        0.10477355,  # 890
-        0.10483207,  # 891
-        0.10478521,  # 892
-        0.10480011,  # 893
-        0.10475969,  # 894
-        0.10477662,  # 895
-        0.10471566,  # 896
-        0.10470627,  # 897
-        0.10477942,  # 898
-        0.10478923,  # 899
-        0.10482897,  # 900
-        0.10471996,  # 901
-        0.10476795,  # 902
-        0.10478088,  # 903
-        0.10477801,  # 904
-        0.10477994,  # 905
-        0.10476675,  # 906
-        0.10473875,  # 907
-        0.10475234,  # 908
-        0.10468257,  # 909
-        0.10468985,  # 910
-        0.10468632,  # 911
-        0.10467951,  # 912
-        0.1046369,  # 913
-        0.10466457,  # 914
-        0.10462229,  # 915
-        0.10462269,  # 916
-        0.10464801,  # 917
-        0.10463866,  # 918
-        0.10462131,  # 919
-        0.1046171,  # 920
-        0.10458745,  # 921
-        0.10457656,  # 922
-        0.10459046,  # 923
-        0.10457079,  # 924
-        0.10456588,  # 925
-        0.10457731,  # 926
-        0.10454557,  # 927
-        0.10454562,  # 928
-        0.10458039,  # 929
-        0.1045654,  # 930
-        0.10447722,  # 931
-        0.10442168,  # 932
-        0.10445161,  # 933
-        0.1045037,  # 934
-        0.10448101,  # 935
-        0.10448923,  # 936
-        0.10447955,  # 937
-        0.10444158,  # 938
-        0.1044289,  # 939
-        0.10440461,  # 940
-        0.10440467,  # 941
-        0.1045135,  # 942
-        0.10454976,  # 943
-        0.10441736,  # 944
-        0.1044513,  # 945
-        0.10449812,  # 946
-        0.10443121,  # 947
-        0.1045226,  # 948
-        0.10453067,  # 949
-        0.10445465,  # 950
-        0.10446471,  # 951
-        0.10457511,  # 952
-        0.10465279,  # 953
-        0.10453034,  # 954
-        0.10452689,  # 955
-        0.10461684,  # 956
-        0.10450349,  # 957
-        0.10453214,  # 958
-        0.10469141,  # 959
-        0.10463157,  # 960
-        0.10457021,  # 961
-        0.10463061,  # 962
-        0.10472274,  # 963
-        0.10464426,  # 964
-        0.10466293,  # 965
-        0.10460532,  # 966
-        0.10455049,  # 967
-        0.1045773,  # 968
-        0.10466168,  # 969
-        0.10461295,  # 970
-        0.1044881,  # 971
-        0.10457432,  # 972
-        0.10464532,  # 973
-        0.10462776,  # 974
-        0.10470587,  # 975
-        0.10455718,  # 976
-        0.10456536,  # 977
-        0.10462191,  # 978
-        0.10460715,  # 979
-        0.10466664,  # 980
-        0.10451509,  # 981
-        0.10456344,  # 982
-        0.10457746,  # 983
-        0.10450335,  # 984
-        0.10463166,  # 985
-        0.10456676,  # 986
-        0.10445516,  # 987
-        0.1045296,  # 988
-        0.1044676,  # 989
-        0.10458833,  # 990
-        0.10479484,  # 991
-        0.10445099,  # 992
-        0.10449752,  # 993
-        0.1044167,  # 994
-        0.10444027,  # 995
-        0.10463305,  # 996
-        0.10449991,  # 997
-        0.10442137,  # 998
-        0.10446537,  # 999
-        0.10442555,  # 1000
-        0.10438027,  # 1001
-        0.10458779,  # 1002
-        0.10434256,  # 1003
-        0.10444327,  # 1004
-        0.10457243,  # 1005
-        0.1043231,  # 1006
-        0.10452243,  # 1007
-        0.10453486,  # 1008
-        0.10430189,  # 1009
-        0.10442672,  # 1010
-        0.10445483,  # 1011
-        0.1044118,  # 1012
-        0.10440879,  # 1013
-        0.10439383,  # 1014
-        0.10451327,  # 1015
-        0.10424039,  # 1016
-        0.10444712,  # 1017
-        0.10442615,  # 1018
-        0.10427242,  # 1019
-        0.10437009,  # 1020
-        0.10442439,  # 1021
-        0.10451994,  # 1022
-        0.10423525,  # 1023
-        0.10440466,  # 1024
-        0.10440737,  # 1025
-        0.10443199,  # 1026
-        0.10415831,  # 1027
-        0.10441827,  # 1028
-        0.10440032,  # 1029
-        0.10444805,  # 1030
-        0.10410606,  # 1031
-        0.1044545,  # 1032
-        0.10438258,  # 1033
-        0.10446086,  # 1034
-        0.10406334,  # 1035
-        0.10441658,  # 1036
-        0.10432095,  # 1037
-        0.1044214,  # 1038
-        0.10413315,  # 1039
-        0.10431969,  # 1040
-        0.10445619,  # 1041
-        0.10432471,  # 1042
-        0.10439985,  # 1043
-        0.10422288,  # 1044
-        0.10428342,  # 1045
-        0.10446229,  # 1046
-        0.10420088,  # 1047
-        0.10444245,  # 1048
-        0.10407716,  # 1049
-        0.10425823,  # 1050
-        0.10445734,  # 1051
-        0.10431626,  # 1052
-        0.10438202,  # 1053
-        0.10399503,  # 1054
-        0.10426589,  # 1055
-        0.10430965,  # 1056
-        0.10424109,  # 1057
-        0.10435643,  # 1058
-        0.10402902,  # 1059
-        0.10413924,  # 1060
-        0.1041439,  # 1061
-        0.10430721,  # 1062
-        0.10419491,  # 1063
-        0.10433232,  # 1064
-        0.10421115,  # 1065
-        0.10393236,  # 1066
-        0.10414942,  # 1067
-        0.10422239,  # 1068
-        0.104295,  # 1069
-        0.10421551,  # 1070
-        0.10433763,  # 1071
-        0.10410467,  # 1072
-        0.10402322,  # 1073
-        0.10420066,  # 1074
-        0.10424624,  # 1075
-        0.10423501,  # 1076
-        0.10427436,  # 1077
-        0.10401637,  # 1078
-        0.10401043,  # 1079
-        0.104148,  # 1080
-        0.10423694,  # 1081
-        0.1041604,  # 1082
-        0.10424403,  # 1083
-        0.10409793,  # 1084
-        0.10404644,  # 1085
-        0.10415991,  # 1086
-        0.10421996,  # 1087
-        0.10416729,  # 1088
-        0.10416873,  # 1089
-        0.10422881,  # 1090
-        0.10403849,  # 1091
-        0.10405962,  # 1092
-        0.10411246,  # 1093
-        0.10411671,  # 1094
-        0.10421837,  # 1095
-        0.10410399,  # 1096
-        0.10415409,  # 1097
-        0.10419557,  # 1098
-        0.10393944,  # 1099
-        0.10403618,  # 1100
-        0.10404675,  # 1101
-        0.10411406,  # 1102
-        0.10422906,  # 1103
-        0.10408248,  # 1104
-        0.10413553,  # 1105
-        0.10410092,  # 1106
-        0.10416011,  # 1107
-        0.10419985,  # 1108
-        0.10410841,  # 1109
-        0.10415777,  # 1110
-        0.10412822,  # 1111
-        0.10413557,  # 1112
-        0.10409761,  # 1113
-        0.10410902,  # 1114
-        0.10412298,  # 1115
-        0.10407949,  # 1116
-        0.10407834,  # 1117
-        0.10410799,  # 1118
-        0.10407171,  # 1119
-        0.10409067,  # 1120
-        0.10397692,  # 1121
-        0.10387242,  # 1122
-        0.1040816,  # 1123
-        0.1040691,  # 1124
-        0.10401869,  # 1125
-        0.1039865,  # 1126
-        0.10399385,  # 1127
-        0.10400965,  # 1128
-        0.10408854,  # 1129
-        0.10403493,  # 1130
-        0.1040788,  # 1131
-        0.10395199,  # 1132
-        0.10387937,  # 1133
-        0.10410851,  # 1134
-        0.10402375,  # 1135
-        0.10402871,  # 1136
-        0.10407038,  # 1137
-        0.10397354,  # 1138
-        0.10392232,  # 1139
-        0.10387879,  # 1140
-        0.10394143,  # 1141
-        0.10388763,  # 1142
-        0.10383054,  # 1143
-        0.10391006,  # 1144
-        0.10388347,  # 1145
-        0.10390545,  # 1146
-        0.10393595,  # 1147
-        0.10398873,  # 1148
-        0.10393053,  # 1149
-        0.10390648,  # 1150
-        0.10397431,  # 1151
-        0.10390373,  # 1152
-        0.10375474,  # 1153
-        0.10381101,  # 1154
-        0.10385439,  # 1155
-        0.10385472,  # 1156
-        0.1039215,  # 1157
-        0.10395608,  # 1158
-        0.10388341,  # 1159
-        0.10390629,  # 1160
-        0.10388315,  # 1161
-        0.10384022,  # 1162
-        0.1038534,  # 1163
-        0.10382121,  # 1164
-        0.10381627,  # 1165
-        0.10382,  # 1166
-        0.10377864,  # 1167
-        0.10378515,  # 1168
-        0.10382688,  # 1169
-        0.10383568,  # 1170
-        0.10380637,  # 1171
-        0.10376283,  # 1172
-        0.10378542,  # 1173
-        0.10379564,  # 1174
-        0.10383566,  # 1175
-        0.10383012,  # 1176
-        0.10387465,  # 1177
-        0.10385744,  # 1178
-        0.10378041,  # 1179
-        0.10377817,  # 1180
-        0.10374323,  # 1181
-        0.10376942,  # 1182
-        0.10377754,  # 1183
-        0.1037678,  # 1184
-        0.10374812,  # 1185
-        0.10374248,  # 1186
-        0.10375753,  # 1187
-        0.10375146,  # 1188
-        0.10374213,  # 1189
-        0.10375437,  # 1190
-        0.1036868,  # 1191
-        0.10367926,  # 1192
-        0.10380758,  # 1193
-        0.10369897,  # 1194
-        0.10376027,  # 1195
-        0.10375293,  # 1196
-        0.10381377,  # 1197
-        0.10380104,  # 1198
-        0.10379372,  # 1199
-        0.10367591,  # 1200
-        0.10365695,  # 1201
-        0.10378251,  # 1202
-        0.10373791,  # 1203
-        0.10368423,  # 1204
-        0.10365485,  # 1205
-        0.10373055,  # 1206
-        0.10372496,  # 1207
-        0.10372989,  # 1208
-        0.10369679,  # 1209
-        0.10367652,  # 1210
-        0.10356054,  # 1211
-        0.10363978,  # 1212
-        0.10367892,  # 1213
-        0.10362178,  # 1214
-        0.10358106,  # 1215
-        0.10382736,  # 1216
-        0.10357228,  # 1217
-        0.10335337,  # 1218
-        0.10368458,  # 1219
-        0.10380247,  # 1220
-        0.10364751,  # 1221
-        0.10354635,  # 1222
-        0.10343533,  # 1223
-        0.10371102,  # 1224
-        0.10363454,  # 1225
-        0.10362226,  # 1226
-        0.10362306,  # 1227
-        0.10360282,  # 1228
-        0.10358347,  # 1229
-        0.10360586,  # 1230
-        0.10361726,  # 1231
-        0.10353676,  # 1232
-        0.10354036,  # 1233
-        0.10364402,  # 1234
-        0.10348762,  # 1235
-        0.1035148,  # 1236
-        0.10361771,  # 1237
-        0.10356278,  # 1238
-        0.10359593,  # 1239
-        0.10347897,  # 1240
-        0.10346391,  # 1241
-        0.10362888,  # 1242
-        0.10365195,  # 1243
-        0.10354294,  # 1244
-        0.10350988,  # 1245
-        0.10355471,  # 1246
-        0.10345989,  # 1247
-        0.10350646,  # 1248
-        0.10351118,  # 1249
-        0.10350786,  # 1250
-        0.10354412,  # 1251
-        0.10349943,  # 1252
-        0.10352359,  # 1253
-        0.10349596,  # 1254
-        0.10338912,  # 1255
-        0.10344104,  # 1256
-        0.10346293,  # 1257
-        0.10359503,  # 1258
-        0.10348876,  # 1259
-        0.10333852,  # 1260
-        0.10348591,  # 1261
-        0.10344798,  # 1262
-        0.10346358,  # 1263
-        0.10359627,  # 1264
-        0.10353062,  # 1265
-        0.10325697,  # 1266
-        0.1034155,  # 1267
-        0.10347142,  # 1268
-        0.1034749,  # 1269
-        0.10341966,  # 1270
-        0.10341958,  # 1271
-        0.10344205,  # 1272
-        0.10342199,  # 1273
-        0.10343549,  # 1274
-        0.10327222,  # 1275
-        0.10344945,  # 1276
-        0.10339343,  # 1277
-        0.10356242,  # 1278
-        0.10335103,  # 1279
-        0.1033331,  # 1280
-        0.1034097,  # 1281
-        0.10325093,  # 1282
-        0.10337073,  # 1283
-        0.10338545,  # 1284
-        0.1034764,  # 1285
-        0.10337412,  # 1286
-        0.10324804,  # 1287
-        0.10344043,  # 1288
-        0.10337692,  # 1289
-        0.10335728,  # 1290
-        0.10336272,  # 1291
-        0.1033061,  # 1292
-        0.10332715,  # 1293
-        0.10333094,  # 1294
-        0.10331249,  # 1295
-        0.10337817,  # 1296
-        0.1033015,  # 1297
-        0.10326161,  # 1298
-        0.10331696,  # 1299
-        0.10332654,  # 1300
-        0.10339979,  # 1301
-        0.10332104,  # 1302
-        0.10322898,  # 1303
-        0.10337219,  # 1304
-        0.10319432,  # 1305
-        0.1032487,  # 1306
-        0.10326544,  # 1307
-        0.10336231,  # 1308
-        0.10324581,  # 1309
-        0.10305139,  # 1310
-        0.10330313,  # 1311
-        0.10330433,  # 1312
-        0.10325028,  # 1313
-        0.1031871,  # 1314
-        0.10323142,  # 1315
-        0.10320771,  # 1316
-        0.10317718,  # 1317
-        0.10322433,  # 1318
-        0.10323829,  # 1319
-        0.10324174,  # 1320
-        0.10321148,  # 1321
-        0.10320075,  # 1322
-        0.10320297,  # 1323
-        0.10309876,  # 1324
-        0.10317262,  # 1325
-        0.10318386,  # 1326
-        0.10324021,  # 1327
-        0.10311465,  # 1328
-        0.10308444,  # 1329
-        0.10321902,  # 1330
-        0.10311933,  # 1331
-        0.10311851,  # 1332
-        0.10313381,  # 1333
-        0.10317379,  # 1334
-        0.10309305,  # 1335
-        0.10310068,  # 1336
-        0.10310128,  # 1337
-        0.10309545,  # 1338
-        0.10310088,  # 1339
-        0.10312133,  # 1340
-        0.10313573,  # 1341
-        0.10307422,  # 1342
-        0.10299818,  # 1343
-        0.10317228,  # 1344
-        0.10305627,  # 1345
-        0.10301195,  # 1346
-        0.10307839,  # 1347
-        0.10300066,  # 1348
-        0.10314153,  # 1349
-        0.10302776,  # 1350
-        0.10301054,  # 1351
-        0.10299756,  # 1352
-        0.10295835,  # 1353
-        0.10294216,  # 1354
-        0.10302294,  # 1355
-        0.10283596,  # 1356
-        0.10279776,  # 1357
-        0.10291279,  # 1358
-        0.10283968,  # 1359
-        0.10282479,  # 1360
-        0.10281942,  # 1361
-        0.1028342,  # 1362
-        0.10281287,  # 1363
-        0.10280173,  # 1364
-        0.10282229,  # 1365
-        0.10272058,  # 1366
-        0.10274516,  # 1367
-        0.10286048,  # 1368
-        0.10287026,  # 1369
-        0.10274208,  # 1370
-        0.10277867,  # 1371
-        0.10280446,  # 1372
-        0.10279363,  # 1373
-        0.10274894,  # 1374
-        0.10266917,  # 1375
-        0.10265943,  # 1376
-        0.10274533,  # 1377
-        0.10269318,  # 1378
-        0.10270522,  # 1379
-        0.10265354,  # 1380
-        0.10255019,  # 1381
-        0.10254554,  # 1382
-        0.10259574,  # 1383
-        0.10258876,  # 1384
-        0.10268488,  # 1385
-        0.10271197,  # 1386
-        0.10269588,  # 1387
-        0.10260428,  # 1388
-        0.10278017,  # 1389
-        0.1028114,  # 1390
-        0.10252279,  # 1391
-        0.10249462,  # 1392
-        0.10262449,  # 1393
-        0.10260056,  # 1394
-        0.10256889,  # 1395
-        0.1025975,  # 1396
-        0.1026002,  # 1397
-        0.10257455,  # 1398
-        0.10257285,  # 1399
-        0.10254194,  # 1400
-        0.10264033,  # 1401
-        0.10265178,  # 1402
-        0.10256412,  # 1403
-        0.10254021,  # 1404
-        0.1025215,  # 1405
-        0.10253318,  # 1406
-        0.10252992,  # 1407
-        0.10249001,  # 1408
-        0.10250451,  # 1409
-        0.10252996,  # 1410
-        0.1025154,  # 1411
-        0.1025283,  # 1412
-        0.10250239,  # 1413
-        0.10251523,  # 1414
-        0.10254566,  # 1415
-        0.10249717,  # 1416
-        0.10248408,  # 1417
-        0.10251643,  # 1418
-        0.10246356,  # 1419
-        0.10247521,  # 1420
-        0.10249387,  # 1421
-        0.10250542,  # 1422
-        0.10248247,  # 1423
-        0.10247535,  # 1424
-        0.10250463,  # 1425
-        0.10248772,  # 1426
-        0.10250015,  # 1427
-        0.1024706,  # 1428
-        0.10246557,  # 1429
-        0.10248396,  # 1430
-        0.1025058,  # 1431
-        0.10248129,  # 1432
-        0.10246515,  # 1433
-        0.10235855,  # 1434
-        0.10241671,  # 1435
-        0.10257352,  # 1436
-        0.10256012,  # 1437
-        0.1024784,  # 1438
-        0.10247654,  # 1439
-        0.10238149,  # 1440
-        0.1024163,  # 1441
-        0.10248365,  # 1442
-        0.10243387,  # 1443
-        0.10247841,  # 1444
-        0.10247084,  # 1445
-        0.10241199,  # 1446
-        0.10239217,  # 1447
-        0.10237687,  # 1448
-        0.10239155,  # 1449
-        0.10233633,  # 1450
-        0.10239425,  # 1451
-        0.10240888,  # 1452
-        0.1023113,  # 1453
-        0.10237583,  # 1454
-        0.10236504,  # 1455
-        0.1024663,  # 1456
-        0.10244338,  # 1457
-        0.10240991,  # 1458
-        0.10240289,  # 1459
-        0.10225584,  # 1460
-        0.10251909,  # 1461
-        0.10248464,  # 1462
-        0.10243525,  # 1463
-        0.10223603,  # 1464
-        0.1024925,  # 1465
-        0.10223307,  # 1466
-        0.10247167,  # 1467
-        0.10240067,  # 1468
-        0.10221181,  # 1469
-        0.10233272,  # 1470
-        0.10246626,  # 1471
-        0.10224412,  # 1472
-        0.10233774,  # 1473
-        0.1024779,  # 1474
-        0.10235855,  # 1475
-        0.10241538,  # 1476
-        0.10231636,  # 1477
-        0.10238159,  # 1478
-        0.1021638,  # 1479
-        0.10227642,  # 1480
-        0.10234017,  # 1481
-        0.10239643,  # 1482
-        0.10236768,  # 1483
-        0.10238354,  # 1484
-        0.10234616,  # 1485
-        0.10229289,  # 1486
-        0.10231199,  # 1487
-        0.10231249,  # 1488
-        0.10228843,  # 1489
-        0.10231775,  # 1490
-        0.10233693,  # 1491
-        0.10227036,  # 1492
-        0.10232008,  # 1493
-        0.1023388,  # 1494
-        0.10227915,  # 1495
-        0.1023739,  # 1496
-        0.10228991,  # 1497
-        0.10231667,  # 1498
-        0.10229579,  # 1499
-        0.10236286,  # 1500
-        0.10227387,  # 1501
-        0.10230009,  # 1502
-        0.1022735,  # 1503
-        0.10228065,  # 1504
-        0.10224104,  # 1505
-        0.10230712,  # 1506
-        0.10250624,  # 1507
-        0.10229219,  # 1508
-        0.10233602,  # 1509
-        0.10240855,  # 1510
-        0.10214563,  # 1511
-        0.10220439,  # 1512
-        0.10232218,  # 1513
-        0.10213958,  # 1514
-        0.10229424,  # 1515
-        0.10226809,  # 1516
-        0.10250456,  # 1517
-        0.10230707,  # 1518
-        0.10221387,  # 1519
-        0.10227232,  # 1520
-        0.10232919,  # 1521
-        0.10217698,  # 1522
-        0.10227234,  # 1523
-        0.10237999,  # 1524
-        0.1024503,  # 1525
-        0.10215753,  # 1526
-        0.10231993,  # 1527
-        0.10210154,  # 1528
-        0.10225794,  # 1529
-        0.10237712,  # 1530
-        0.10227589,  # 1531
-        0.10222954,  # 1532
-        0.10222468,  # 1533
-        0.10221503,  # 1534
-        0.1021182,  # 1535
-        0.10224401,  # 1536
-        0.10226149,  # 1537
-        0.10244403,  # 1538
-        0.10240539,  # 1539
-        0.10209865,  # 1540
-        0.10219991,  # 1541
-        0.10219962,  # 1542
-        0.102044,  # 1543
-        0.10228792,  # 1544
-        0.10220297,  # 1545
-        0.10226147,  # 1546
-        0.10226266,  # 1547
-        0.10239422,  # 1548
-        0.10218042,  # 1549
-        0.10219835,  # 1550
-        0.10219544,  # 1551
-        0.10238954,  # 1552
-        0.102191,  # 1553
-        0.10201345,  # 1554
-        0.10222682,  # 1555
-        0.10223397,  # 1556
-        0.10222184,  # 1557
-        0.10216533,  # 1558
-        0.10216049,  # 1559
-        0.10216986,  # 1560
-        0.10216562,  # 1561
-        0.10205715,  # 1562
-        0.10223016,  # 1563
-        0.10222662,  # 1564
-        0.1021858,  # 1565
-        0.10220372,  # 1566
-        0.10221768,  # 1567
-        0.10225357,  # 1568
-        0.10232344,  # 1569
-        0.10216746,  # 1570
-        0.10227139,  # 1571
-        0.10233951,  # 1572
-        0.10204814,  # 1573
-        0.10219405,  # 1574
-        0.10214467,  # 1575
-        0.10211877,  # 1576
-        0.10224174,  # 1577
-        0.1022746,  # 1578
-        0.10234442,  # 1579
-        0.10225976,  # 1580
-        0.10233582,  # 1581
-        0.10208973,  # 1582
-        0.10213323,  # 1583
-        0.10207822,  # 1584
-        0.10221012,  # 1585
-        0.10228364,  # 1586
-        0.10230323,  # 1587
-        0.10218373,  # 1588
-        0.10219167,  # 1589
-        0.10212094,  # 1590
-        0.10222063,  # 1591
-        0.10233221,  # 1592
-        0.10225917,  # 1593
-        0.10209106,  # 1594
-        0.1021097,  # 1595
-        0.10201604,  # 1596
-        0.10221608,  # 1597
-        0.10228756,  # 1598
-        0.10221101,  # 1599
-        0.10209848,  # 1600
-        0.10218738,  # 1601
-        0.10208648,  # 1602
-        0.10216059,  # 1603
-        0.10224437,  # 1604
-        0.10218894,  # 1605
-        0.10204847,  # 1606
-        0.10209043,  # 1607
-        0.10204832,  # 1608
-        0.1021252,  # 1609
-        0.10217007,  # 1610
-        0.10221701,  # 1611
-        0.10221977,  # 1612
-        0.10222689,  # 1613
-        0.10204826,  # 1614
-        0.10205572,  # 1615
-        0.10201026,  # 1616
-        0.10214974,  # 1617
-        0.10215997,  # 1618
-        0.10220002,  # 1619
-        0.10216963,  # 1620
-        0.10215503,  # 1621
-        0.10217866,  # 1622
-        0.10207977,  # 1623
-        0.10199263,  # 1624
-        0.10187978,  # 1625
-        0.10196942,  # 1626
-        0.10199943,  # 1627
-        0.10199835,  # 1628
-        0.10202828,  # 1629
-        0.10210458,  # 1630
-        0.1020945,  # 1631
-        0.10209232,  # 1632
-        0.10208417,  # 1633
-        0.10194526,  # 1634
-        0.10197318,  # 1635
-        0.10194657,  # 1636
-        0.10192001,  # 1637
-        0.10199443,  # 1638
-        0.10208061,  # 1639
-        0.10206824,  # 1640
-        0.10202764,  # 1641
-        0.10207804,  # 1642
-        0.10198539,  # 1643
-        0.10188651,  # 1644
-        0.10190186,  # 1645
-        0.10192319,  # 1646
-        0.10198972,  # 1647
-        0.10211171,  # 1648
-        0.10206146,  # 1649
-        0.10190403,  # 1650
-        0.10179509,  # 1651
-        0.10187252,  # 1652
-        0.10201956,  # 1653
-        0.10209398,  # 1654
-        0.10202144,  # 1655
-        0.10182816,  # 1656
-        0.10169734,  # 1657
-        0.101783,  # 1658
-        0.10196673,  # 1659
-        0.10205694,  # 1660
-        0.10196539,  # 1661
-        0.10170646,  # 1662
-        0.10176435,  # 1663
-        0.10195282,  # 1664
-        0.10203839,  # 1665
-        0.10194227,  # 1666
-        0.10187072,  # 1667
-        0.10182276,  # 1668
-        0.10184204,  # 1669
-        0.10191254,  # 1670
-        0.10170022,  # 1671
-        0.10180223,  # 1672
-        0.10187902,  # 1673
-        0.10192166,  # 1674
-        0.10187843,  # 1675
-        0.10193199,  # 1676
-        0.10191442,  # 1677
-        0.10187109,  # 1678
-        0.10163265,  # 1679
-        0.10171842,  # 1680
-        0.10189709,  # 1681
-        0.10196704,  # 1682
-        0.10177214,  # 1683
-        0.10182272,  # 1684
-        0.10174202,  # 1685
-        0.10165031,  # 1686
-        0.1017012,  # 1687
-        0.10185667,  # 1688
-        0.10187246,  # 1689
-        0.10185759,  # 1690
-        0.10179123,  # 1691
-        0.10156103,  # 1692
-        0.1017293,  # 1693
-        0.10189383,  # 1694
-        0.10190946,  # 1695
-        0.10180887,  # 1696
-        0.10164563,  # 1697
-        0.10162714,  # 1698
-        0.10172395,  # 1699
-        0.10203588,  # 1700
-        0.10183785,  # 1701
-        0.10181492,  # 1702
-        0.1016875,  # 1703
-        0.10158072,  # 1704
-        0.10188236,  # 1705
-        0.10198121,  # 1706
-        0.10182583,  # 1707
-        0.10176463,  # 1708
-        0.10169012,  # 1709
-        0.10178856,  # 1710
-        0.101661,  # 1711
-        0.10189922,  # 1712
-        0.10195762,  # 1713
-        0.10179579,  # 1714
-        0.10179785,  # 1715
-        0.10177982,  # 1716
-        0.10176803,  # 1717
-        0.10168009,  # 1718
-        0.10170403,  # 1719
-        0.101754,  # 1720
-        0.10173229,  # 1721
-        0.10159747,  # 1722
-        0.10169414,  # 1723
-        0.10168716,  # 1724
-        0.10167538,  # 1725
-        0.10180414,  # 1726
-        0.10164647,  # 1727
-        0.101679,  # 1728
-        0.10161195,  # 1729
-        0.10169975,  # 1730
-        0.10164745,  # 1731
-        0.10166718,  # 1732
-        0.10166914,  # 1733
-        0.10160154,  # 1734
-        0.10160293,  # 1735
-        0.10159251,  # 1736
-        0.10165972,  # 1737
-        0.10158922,  # 1738
-        0.10158783,  # 1739
-        0.10161239,  # 1740
-        0.10174023,  # 1741
-        0.10161621,  # 1742
-        0.10157949,  # 1743
-        0.10162051,  # 1744
-        0.10160126,  # 1745
-        0.101623,  # 1746
-        0.10159886,  # 1747
-        0.10166945,  # 1748
-        0.10159496,  # 1749
-        0.10150489,  # 1750
-        0.10140559,  # 1751
-        0.10168461,  # 1752
-        0.10161645,  # 1753
-        0.10165322,  # 1754
-        0.10166079,  # 1755
-        0.10184392,  # 1756
-        0.10172047,  # 1757
-        0.10186443,  # 1758
-        0.10169766,  # 1759
-        0.10146172,  # 1760
-        0.10164806,  # 1761
-        0.10153865,  # 1762
-        0.10162301,  # 1763
-        0.10159346,  # 1764
-        0.10175112,  # 1765
-        0.10156818,  # 1766
-        0.10176155,  # 1767
-        0.10155453,  # 1768
-        0.10162686,  # 1769
-        0.10159657,  # 1770
-        0.10154957,  # 1771
-        0.10159358,  # 1772
-        0.1016835,  # 1773
-        0.10155935,  # 1774
-        0.10171816,  # 1775
-        0.10153302,  # 1776
-        0.10126441,  # 1777
-        0.10155981,  # 1778
-        0.10176104,  # 1779
-        0.10171529,  # 1780
-        0.10123905,  # 1781
-        0.10176452,  # 1782
-        0.10170556,  # 1783
-        0.10142161,  # 1784
-        0.10143618,  # 1785
-        0.10162321,  # 1786
-        0.10161111,  # 1787
-        0.10157628,  # 1788
-        0.1014493,  # 1789
-        0.10152087,  # 1790
-        0.10142311,  # 1791
-        0.10157559,  # 1792
-        0.10172346,  # 1793
-        0.10156884,  # 1794
-        0.10156977,  # 1795
-        0.10147714,  # 1796
-        0.10170194,  # 1797
-        0.10152665,  # 1798
-        0.10147432,  # 1799
-        0.1015828,  # 1800
-        0.10166028,  # 1801
-        0.10153672,  # 1802
-        0.1013378,  # 1803
-        0.10144267,  # 1804
-        0.10170421,  # 1805
-        0.10161692,  # 1806
-        0.10144985,  # 1807
-        0.10130904,  # 1808
-        0.1013991,  # 1809
-        0.10142796,  # 1810
-        0.10144193,  # 1811
-        0.10142029,  # 1812
-        0.10138797,  # 1813
-        0.10130155,  # 1814
-        0.10129268,  # 1815
-        0.10152157,  # 1816
-        0.10142661,  # 1817
-        0.10111755,  # 1818
-        0.10117781,  # 1819
-        0.10136467,  # 1820
-        0.10145149,  # 1821
-        0.10128275,  # 1822
-        0.10120058,  # 1823
-        0.10118165,  # 1824
-        0.10125092,  # 1825
-        0.10127935,  # 1826
-        0.10127042,  # 1827
-        0.10116508,  # 1828
-        0.10107047,  # 1829
-        0.10137403,  # 1830
-        0.10137194,  # 1831
-        0.10092817,  # 1832
-        0.10110699,  # 1833
-        0.10120491,  # 1834
-        0.10124315,  # 1835
-        0.1011117,  # 1836
-        0.10094565,  # 1837
-        0.10092756,  # 1838
-        0.1011582,  # 1839
-        0.10102111,  # 1840
-        0.10100535,  # 1841
-        0.10107291,  # 1842
-        0.10109271,  # 1843
-        0.10084651,  # 1844
-        0.10093998,  # 1845
-        0.10109885,  # 1846
-        0.1010142,  # 1847
-        0.10102703,  # 1848
-        0.10104417,  # 1849
-        0.10096231,  # 1850
-        0.10089841,  # 1851
-        0.10115506,  # 1852
-        0.10119322,  # 1853
-        0.10094624,  # 1854
-        0.10098129,  # 1855
-        0.10087476,  # 1856
-        0.10096115,  # 1857
-        0.10083903,  # 1858
-        0.10069063,  # 1859
-        0.10088692,  # 1860
-        0.10086388,  # 1861
-        0.10080209,  # 1862
-        0.10067173,  # 1863
-        0.10066723,  # 1864
-        0.10077825,  # 1865
-        0.10074095,  # 1866
-        0.10079286,  # 1867
-        0.10077349,  # 1868
-        0.10068153,  # 1869
-        0.10065552,  # 1870
-        0.10065878,  # 1871
-        0.10070514,  # 1872
-        0.10076942,  # 1873
-        0.10067958,  # 1874
-        0.10053231,  # 1875
-        0.10062486,  # 1876
-        0.10073144,  # 1877
-        0.10073023,  # 1878
-        0.10072869,  # 1879
-        0.10066107,  # 1880
-        0.10064986,  # 1881
-        0.10064838,  # 1882
-        0.1005631,  # 1883
-        0.10063703,  # 1884
-        0.1006145,  # 1885
-        0.10050016,  # 1886
-        0.10066173,  # 1887
-        0.10072736,  # 1888
-        0.10075564,  # 1889
-        0.10075794,  # 1890
-        0.10077304,  # 1891
-        0.10067432,  # 1892
-        0.1006268,  # 1893
-        0.10070827,  # 1894
-        0.10067191,  # 1895
-        0.10067838,  # 1896
-        0.10066439,  # 1897
-        0.10052786,  # 1898
-        0.10040675,  # 1899
-        0.10039844,  # 1900
-        0.1004565,  # 1901
-        0.10043291,  # 1902
-        0.10041687,  # 1903
-        0.10041345,  # 1904
-        0.10047355,  # 1905
-        0.10049236,  # 1906
-        0.10047273,  # 1907
-        0.10047046,  # 1908
-        0.10053848,  # 1909
-        0.10048761,  # 1910
-        0.10045731,  # 1911
-        0.10047752,  # 1912
-        0.10047788,  # 1913
-        0.10046544,  # 1914
-        0.10039269,  # 1915
-        0.10045372,  # 1916
-        0.1004397,  # 1917
-        0.10037852,  # 1918
-        0.1003726,  # 1919
-        0.10046241,  # 1920
-        0.10045105,  # 1921
-        0.10044501,  # 1922
-        0.10047728,  # 1923
-        0.10038607,  # 1924
-        0.10030682,  # 1925
-        0.10033418,  # 1926
-        0.10043257,  # 1927
-        0.10047992,  # 1928
-        0.10060299,  # 1929
-        0.10054199,  # 1930
-        0.10060417,  # 1931
-        0.1005634,  # 1932
-        0.10062822,  # 1933
-        0.10060291,  # 1934
-        0.10056431,  # 1935
-        0.10057612,  # 1936
-        0.1004145,  # 1937
-        0.10039631,  # 1938
-        0.100418,  # 1939
-        0.10040826,  # 1940
-        0.10036244,  # 1941
-        0.10034729,  # 1942
-        0.10034972,  # 1943
-        0.10034216,  # 1944
-        0.10037226,  # 1945
-        0.10023833,  # 1946
-        0.1002995,  # 1947
-        0.10044922,  # 1948
-        0.10043248,  # 1949
-        0.10018476,  # 1950
-        0.10021786,  # 1951
-        0.10057905,  # 1952
-        0.10061895,  # 1953
-        0.10034899,  # 1954
-        0.10048103,  # 1955
-        0.1005781,  # 1956
-        0.10058296,  # 1957
-        0.10074035,  # 1958
-        0.10054127,  # 1959
-        0.10047296,  # 1960
-        0.10072908,  # 1961
-        0.10070672,  # 1962
-        0.10051324,  # 1963
-        0.10041643,  # 1964
-        0.10057534,  # 1965
-        0.10050313,  # 1966
-        0.10049315,  # 1967
-        0.10051439,  # 1968
-        0.10049691,  # 1969
-        0.10053416,  # 1970
-        0.10049515,  # 1971
-        0.10048796,  # 1972
-        0.1001622,  # 1973
-        0.10070146,  # 1974
-        0.10050266,  # 1975
-        0.10051365,  # 1976
-        0.10048665,  # 1977
-        0.10058783,  # 1978
-        0.10034035,  # 1979
-        0.10077915,  # 1980
-        0.10072156,  # 1981
-        0.10056774,  # 1982
-        0.10044787,  # 1983
-        0.10042893,  # 1984
-        0.10073239,  # 1985
-        0.10037116,  # 1986
-        0.10048022,  # 1987
-        0.1005722,  # 1988
-        0.10026631,  # 1989
-        0.10064085,  # 1990
-        0.1005929,  # 1991
-        0.10021022,  # 1992
-        0.10036141,  # 1993
-        0.10062723,  # 1994
-        0.10038883,  # 1995
-        0.10048038,  # 1996
-        0.10053209,  # 1997
-        0.10061905,  # 1998
-        0.10053428,  # 1999
-        0.10045949,  # 2000
-        0.10040037,  # 2001
-        0.10062011,  # 2002
-        0.10072249,  # 2003
-        0.10059904,  # 2004
-        0.10056329,  # 2005
-        0.10043958,  # 2006
-        0.10069461,  # 2007
-        0.10070292,  # 2008
-        0.10068716,  # 2009
-        0.10071429,  # 2010
-        0.10063576,  # 2011
-        0.10061082,  # 2012
-        0.10058202,  # 2013
-        0.1005491,  # 2014
-        0.10061917,  # 2015
-        0.10041064,  # 2016
-        0.10037058,  # 2017
-        0.10032007,  # 2018
-        0.10033825,  # 2019
-        0.10038982,  # 2020
-        0.1003839,  # 2021
-        0.10039261,  # 2022
-        0.10039886,  # 2023
-        0.10042315,  # 2024
-        0.10048136,  # 2025
-        0.10047598,  # 2026
-        0.10049219,  # 2027
-        0.10052344,  # 2028
-        0.10051809,  # 2029
-        0.10050866,  # 2030
-        0.10052209,  # 2031
-        0.10051063,  # 2032
-        0.10047417,  # 2033
-        0.10051229,  # 2034
-        0.10052107,  # 2035
-        0.10048753,  # 2036
-        0.10045796,  # 2037
-        0.10042413,  # 2038
-        0.10046807,  # 2039
-        0.10044649,  # 2040
-        0.10038967,  # 2041
-        0.10042912,  # 2042
-        0.10042894,  # 2043
-        0.10044043,  # 2044
-        0.10043954,  # 2045
-        0.10052542,  # 2046
-        0.10047082,  # 2047
-        0.10048989,  # 2048
-        0.10050069,  # 2049
-        0.10049823,  # 2050
-        0.10056268,  # 2051
-        0.10052919,  # 2052
-        0.10048781,  # 2053
-        0.10047962,  # 2054
-        0.10047557,  # 2055
-        0.10044311,  # 2056
-        0.10048258,  # 2057
-        0.10055192,  # 2058
-        0.1005069,  # 2059
-        0.10049584,  # 2060
-        0.10055483,  # 2061
-        0.10053434,  # 2062
-        0.10054653,  # 2063
-        0.10055275,  # 2064
-        0.10054685,  # 2065
-        0.10051865,  # 2066
-        0.10056455,  # 2067
-        0.10059923,  # 2068
-        0.10061472,  # 2069
-        0.10061378,  # 2070
-        0.10058001,  # 2071
-        0.10058902,  # 2072
-        0.10062172,  # 2073
-        0.10062319,  # 2074
-        0.10062123,  # 2075
-        0.10060223,  # 2076
-        0.10059068,  # 2077
-        0.10055782,  # 2078
-        0.10056073,  # 2079
-        0.10054398,  # 2080
-        0.1005794,  # 2081
-        0.10061698,  # 2082
-        0.10057377,  # 2083
-        0.10056636,  # 2084
-        0.10058177,  # 2085
-        0.10062645,  # 2086
-        0.10065028,  # 2087
-        0.10066902,  # 2088
-        0.10068502,  # 2089
-        0.10065295,  # 2090
-        0.10063951,  # 2091
-        0.10065758,  # 2092
-        0.1006794,  # 2093
-        0.1007348,  # 2094
-        0.10073968,  # 2095
-        0.10073968,  # 2096
-        0.10073059,  # 2097
-        0.10066933,  # 2098
-        0.10068308,  # 2099
-        0.10073955,  # 2100
-        0.10075412,  # 2101
-        0.10073197,  # 2102
-        0.10069805,  # 2103
-        0.1006742,  # 2104
-        0.10064242,  # 2105
-        0.10056802,  # 2106
-        0.10054876,  # 2107
-        0.10053594,  # 2108
-        0.10052674,  # 2109
-        0.10052188,  # 2110
-        0.10054058,  # 2111
-        0.10056918,  # 2112
-        0.10056488,  # 2113
-        0.10059153,  # 2114
-        0.10062392,  # 2115
-        0.10057265,  # 2116
-        0.10066233,  # 2117
-        0.10063507,  # 2118
-        0.100595,  # 2119
-        0.10061966,  # 2120
-        0.1006237,  # 2121
-        0.1006174,  # 2122
-        0.10068541,  # 2123
-        0.1007079,  # 2124
-        0.10067993,  # 2125
-        0.10061604,  # 2126
-        0.10062883,  # 2127
-        0.10056993,  # 2128
-        0.10052092,  # 2129
-        0.1005479,  # 2130
-        0.10053454,  # 2131
-        0.10051304,  # 2132
-        0.10048789,  # 2133
-        0.10050652,  # 2134
-        0.10045187,  # 2135
-        0.1004425,  # 2136
-        0.10046427,  # 2137
-        0.10041524,  # 2138
-        0.10037842,  # 2139
-        0.10038341,  # 2140
-        0.10046234,  # 2141
-        0.10038172,  # 2142
-        0.10036865,  # 2143
-        0.10043129,  # 2144
-        0.1003772,  # 2145
-        0.10033524,  # 2146
-        0.10034179,  # 2147
-        0.10037636,  # 2148
-        0.10037173,  # 2149
-        0.10034612,  # 2150
-        0.10042577,  # 2151
-        0.10037256,  # 2152
-        0.10038313,  # 2153
-        0.10037474,  # 2154
-        0.10035084,  # 2155
-        0.10039627,  # 2156
-        0.10029678,  # 2157
-        0.10038986,  # 2158
-        0.10040305,  # 2159
-        0.10041957,  # 2160
-        0.10042421,  # 2161
-        0.10045945,  # 2162
-        0.10041381,  # 2163
-        0.10040437,  # 2164
-        0.10044725,  # 2165
-        0.10040485,  # 2166
-        0.10030311,  # 2167
-        0.10045909,  # 2168
-        0.10043971,  # 2169
-        0.10044175,  # 2170
-        0.10044734,  # 2171
-        0.1005937,  # 2172
-        0.10050369,  # 2173
-        0.1005188,  # 2174
-        0.10054182,  # 2175
-        0.10057299,  # 2176
-        0.10064429,  # 2177
-        0.10059975,  # 2178
-        0.10061334,  # 2179
-        0.10064685,  # 2180
-        0.10069141,  # 2181
-        0.10064768,  # 2182
-        0.1006523,  # 2183
-        0.1007266,  # 2184
-        0.10069588,  # 2185
-        0.1006796,  # 2186
-        0.1006192,  # 2187
-        0.10054877,  # 2188
-        0.10068847,  # 2189
-        0.10065824,  # 2190
-        0.10056726,  # 2191
-        0.10061771,  # 2192
-        0.10050105,  # 2193
-        0.10053059,  # 2194
-        0.10046867,  # 2195
-        0.10051281,  # 2196
-        0.10045526,  # 2197
-        0.10053506,  # 2198
-        0.10037756,  # 2199
-        0.10035959,  # 2200
-        0.10058781,  # 2201
-        0.10047961,  # 2202
-        0.10045219,  # 2203
-        0.10050167,  # 2204
-        0.1004474,  # 2205
-        0.10054796,  # 2206
-        0.10047449,  # 2207
-        0.10051853,  # 2208
-        0.10044959,  # 2209
-        0.10060402,  # 2210
-        0.10046144,  # 2211
-        0.10041204,  # 2212
-        0.10054036,  # 2213
-        0.10038388,  # 2214
-        0.10041314,  # 2215
-        0.10059326,  # 2216
-        0.10039881,  # 2217
-        0.10049421,  # 2218
-        0.1004507,  # 2219
-        0.1005805,  # 2220
-        0.10048759,  # 2221
-        0.10050842,  # 2222
-        0.10056425,  # 2223
-        0.10050767,  # 2224
-        0.10054397,  # 2225
-        0.10052976,  # 2226
-        0.10064847,  # 2227
-        0.10055512,  # 2228
-        0.10051532,  # 2229
-        0.10051711,  # 2230
-        0.10057226,  # 2231
-        0.10064655,  # 2232
-        0.10052166,  # 2233
-        0.1005368,  # 2234
-        0.1005358,  # 2235
-        0.10048258,  # 2236
-        0.1003973,  # 2237
-        0.10045421,  # 2238
-        0.10045113,  # 2239
-        0.10036715,  # 2240
-        0.10036958,  # 2241
-        0.10039245,  # 2242
-        0.10030052,  # 2243
-        0.10034869,  # 2244
-        0.10044751,  # 2245
-        0.10042959,  # 2246
-        0.10033289,  # 2247
-        0.10040058,  # 2248
-        0.10042699,  # 2249
-        0.10037005,  # 2250
-        0.10041948,  # 2251
-        0.10041591,  # 2252
-        0.10034463,  # 2253
-        0.10041005,  # 2254
-        0.10035755,  # 2255
-        0.10034044,  # 2256
-        0.10034002,  # 2257
-        0.10042398,  # 2258
-        0.10031311,  # 2259
-        0.10032266,  # 2260
-        0.1004487,  # 2261
-        0.10036219,  # 2262
-        0.10042577,  # 2263
-        0.10031239,  # 2264
-        0.10023715,  # 2265
-        0.100159,  # 2266
-        0.100248,  # 2267
-        0.10035524,  # 2268
-        0.10023928,  # 2269
-        0.10019606,  # 2270
-        0.1002179,  # 2271
-        0.10017482,  # 2272
-        0.10019223,  # 2273
-        0.10024531,  # 2274
-        0.10016128,  # 2275
-        0.10015625,  # 2276
-        0.10016564,  # 2277
-        0.10020693,  # 2278
-        0.10025248,  # 2279
-        0.10024522,  # 2280
-        0.10041697,  # 2281
-        0.1004263,  # 2282
-        0.10057563,  # 2283
-        0.10062145,  # 2284
-        0.10083235,  # 2285
-        0.10064257,  # 2286
-        0.10066352,  # 2287
-        0.10086752,  # 2288
-        0.10092956,  # 2289
-        0.10085398,  # 2290
-        0.10093728,  # 2291
-        0.10076644,  # 2292
-        0.10089954,  # 2293
-        0.10104744,  # 2294
-        0.10088167,  # 2295
-        0.10072635,  # 2296
-        0.10073138,  # 2297
-        0.10085077,  # 2298
-        0.10066591,  # 2299
-        0.10059053,  # 2300
-        0.10061713,  # 2301
-        0.10076981,  # 2302
-        0.10077676,  # 2303
-        0.10062067,  # 2304
-        0.10061596,  # 2305
-        0.10053874,  # 2306
-        0.10072138,  # 2307
-        0.10092346,  # 2308
-        0.1007688,  # 2309
-        0.10064794,  # 2310
-        0.10062033,  # 2311
-        0.10058405,  # 2312
-        0.10063724,  # 2313
-        0.10063251,  # 2314
-        0.10083332,  # 2315
-        0.10090299,  # 2316
-        0.10081545,  # 2317
-        0.10069575,  # 2318
-        0.10065188,  # 2319
-        0.10072737,  # 2320
-        0.10052275,  # 2321
-        0.10047491,  # 2322
-        0.10044147,  # 2323
-        0.10045128,  # 2324
-        0.10066101,  # 2325
-        0.10054505,  # 2326
-        0.10024593,  # 2327
-        0.10048018,  # 2328
-        0.10063943,  # 2329
-        0.10052982,  # 2330
-        0.10039508,  # 2331
-        0.10048802,  # 2332
-        0.10049571,  # 2333
-        0.10037968,  # 2334
-        0.10048677,  # 2335
-        0.10020044,  # 2336
-        0.10026384,  # 2337
-        0.1003437,  # 2338
-        0.10021327,  # 2339
-        0.10021354,  # 2340
-        0.10019005,  # 2341
-        0.10039952,  # 2342
-        0.10025153,  # 2343
-        0.10019303,  # 2344
-        0.10030651,  # 2345
-        0.10033472,  # 2346
-        0.1003134,  # 2347
-        0.10013299,  # 2348
-        0.09998962,  # 2349
-        0.10017425,  # 2350
-        0.10023928,  # 2351
-        0.10027968,  # 2352
-        0.10029858,  # 2353
-        0.10018288,  # 2354
-        0.10042357,  # 2355
-        0.10056473,  # 2356
-        0.10071674,  # 2357
-        0.10037843,  # 2358
-        0.10023884,  # 2359
-        0.10038349,  # 2360
-        0.10038009,  # 2361
-        0.10048374,  # 2362
-        0.10037228,  # 2363
-        0.10018692,  # 2364
-        0.10012346,  # 2365
-        0.09978143,  # 2366
-        0.09975587,  # 2367
-        0.09984438,  # 2368
-        0.0999912,  # 2369
-        0.10017452,  # 2370
-        0.09997118,  # 2371
-        0.09984408,  # 2372
-        0.09981434,  # 2373
-        0.09980209,  # 2374
-        0.10004882,  # 2375
-        0.09955412,  # 2376
-        0.09962231,  # 2377
-        0.09961605,  # 2378
-        0.09974196,  # 2379
-        0.09961073,  # 2380
-        0.09966197,  # 2381
-        0.0997968,  # 2382
-        0.09990458,  # 2383
-        0.09982118,  # 2384
-        0.09981842,  # 2385
-        0.09973262,  # 2386
-        0.09960953,  # 2387
-        0.09986067,  # 2388
-        0.09920666,  # 2389
-        0.0994976,  # 2390
-        0.09959663,  # 2391
-        0.09964607,  # 2392
-        0.09951756,  # 2393
-        0.09954121,  # 2394
-        0.09957008,  # 2395
-        0.09939854,  # 2396
-        0.10001732,  # 2397
-        0.0996235,  # 2398
-        0.09964471,  # 2399
-        0.09957771,  # 2400
-        0.09939087,  # 2401
-        0.09936271,  # 2402
-        0.09947654,  # 2403
-        0.09995942,  # 2404
-        0.09985375,  # 2405
-        0.09944567,  # 2406
-        0.09947667,  # 2407
-        0.09951301,  # 2408
-        0.09923055,  # 2409
-        0.09915881,  # 2410
-        0.09907426,  # 2411
-        0.09938808,  # 2412
-        0.09955514,  # 2413
-        0.09935837,  # 2414
-        0.09953972,  # 2415
-        0.09967383,  # 2416
-        0.10024787,  # 2417
-        0.09994152,  # 2418
-        0.09995649,  # 2419
-        0.09909092,  # 2420
-        0.09943436,  # 2421
-        0.09996775,  # 2422
-        0.09943244,  # 2423
-        0.0992226,  # 2424
-        0.09919381,  # 2425
-        0.09988759,  # 2426
-        0.09950084,  # 2427
-        0.09984517,  # 2428
-        0.09992513,  # 2429
-        0.09945555,  # 2430
-        0.09876803,  # 2431
-        0.09947684,  # 2432
-        0.09972115,  # 2433
-        0.09954253,  # 2434
-        0.09954495,  # 2435
-        0.09950507,  # 2436
-        0.09982098,  # 2437
-        0.0991598,  # 2438
-        0.09985554,  # 2439
-        0.09980403,  # 2440
-        0.09923564,  # 2441
-        0.10018177,  # 2442
-        0.09927657,  # 2443
-        0.099844,  # 2444
-        0.09998532,  # 2445
-        0.09964601,  # 2446
-        0.09868773,  # 2447
-        0.09900527,  # 2448
-        0.09888979,  # 2449
-        0.09968271,  # 2450
-    ]
-)
+COEFFICIENTS_FILE = os.path.join(os.path.dirname(__file__), "zenith_co.npz")
+PANELS = ("sg3144_batch1", "sg3144_batch2")
+
+
+@lru_cache(maxsize=None)
+def _load_coefficients():
+    with np.load(COEFFICIENTS_FILE) as data:
+        return {panel: data[panel] for panel in PANELS}
+
+
+@lru_cache(maxsize=None)
+def _prefix_sums(panel):
+    return np.concatenate(([0.0], np.cumsum(get_coefficients(panel))))
+
+
+@lru_cache(maxsize=None)
+def _load_spectrum_file(path):
+    return np.load(path).astype(np.float64, copy=False)
+
+
+def get_coefficients(panel):
+    """
+    Return the reflectance spectrum of a panel, as a read-only array indexed by wavelength in nanometers.
+
+    :param panel: One of ``PANELS``, or the path of a .npy file holding a spectrum
+    """
+    if panel in PANELS:
+        coefficients = _load_coefficients()[panel]
+    else:
+        coefficients = _load_spectrum_file(panel)
+    coefficients.flags.writeable = False
+    return coefficients
+
+
+def window_average(panel, start, stop):
+    """
+    Average the reflectance of a panel over the wavelengths ``[start, stop)``, in constant time.
+
+    The window is clipped to the spectrum like a slice, so this is equivalent to
+    ``np.average(get_coefficients(panel)[start:stop])``.
+    """
+    prefix_sums = _prefix_sums(panel)
+    start, stop, _ = slice(start, stop).indices(len(prefix_sums) - 1)
+    if stop <= start:
+        return np.nan
+    return (prefix_sums[stop] - prefix_sums[start]) / (stop - start)
+
+
+def __getattr__(name):
+    """Provide the ``<panel>_coefficients`` arrays of earlier versions, loading them on first access."""
+    panel = name[: -len("_coefficients")]
+    if name.endswith("_coefficients") and panel in PANELS:
+        return get_coefficients(panel)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,99 @@
+"""
+Measure write throughput and size of corrected images for each output compression codec.
+
+Images are read from a folder of corrected images, or, if none is given, synthesized as smooth reflectance
+frames with sensor noise.
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from glob import glob
+
+import numpy as np
+import tifffile as tf
+
+from imgcorrect import io
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+
+def synthetic_image(seed, shape=(1536, 2048)):
+    """Synthesize a smoothly varying reflectance frame with the noise of 12-bit raw values."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0 : shape[0], 0 : shape[1]]
+    raw = (
+        2000 + 800 * np.sin(x / 150 + seed) * np.cos(y / 200) + rng.normal(0, 40, shape)
+    )
+    return (raw.clip(0, 4095).astype(np.uint16) * 0.0001).astype(np.float32)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "input_path",
+        nargs="?",
+        default=None,
+        help="Path to a folder of corrected TIFF images, e.g. the output of correct_images.py. If not "
+        "specified, synthetic images are benchmarked.",
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=8,
+        help="Number of synthetic 2048x1536 reflectance images to benchmark if no input_path is "
+        "specified. Defaults to 8.",
+    )
+    parser.add_argument(
+        "--compression_level",
+        type=int,
+        default=None,
+        help="Compression level for the deflate and zstd codecs.",
+    )
+    parser.add_argument(
+        "--uint16_output",
+        "-u",
+        action="store_true",
+        help="If selected, images are scaled to 0-65535 and benchmarked as uint16.",
+    )
+
+    args = parser.parse_args()
+
+    if args.input_path:
+        paths = glob(
+            os.path.join(args.input_path, "**", "*.[Tt][Ii][Ff]"), recursive=True
+        )
+        originals = (tf.imread(path).astype(np.float32) for path in paths)
+    else:
+        originals = (synthetic_image(i) for i in range(args.synthetic))
+
+    images = []
+    for image_arr in originals:
+        if args.uint16_output:
+            image_arr = (image_arr / image_arr.max() * 65535).astype(np.uint16)
+        images.append(image_arr)
+    raw_bytes = sum(image_arr.nbytes for image_arr in images)
+    logger.info("Benchmarking %d images (%.1f MB)", len(images), raw_bytes / 1e6)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for compression in ["none", *io.COMPRESSION_CODECS]:
+            write_options = io.tiff_write_options(compression, args.compression_level)
+            written_bytes = 0
+            start = time.perf_counter()
+            for i, image_arr in enumerate(images):
+                path = os.path.join(temp_dir, f"{compression}_{i}.tif")
+                tf.imwrite(path, image_arr, **write_options)
+                written_bytes += os.path.getsize(path)
+            elapsed = time.perf_counter() - start
+            logger.info(
+                "%-8s %8.1f MB/s  %8.1f MB  ratio %5.2f",
+                compression,
+                raw_bytes / elapsed / 1e6,
+                written_bytes / 1e6,
+                raw_bytes / written_bytes,
+            )
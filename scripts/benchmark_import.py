@@ -0,0 +1,67 @@
+"""Measure the startup time of the imgcorrect package and of the correct_images CLI, unfrozen and frozen."""
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def time_command(command, repeat):
+    """Return the median wall time, in seconds, of running command in a fresh process."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--frozen",
+        default=None,
+        help="Path to a PyInstaller build of correct_images (e.g. dist/ImageryCorrector.exe) to "
+        "benchmark as well.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="Number of runs of each command, of which the median is reported. Defaults to 10.",
+    )
+
+    args = parser.parse_args()
+
+    correct_images_script = os.path.join(SCRIPTS_DIR, "correct_images.py")
+    commands = {
+        "python (baseline)": [sys.executable, "-c", "pass"],
+        "import imgcorrect": [sys.executable, "-c", "import imgcorrect"],
+        "import imgcorrect.correct_images": [
+            sys.executable,
+            "-c",
+            "import imgcorrect; imgcorrect.correct_images",
+        ],
+        "correct_images.py --version": [
+            sys.executable,
+            correct_images_script,
+            "--version",
+        ],
+        "correct_images.py --help": [sys.executable, correct_images_script, "--help"],
+    }
+    if args.frozen:
+        commands["frozen --version"] = [args.frozen, "--version"]
+        commands["frozen --help"] = [args.frozen, "--help"]
+
+    for name, command in commands.items():
+        logger.info("%-34s %8.1f ms", name, time_command(command, args.repeat) * 1e3)
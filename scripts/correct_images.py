@@ -5,7 +5,6 @@ import logging
 import os
 import sys
 
-from imgcorrect import corrections
 from imgcorrect._version import __version__
 
 logging.basicConfig(level=logging.INFO)
@@ -70,7 +69,163 @@ if __name__ == "__main__":
         help="If selected, scale of output values will be adjusted to 0-65535 and dtype will be "
         "changed to uint16.",
     )
+    parser.add_argument(
+        "--streaming",
+        "-s",
+        action="store_true",
+        help="If selected, images will be read, corrected and written in horizontal strips, so that "
+        "memory use per image stays bounded regardless of sensor resolution.",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["none", "deflate", "zstd", "lzw"],
+        default="none",
+        help="Compression codec for output TIFFs. A floating-point or horizontal predictor is applied "
+        "and strips are compressed on multiple threads. If not specified, output is uncompressed.",
+    )
+    parser.add_argument(
+        "--compression_level",
+        type=int,
+        default=None,
+        help="Compression level for the deflate and zstd codecs. If not specified, the codec's default "
+        "level is used.",
+    )
+    parser.add_argument(
+        "--tile_size",
+        type=int,
+        default=None,
+        help="If specified, output TIFFs will be tiled with square tiles of this size (a multiple of 16) "
+        "instead of stripped, allowing windowed reads.",
+    )
+    parser.add_argument(
+        "--overviews",
+        type=int,
+        default=0,
+        help="Number of internal reduced-resolution overview levels, each half the size of the "
+        "previous one, to add to output TIFFs. Defaults to 0.",
+    )
+    parser.add_argument(
+        "--batch_exif",
+        action="store_true",
+        help="If selected, image metadata will be copied with one ExifTool invocation per batch of "
+        "images instead of one command per image. Images that fail are retried individually.",
+    )
+    parser.add_argument(
+        "--native_metadata",
+        action="store_true",
+        help="If selected, XMP and EXIF metadata will be embedded in output TIFFs as they are written "
+        "instead of being copied with ExifTool. ExifTool is still used for images where this fails.",
+    )
+    parser.add_argument(
+        "--exif_workers",
+        type=int,
+        default=1,
+        help="Number of ExifTool processes copying image metadata concurrently. Defaults to 1.",
+    )
+    parser.add_argument(
+        "--exif_timeout",
+        type=float,
+        default=120,
+        help="Seconds allowed for copying the metadata of a single image before its ExifTool process "
+        "is killed. Defaults to 120.",
+    )
+    parser.add_argument(
+        "--thermal_format",
+        choices=["float32", "uint16", "int16"],
+        default="float32",
+        help="Pixel format of converted LWIR images. float32 stores degrees Celsius, uint16 stores the raw "
+        "centi-Kelvin values and int16 stores centi-Celsius, with their scale and offset recorded in the "
+        "GDAL_METADATA TIFF tag and Sentera:ThermalScale/ThermalOffset XMP tags, which readers must apply to "
+        "stored values to get Celsius. Defaults to float32.",
+    )
 
+    parser.add_argument(
+        "--panels_file",
+        default=None,
+        help="Path to a JSON file describing calibration panels (ArUco ID, reflectance spectrum and "
+        "geometry) in addition to the built-in ones. See imgcorrect/panels.py for the format.",
+    )
+    parser.add_argument(
+        "--plan_file",
+        default=None,
+        help="Path to a correction plan written by get_corrections.py --plan_file, to apply instead of "
+        "computing the corrections. The plan is refused if the input images have changed since.",
+    )
+    parser.add_argument(
+        "--shard",
+        default=None,
+        metavar="i/N",
+        help="Correct only the i-th of N disjoint sets of captures (counting from 1), so that N runs "
+        "sharing the same output folder, e.g. on several machines, together correct all images. "
+        "With -r or -u, all shards must apply the same --plan_file made with --plan_max_val.",
+    )
+    parser.add_argument(
+        "--queue",
+        default=None,
+        help="Path of an SQLite database file on shared storage, or redis:// URL, of a queue of captures "
+        "to correct. Any number of runs given the same queue and output folder, on any machine, claim and "
+        "correct captures from it until all are done. With -r or -u, all runs must apply the same "
+        "--plan_file made with --plan_max_val. Redis queues require the redis package.",
+    )
+    parser.add_argument(
+        "--queue_lease",
+        type=float,
+        default=600,
+        help="Seconds a run's claim on captures from --queue lasts, after which they are given to another "
+        "run. Runs renew the claims of the captures they are correcting. Defaults to 600.",
+    )
+    parser.add_argument(
+        "--queue_name",
+        default=None,
+        help="Name of the run's tasks in --queue, which runs share only with runs of the same name. Defaults "
+        "to a hash of the output folder, input images, corrections and output options, so that other runs "
+        "using the queue don't skip tasks done by this one. Runs that see the output folder at different "
+        "paths, or read their own copies of the input images, must be given the same name.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="If selected, resume the interrupted run writing to the same output folder, from the journal "
+        "and correction plan it saved there, skipping images it already completed. The other options "
+        "must be those of the interrupted run.",
+    )
+    parser.add_argument(
+        "--incremental",
+        dest="incremental_run",
+        action="store_true",
+        help="If selected, skip output images that are unchanged since the previous --incremental run "
+        "writing to the same output folder: those whose input image, corrections and output settings "
+        "are unchanged. Corrections are still computed from all images.",
+    )
+    parser.add_argument(
+        "--rescale",
+        action="store_true",
+        help="With --incremental, output images whose input image is unchanged are not rewritten when "
+        "their corrections or the output scale changed, e.g. with the ILS normalization of provisional "
+        "--watch runs. Their change is instead recorded as a scale factor in their GDAL_METADATA tag, "
+        "which readers must apply.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="If selected, keep watching the input folder and correct images as they arrive, with "
+        "provisional corrections, until interrupted with Ctrl+C or --watch_idle. The corrections of all "
+        "images are then finalized. Requires an --output_path outside the input folder.",
+    )
+    parser.add_argument(
+        "--watch_settle",
+        type=float,
+        default=30,
+        help="Seconds the input folder must be unchanged before the images that arrived are corrected. "
+        "Defaults to 30.",
+    )
+    parser.add_argument(
+        "--watch_idle",
+        type=float,
+        default=None,
+        help="Seconds without new images after which watching stops. If not specified, watching only "
+        "stops when interrupted.",
+    )
     parser.add_argument(
         "--version",
         "-v",
@@ -80,6 +235,9 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # imported once arguments are parsed, so --help and --version don't load the processing modules
+    from imgcorrect import corrections, watch
+
     if not args.exiftool_path:
         if getattr(sys, "frozen", False):
             # If the application is run as a bundle, the PyInstaller bootloader
@@ -96,4 +254,16 @@ if __name__ == "__main__":
             "Using bundled executable. Setting ExifTool path to %s", args.exiftool_path
         )
 
-    corrections.correct_images(**vars(args))
+    # the API takes no compression as None, which runs must record the same way to resume each other
+    if args.compression == "none":
+        args.compression = None
+
+    kwargs = vars(args)
+    settle_seconds = kwargs.pop("watch_settle")
+    idle_timeout = kwargs.pop("watch_idle")
+    if kwargs.pop("watch"):
+        watch.watch_images(
+            settle_seconds=settle_seconds, idle_timeout=idle_timeout, **kwargs
+        )
+    else:
+        corrections.correct_images(**kwargs)
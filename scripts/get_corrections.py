@@ -4,7 +4,6 @@ import argparse
 import logging
 import os
 
-from imgcorrect import corrections, io
 from imgcorrect._version import __version__
 
 logging.basicConfig(level=logging.INFO)
@@ -47,6 +46,25 @@ if __name__ == "__main__":
         action="store_true",
         help="If selected, radiometric-corrections.csv will not use calibration target data in the results",
     )
+    parser.add_argument(
+        "--panels_file",
+        default=None,
+        help="Path to a JSON file describing calibration panels (ArUco ID, reflectance spectrum and "
+        "geometry) in addition to the built-in ones. See imgcorrect/panels.py for the format.",
+    )
+    parser.add_argument(
+        "--plan_file",
+        default=None,
+        help="Path to also write a correction plan to (gzipped if it ends with .gz), which "
+        "correct_images.py --plan_file applies without recomputing the corrections.",
+    )
+    parser.add_argument(
+        "--plan_max_val",
+        action="store_true",
+        help="If selected, the maximum corrected value of each image is also recorded in the correction "
+        "plan, so that correct_images.py --shard can normalize (-r) or scale (-u) output consistently "
+        "across shards. Every image is read to find it.",
+    )
     parser.add_argument(
         "--version",
         "-v",
@@ -56,7 +74,25 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    corrections_data = corrections.get_corrections(**vars(args))
+    # imported once arguments are parsed, so --help and --version don't load the processing modules
+    from imgcorrect import corrections, io, plan
+
+    plan_file, plan_max_val = args.plan_file, args.plan_max_val
+    del args.plan_file, args.plan_max_val
+
+    image_df, _, _ = corrections.get_corrections(**vars(args))
     io.write_corrections_csv(
-        corrections_data, os.path.join(args.output_path, "radiometric-corrections.csv")
+        image_df, os.path.join(args.output_path, "radiometric-corrections.csv")
     )
+    if plan_file:
+        if plan_max_val:
+            image_df["corrected_max_val"] = corrections.compute_max_values(image_df)
+        plan.write_plan(
+            plan_file,
+            image_df,
+            args.input_path,
+            args.output_path,
+            corrections.plan_options(
+                args.calibration_id, args.no_ils_correct, args.no_reflectance_correct
+            ),
+        )
@@ -1,4 +1,72 @@
+import glob
+import os
+import runpy
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from xml.etree import ElementTree
+
+import imgparse
+import numpy as np
+import pandas as pd
+import pytest
+import tifffile
+
 import imgcorrect
+from imgcorrect import (
+    corrections,
+    detect_panel,
+    incremental,
+    io,
+    journal,
+    metadata,
+    panels,
+    plan,
+    thermal_convert,
+    watch,
+    work_queue,
+    zenith_co,
+)
+
+
+@pytest.fixture(scope="module")
+def d4k_ils_expected(tmp_path_factory):
+    """Output folder of a plain run, which runs correcting the same images in other ways must match."""
+    output_path = os.path.join(str(tmp_path_factory.mktemp("d4k_ils_expected")), "")
+    imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        output_path,
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+    )
+    return output_path
+
+
+def _assert_same_outputs(output_path, expected_path):
+    """Assert that two output folders hold the same images with the same pixel values."""
+    outputs = sorted(
+        os.path.relpath(path, output_path)
+        for path in glob.glob(os.path.join(output_path, "**", "*.tif"), recursive=True)
+    )
+    expected = sorted(
+        os.path.relpath(path, expected_path)
+        for path in glob.glob(
+            os.path.join(expected_path, "**", "*.tif"), recursive=True
+        )
+    )
+    assert outputs and outputs == expected
+    for path in outputs:
+        np.testing.assert_array_equal(
+            tifffile.imread(os.path.join(output_path, path)),
+            tifffile.imread(os.path.join(expected_path, path)),
+        )
 
 
 def test_6x_cal_ils():
@@ -51,3 +119,1170 @@ def test_d4k_ils():
         "exiftool",
         False,
     )
+
+
+def test_d4k_ils_streaming(d4k_ils_expected):
+    imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        "tests/output/d4k_ils_streaming/",
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+        streaming=True,
+    )
+    _assert_same_outputs("tests/output/d4k_ils_streaming/", d4k_ils_expected)
+
+
+def test_d4k_ils_deflate(d4k_ils_expected):
+    imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        "tests/output/d4k_ils_deflate/",
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+        compression="deflate",
+    )
+    _assert_same_outputs("tests/output/d4k_ils_deflate/", d4k_ils_expected)
+    # float32 output is only predicted if imagecodecs is installed
+    predictor = (
+        tifffile.PREDICTOR.FLOATINGPOINT
+        if io._imagecodecs_installed()
+        else tifffile.PREDICTOR.NONE
+    )
+    for path in glob.glob("tests/output/d4k_ils_deflate/**/*.tif", recursive=True):
+        with tifffile.TiffFile(path) as tif:
+            assert tif.pages[0].compression == tifffile.COMPRESSION.ADOBE_DEFLATE
+            assert tif.pages[0].predictor == predictor
+
+
+def test_compression_without_imagecodecs(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_imagecodecs_installed", lambda: False)
+    write_options = io.tiff_write_options("deflate", 6)
+    assert "predictor" not in write_options
+    image_arr = np.linspace(0, 1, 64 * 64, dtype=np.float32).reshape(64, 64)
+    tifffile.imwrite(tmp_path / "image.tif", image_arr, **write_options)
+    np.testing.assert_array_equal(tifffile.imread(tmp_path / "image.tif"), image_arr)
+    for compression in ("zstd", "lzw"):
+        with pytest.raises(ImportError, match="imagecodecs"):
+            io.tiff_write_options(compression)
+
+
+def test_d4k_ils_tiled_overviews(d4k_ils_expected):
+    output_path = "tests/output/d4k_ils_tiled_overviews/"
+    imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        output_path,
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+        tile_size=256,
+        overviews=3,
+    )
+    _assert_same_outputs(output_path, d4k_ils_expected)
+    for path in glob.glob(output_path + "**/*.tif", recursive=True):
+        with tifffile.TiffFile(path) as tif:
+            image, *overviews = tif.pages
+            assert (image.tilelength, image.tilewidth) == (256, 256)
+            assert len(overviews) == 3
+            for level, overview in enumerate(overviews, 1):
+                assert overview.subfiletype == tifffile.FILETYPE.REDUCEDIMAGE
+                assert overview.shape == tuple(
+                    -(-side // 2**level) for side in image.shape
+                )
+                assert (overview.tilelength, overview.tilewidth) == (256, 256)
+
+
+def _xmp_camera_tags(packet):
+    """Return the values of the Camera XMP tags of an XMP packet, keyed by tag name."""
+    camera = "{http://pix4d.com/camera/1.0/}"
+    rdf = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+    tags = {}
+    for description in ElementTree.fromstring(packet).iter(f"{rdf}Description"):
+        for name, value in description.attrib.items():
+            if name.startswith(camera):
+                tags[name[len(camera) :]] = [value]
+        for element in description:
+            if element.tag.startswith(camera):
+                values = [item.text for item in element.iter(f"{rdf}li")]
+                tags[element.tag[len(camera) :]] = values or [element.text]
+    return tags
+
+
+def _metadata(path):
+    """Return the camera, EXIF, GPS and Camera XMP tags of an output image."""
+    with tifffile.TiffFile(path) as tif:
+        tags = tif.pages[0].tags
+        values = {
+            name: tags[name].value
+            for name in ("Make", "Model", "ExifTag", "GPSTag")
+            if name in tags
+        }
+        if "XMP" in tags:
+            values["XMP"] = _xmp_camera_tags(tags["XMP"].value)
+    return values
+
+
+def test_d4k_ils_native_metadata(d4k_ils_expected):
+    output_path = "tests/output/d4k_ils_native_metadata/"
+    imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        output_path,
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+        native_metadata=True,
+    )
+    _assert_same_outputs(output_path, d4k_ils_expected)
+    # the metadata of the expected outputs was copied by exiftool
+    for path in glob.glob(output_path + "**/*.tif", recursive=True):
+        expected = os.path.join(d4k_ils_expected, os.path.relpath(path, output_path))
+        with tifffile.TiffFile(path) as native, tifffile.TiffFile(expected) as copied:
+            native_tags, copied_tags = native.pages[0].tags, copied.pages[0].tags
+            assert "ExifTag" in native_tags and "XMP" in native_tags
+            for name in ("ExifTag", "GPSTag"):
+                assert (name in native_tags) == (name in copied_tags)
+                if name in native_tags:
+                    native_ifd = native_tags[name].value
+                    copied_ifd = copied_tags[name].value
+                    assert {
+                        key: copied_ifd.get(key) for key in native_ifd
+                    } == native_ifd
+            assert _xmp_camera_tags(native_tags["XMP"].value) == _xmp_camera_tags(
+                copied_tags["XMP"].value
+            )
+
+
+def test_d4k_ils_exif_workers(d4k_ils_expected):
+    output_path = "tests/output/d4k_ils_exif_workers/"
+    imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        output_path,
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+        exif_workers=4,
+    )
+    _assert_same_outputs(output_path, d4k_ils_expected)
+    for path in glob.glob(output_path + "**/*.tif", recursive=True):
+        expected = os.path.join(d4k_ils_expected, os.path.relpath(path, output_path))
+        assert _metadata(path) == _metadata(expected)
+    # the band information read for the run is not kept for the next one
+    assert not metadata._band_info
+
+
+FAKE_EXIFTOOL = """#!{python}
+import os, sys, time
+
+log = open({log!r}, "a", buffering=1)
+log.write(f"start {{os.getpid()}}\\n")
+command = []
+for line in sys.stdin:
+    line = line.rstrip("\\n")
+    if line.startswith("-execute"):
+        key = command[command.index("-key") + 1]
+        try:
+            # the first command of the batch hangs
+            os.close(os.open({hang!r}, os.O_CREAT | os.O_EXCL))
+            log.write(f"hang {{key}}\\n")
+            time.sleep(60)
+        except FileExistsError:
+            time.sleep(0.3)
+        log.write(f"{{os.getpid()}} {{key}}\\n")
+        marker = command[command.index("-echo4") + 1]
+        print(marker, flush=True)
+        print(marker, file=sys.stderr, flush=True)
+        command = []
+    elif command[-1:] == ["-stay_open"] and line == "False":
+        break
+    else:
+        command.append(line)
+"""
+
+
+def test_exiftool_timeout_restarts_only_its_session(tmp_path):
+    log = tmp_path / "exiftool.log"
+    exiftool_path = tmp_path / "exiftool"
+    exiftool_path.write_text(
+        FAKE_EXIFTOOL.format(
+            python=sys.executable, log=str(log), hang=str(tmp_path / "hang")
+        )
+    )
+    exiftool_path.chmod(0o755)
+    keys = [f"IMG_{i}" for i in range(10)]
+
+    failed = metadata.run_exiftool_concurrent(
+        [(key, ["-key", key]) for key in keys], str(exiftool_path), workers=2, timeout=1
+    )
+    lines = [line.split() for line in log.read_text().splitlines()]
+    hung = [key for first, key in lines if first == "hang"]
+    starts = [pid for first, pid in lines if first == "start"]
+    ran = {key: pid for pid, key in lines if pid not in ("start", "hang")}
+    # the timed out command fails alone, and the other commands all run
+    assert failed == hung and len(hung) == 1
+    assert sorted(ran) == sorted(set(keys) - set(hung))
+    # only the session of the timed out command is restarted
+    assert len(starts) == 3
+    assert starts[2] in ran.values() and len(set(ran.values()) & set(starts[:2])) == 1
+
+
+def test_d4k_ils_plan_file(tmp_path):
+    output_path = "tests/output/d4k_ils_plan_file/"
+    plan_file = str(tmp_path / "plan.json.gz")
+    image_df, _, _ = corrections.get_corrections(
+        "tests/d4k_images/", "CAL", output_path, False, True
+    )
+    plan.write_plan(
+        plan_file,
+        image_df,
+        "tests/d4k_images/",
+        output_path,
+        corrections.plan_options("CAL", False, True),
+    )
+    image_df, _, _ = imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        output_path,
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+        plan_file=plan_file,
+    )
+    _assert_compacted(image_df)
+
+
+def _assert_compacted(image_df):
+    """Assert that the repeated strings of an image dataframe are still categoricals, and its XMP index downcast."""
+    for column in io.CATEGORICAL_COLUMNS:
+        if column in image_df:
+            assert isinstance(image_df[column].dtype, pd.CategoricalDtype), column
+    assert image_df.XMP_index.dtype == np.int8
+
+
+@pytest.fixture
+def d4k_panel(monkeypatch):
+    """Detect a registered calibration panel in the first capture of the D4K test images, which have none."""
+    monkeypatch.setattr(
+        detect_panel,
+        "get_reflectance",
+        lambda row: (200.0, 23)
+        if "IMG_00006" in row["image_path"]
+        else (np.nan, np.nan),
+    )
+
+
+def test_d4k_reflectance_plan_file(tmp_path, monkeypatch, d4k_panel):
+    expected_path = os.path.join(str(tmp_path / "expected"), "")
+    image_df, _, _ = imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        expected_path,
+        False,
+        False,
+        False,
+        "exiftool",
+        False,
+    )
+    _assert_compacted(image_df)
+
+    output_path = os.path.join(str(tmp_path / "output"), "")
+    plan_file = str(tmp_path / "plan.json.gz")
+    os.makedirs(output_path)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "get_corrections.py",
+            "tests/d4k_images/",
+            "-o",
+            output_path,
+            "--plan_file",
+            plan_file,
+        ],
+    )
+    runpy.run_path("scripts/get_corrections.py", run_name="__main__")
+    image_df, _, _ = imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        output_path,
+        False,
+        False,
+        False,
+        "exiftool",
+        False,
+        plan_file=plan_file,
+    )
+    _assert_compacted(image_df)
+    _assert_same_outputs(output_path, expected_path)
+
+
+def test_d4k_ils_shards(tmp_path, d4k_ils_expected):
+    output_path = "tests/output/d4k_ils_shards/"
+    plan_file = str(tmp_path / "plan.json")
+    image_df, _, _ = corrections.get_corrections(
+        "tests/d4k_images/", "CAL", output_path, False, True
+    )
+    image_df["corrected_max_val"] = corrections.compute_max_values(image_df)
+    plan.write_plan(
+        plan_file,
+        image_df,
+        "tests/d4k_images/",
+        output_path,
+        corrections.plan_options("CAL", False, True),
+    )
+    for shard in ("1/2", "2/2"):
+        image_df, _, _ = imgcorrect.correct_images(
+            "tests/d4k_images/",
+            "CAL",
+            output_path,
+            False,
+            True,
+            False,
+            "exiftool",
+            False,
+            plan_file=plan_file,
+            shard=shard,
+        )
+        _assert_compacted(image_df)
+    _assert_same_outputs(output_path, d4k_ils_expected)
+
+
+def test_d4k_ils_queue(tmp_path, d4k_ils_expected):
+    output_path = "tests/output/d4k_ils_queue/"
+    plan_file = str(tmp_path / "plan.json")
+    image_df, _, _ = corrections.get_corrections(
+        "tests/d4k_images/", "CAL", output_path, False, True
+    )
+    image_df["corrected_max_val"] = corrections.compute_max_values(image_df)
+    plan.write_plan(
+        plan_file,
+        image_df,
+        "tests/d4k_images/",
+        output_path,
+        corrections.plan_options("CAL", False, True),
+    )
+    image_df, _, _ = imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        output_path,
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+        plan_file=plan_file,
+        queue=str(tmp_path / "queue.db"),
+    )
+    _assert_compacted(image_df)
+    _assert_same_outputs(output_path, d4k_ils_expected)
+
+    # a run writing elsewhere doesn't skip the tasks the first run did
+    other_path = os.path.join(str(tmp_path / "other"), "")
+    imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        other_path,
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+        plan_file=plan_file,
+        queue=str(tmp_path / "queue.db"),
+    )
+    _assert_same_outputs(other_path, d4k_ils_expected)
+
+
+def test_submodules_are_imported_lazily():
+    code = (
+        "import sys, imgcorrect; "
+        "assert 'imgcorrect.io' not in sys.modules; "
+        "assert imgcorrect.io.create_image_df is imgcorrect.create_image_df; "
+        "assert imgcorrect.corrections.correct_images is imgcorrect.correct_images; "
+        "assert imgcorrect.metadata.copy_exif is imgcorrect.copy_exif; "
+        "assert imgcorrect.detect_panel.__name__ == 'imgcorrect.detect_panel'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_queue_renews_leases_while_processing(tmp_path):
+    queue = str(tmp_path / "queue.db")
+    broker = work_queue.open_broker(queue, "flight")
+    broker.enqueue(["capture:1"])
+    assert broker.claim("worker1", lease=0.5) == ["capture:1"]
+    with work_queue.renewing_leases(
+        queue, "flight", "worker1", ["capture:1"], lease=0.5
+    ):
+        time.sleep(1)
+        assert broker.claim("worker2", lease=0.5) == []
+    assert broker.renew("worker2", ["capture:1"]) == []
+    broker.ack("worker1", ["capture:1"])
+    assert broker.counts()[work_queue.DONE] == 1
+    broker.close()
+
+
+def test_d4k_ils_resume(d4k_ils_expected):
+    for resume in (False, True):
+        imgcorrect.correct_images(
+            "tests/d4k_images/",
+            "CAL",
+            "tests/output/d4k_ils_resume/",
+            False,
+            True,
+            False,
+            "exiftool",
+            False,
+            resume=resume,
+        )
+    _assert_same_outputs("tests/output/d4k_ils_resume/", d4k_ils_expected)
+
+
+@pytest.mark.parametrize("failing", ["scaled", "moved"])
+def test_d4k_ils_resume_interrupted(tmp_path, monkeypatch, failing, d4k_ils_expected):
+    def correct(output_path, resume=False):
+        imgcorrect.correct_images(
+            "tests/d4k_images/",
+            "CAL",
+            os.path.join(output_path, ""),
+            False,
+            True,
+            False,
+            "exiftool",
+            False,
+            resume=resume,
+        )
+
+    # crash right after the second replacement of a staged image by its scaled copy, or of an output by its
+    # staged image
+    replace, calls = os.replace, []
+
+    def failing_replace(src, dst):
+        replace(src, dst)
+        staged = io.STAGING_SUFFIX in os.path.basename(src)
+        if staged and (src.endswith(io.SCALED_SUFFIX) == (failing == "scaled")):
+            calls.append(src)
+            if len(calls) == 2:
+                raise OSError("Input/output error")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        correct(tmp_path / "resumed")
+    monkeypatch.setattr(os, "replace", replace)
+    correct(tmp_path / "resumed", resume=True)
+    _assert_same_outputs(tmp_path / "resumed", d4k_ils_expected)
+
+
+def test_d4k_reflectance_resume_interrupted(tmp_path, monkeypatch, d4k_panel):
+    def correct(output_path, resume=False):
+        imgcorrect.correct_images(
+            "tests/d4k_images/",
+            "CAL",
+            output_path,
+            False,
+            False,
+            False,
+            "exiftool",
+            False,
+            resume=resume,
+        )
+
+    expected_path = os.path.join(str(tmp_path / "expected"), "")
+    output_path = os.path.join(str(tmp_path / "resumed"), "")
+    correct(expected_path)
+
+    # crash right after the second output is moved into place
+    replace, calls = os.replace, []
+
+    def failing_replace(src, dst):
+        replace(src, dst)
+        if io.STAGING_SUFFIX in os.path.basename(src) and not src.endswith(
+            io.SCALED_SUFFIX
+        ):
+            calls.append(src)
+            if len(calls) == 2:
+                raise OSError("Input/output error")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        correct(output_path)
+    monkeypatch.setattr(os, "replace", replace)
+    assert os.path.exists(journal.plan_path(output_path))
+    correct(output_path, resume=True)
+    _assert_same_outputs(output_path, expected_path)
+
+
+def test_d4k_ils_resume_cli_run(tmp_path, monkeypatch):
+    output_path = os.path.join(str(tmp_path), "")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "correct_images.py",
+            "tests/d4k_images/",
+            "-o",
+            output_path,
+            "-r",
+            "-e",
+            "exiftool",
+        ],
+    )
+    runpy.run_path("scripts/correct_images.py", run_name="__main__")
+    # the API run has the same settings as the command line run, so it can resume it
+    imgcorrect.correct_images(
+        "tests/d4k_images/",
+        "CAL",
+        output_path,
+        False,
+        True,
+        False,
+        "exiftool",
+        False,
+        resume=True,
+    )
+
+
+def test_d4k_ils_incremental(d4k_ils_expected):
+    for _ in range(2):
+        image_df, _, _ = imgcorrect.correct_images(
+            "tests/d4k_images/",
+            "CAL",
+            "tests/output/d4k_ils_incremental/",
+            False,
+            True,
+            False,
+            "exiftool",
+            False,
+            incremental_run=True,
+        )
+        _assert_compacted(image_df)
+    _assert_same_outputs("tests/output/d4k_ils_incremental/", d4k_ils_expected)
+
+
+def test_d4k_incremental_reuses_panels_and_fingerprints(
+    tmp_path, monkeypatch, d4k_panel
+):
+    input_path = shutil.copytree("tests/d4k_images", str(tmp_path / "input"))
+    output_path = os.path.join(str(tmp_path / "output"), "")
+    detected, fingerprinted = [], []
+    get_reflectance, fingerprint = detect_panel.get_reflectance, incremental.fingerprint
+    monkeypatch.setattr(
+        detect_panel,
+        "get_reflectance",
+        lambda row: detected.append(row["image_path"]) or get_reflectance(row),
+    )
+    monkeypatch.setattr(
+        incremental,
+        "fingerprint",
+        lambda path: fingerprinted.append(path) or fingerprint(path),
+    )
+
+    def correct():
+        detected.clear()
+        fingerprinted.clear()
+        imgcorrect.correct_images(
+            input_path,
+            "CAL",
+            output_path,
+            False,
+            False,
+            False,
+            "exiftool",
+            False,
+            incremental_run=True,
+        )
+
+    correct()
+    assert detected and fingerprinted
+    expected_path = shutil.copytree(output_path, str(tmp_path / "expected"))
+    # outputs that are missing are written again, from the panels and fingerprints recorded by the first run
+    for path in glob.glob(output_path + "**/*.tif", recursive=True):
+        os.remove(path)
+    correct()
+    assert not detected and not fingerprinted
+    _assert_same_outputs(output_path, expected_path)
+    # a modified image is read again
+    os.utime(os.path.join(input_path, "NDRE", "IMG_00006.jpg"))
+    correct()
+    assert len(set(fingerprinted)) == 1 and len(set(detected)) == 1
+
+
+def test_d4k_ils_watch(d4k_ils_expected):
+    watch.watch_images(
+        "tests/d4k_images/",
+        "tests/output/d4k_ils_watch/",
+        poll_seconds=0.1,
+        settle_seconds=0,
+        idle_timeout=1,
+        calibration_id="CAL",
+        no_ils_correct=False,
+        no_reflectance_correct=True,
+        delete_original=False,
+        exiftool_path="exiftool",
+        uint16_output=False,
+    )
+    _assert_same_outputs("tests/output/d4k_ils_watch/", d4k_ils_expected)
+
+
+def test_d4k_ils_watch_cli():
+    subprocess.run(
+        [
+            sys.executable,
+            "scripts/correct_images.py",
+            "tests/d4k_images/",
+            "-o",
+            "tests/output/d4k_ils_watch_cli/",
+            "-r",
+            "-e",
+            "exiftool",
+            "--incremental",
+            "--watch",
+            "--watch_settle",
+            "0",
+            "--watch_idle",
+            "0",
+        ],
+        check=True,
+    )
+
+
+def test_d4k_ils_rescale(tmp_path, d4k_ils_expected):
+    input_path = str(tmp_path / "input")
+    output_path = os.path.join(str(tmp_path / "output"), "")
+    images = sorted(glob.glob("tests/d4k_images/*/*.jpg"))
+
+    def arrive(arrived):
+        for path in arrived:
+            band = os.path.basename(os.path.dirname(path))
+            os.makedirs(os.path.join(input_path, band), exist_ok=True)
+            shutil.copy2(path, os.path.join(input_path, band))
+
+    def correct(provisional):
+        imgcorrect.correct_images(
+            input_path,
+            "CAL",
+            output_path,
+            False,
+            True,
+            False,
+            "exiftool",
+            False,
+            incremental_run=True,
+            provisional=provisional,
+            rescale=True,
+        )
+
+    arrive([path for path in images if not path.endswith(("9.jpg", "10.jpg"))])
+    correct(True)
+    written = {
+        os.path.relpath(path, output_path): tifffile.imread(path)
+        for path in glob.glob(output_path + "**/*.tif", recursive=True)
+    }
+    # the images that arrive later change the ILS normalization and output scale of the first ones
+    arrive([path for path in images if path.endswith(("9.jpg", "10.jpg"))])
+    correct(True)
+    correct(False)
+
+    scales = {}
+    for path in glob.glob(output_path + "**/*.tif", recursive=True):
+        name = os.path.relpath(path, output_path)
+        with tifffile.TiffFile(path) as tif:
+            stored = tif.asarray()
+            tag = tif.pages[0].tags.get(io.GDAL_METADATA_TAG)
+            scales[name] = (
+                1.0 if tag is None else float(ElementTree.fromstring(tag.value)[0].text)
+            )
+        np.testing.assert_allclose(
+            stored * scales[name],
+            tifffile.imread(os.path.join(d4k_ils_expected, name)),
+            rtol=1e-5,
+        )
+        if name in written:
+            # rescaled in place, without rewriting the stored values
+            np.testing.assert_array_equal(stored, written[name])
+    assert sorted(scales) == sorted(
+        os.path.relpath(path, d4k_ils_expected)
+        for path in glob.glob(d4k_ils_expected + "**/*.tif", recursive=True)
+    )
+    assert any(scales[name] != 1 for name in written)
+
+
+def test_watch_reports_errors_other_than_missing_calibration(tmp_path, monkeypatch):
+    def correct_images(*args, **kwargs):
+        if kwargs.get("provisional"):
+            raise corrections.CalibrationNotFoundError("no panel yet")
+        raise FileNotFoundError("exiftool")
+
+    monkeypatch.setattr(corrections, "correct_images", correct_images)
+    (tmp_path / "input").mkdir()
+    (tmp_path / "input" / "IMG_1.tif").write_bytes(b"")
+    with pytest.raises(FileNotFoundError, match="exiftool"):
+        watch.watch_images(
+            str(tmp_path / "input"),
+            str(tmp_path / "output"),
+            poll_seconds=0,
+            settle_seconds=0,
+            idle_timeout=0.1,
+        )
+
+
+@pytest.mark.parametrize("no_ils_correct", [False, True])
+def test_get_corrections_matches_row_wise(no_ils_correct):
+    image_df, _, _ = corrections.get_corrections(
+        "tests/d4k_images/", "CAL", "tests/output/", no_ils_correct, True
+    )
+    assert not image_df.empty
+    # the values of each row, read as before get_corrections was vectorized
+    for row in image_df.itertuples():
+        sensitivity = imgparse.get_xmp_data(row.image_path)["Camera:BandSensitivity"]
+        slope_coefficient = 1 / float(
+            imgparse.util.parse_seq(sensitivity)[int(row.XMP_index)]
+        )
+        autoexposure = imgparse.get_autoexposure(row.image_path, row.EXIF)
+        assert row.timestamp == datetime.strptime(
+            row.EXIF["EXIF DateTimeOriginal"].values, "%Y:%m:%d %H:%M:%S"
+        )
+        assert row.autoexposure == autoexposure / 100
+        assert row.ILS == imgparse.get_ils(row.image_path)[0]
+        assert row.slope_coefficient == slope_coefficient
+        assert row.correction_coefficient == pytest.approx(
+            slope_coefficient / (row.autoexposure * row.ILS_ratio)
+        )
+    assert image_df.timestamp.is_monotonic_increasing
+
+
+def test_reflectance_correction_matches_row_wise(d4k_panel):
+    image_df, calibration_sets, selected_group_id = corrections.get_corrections(
+        "tests/d4k_images/", "CAL", "tests/output/", False, False
+    )
+    band_df = (
+        calibration_sets.get_group(selected_group_id)
+        .groupby("band")[
+            ["image_path", "mean_reflectance", "aruco_id", "autoexposure", "XMP_index"]
+        ]
+        .apply(corrections.take_closest_image)
+        .reset_index()
+    )
+    assert not band_df.empty
+    for row in band_df.itertuples():
+        cent, fwhm = (
+            int(values[int(row.XMP_index)])
+            for values in imgparse.get_wavelength_data(row.image_path)
+        )
+        band = image_df.band == row.band
+        ils_scaling_factor = (
+            image_df.ILS[band].mean() / imgparse.get_ils(row.image_path)[0]
+        )
+        slope_coefficient = (
+            panels.get_panel(row.aruco_id).reflectance(cent - fwhm, cent + fwhm + 1)
+            / (row.mean_reflectance / row.autoexposure)
+            * ils_scaling_factor
+        )
+        np.testing.assert_allclose(image_df.slope_coefficient[band], slope_coefficient)
+
+
+def test_global_max_val_ignores_sensor_range():
+    # 6x sensor settings put their raw value range in max_val, which is not a corrected maximum
+    image_df = pd.DataFrame({"max_val": [4096, 4096]})
+    with pytest.raises(ValueError, match="--plan_max_val"):
+        corrections._global_max_val(image_df)
+    image_df["corrected_max_val"] = [7999.5, 8000.25]
+    assert corrections._global_max_val(image_df) == np.float32(8000.25)
+
+
+@pytest.mark.parametrize("rescale", [False, True])
+def test_select_changed_without_images(tmp_path, rescale):
+    image_df, _, _ = corrections.get_corrections(
+        "tests/d4k_images/", "CAL", str(tmp_path), False, True
+    )
+    settings = corrections._OutputSettings(
+        True, False, False, None, None, None, 0, False, False, "exiftool", False, 1, 1
+    )
+    manifest = incremental.Manifest(incremental.manifest_path(str(tmp_path)))
+    changed, max_val = corrections._select_changed(
+        image_df.iloc[:0], manifest, settings, None, False, rescale
+    )
+    assert changed.empty and max_val is None
+
+
+def test_lwir_error_is_raised_after_multispectral_correction(
+    tmp_path, monkeypatch, d4k_ils_expected
+):
+    input_path = str(tmp_path / "input")
+    shutil.copytree("tests/d4k_images", input_path)
+    os.mkdir(os.path.join(input_path, "LWIR"))
+    output_path = os.path.join(str(tmp_path / "output"), "")
+    lwir_failed = threading.Event()
+
+    def convert_thermal(*args, **kwargs):
+        lwir_failed.set()
+        raise ValueError("LWIR conversion failed")
+
+    correct_batch = corrections._correct_batch
+
+    def correct_multispectral(*args, **kwargs):
+        # the multispectral correction continues after the LWIR conversion failed
+        assert lwir_failed.wait(10)
+        return correct_batch(*args, **kwargs)
+
+    monkeypatch.setattr(thermal_convert, "convert_thermal", convert_thermal)
+    monkeypatch.setattr(corrections, "_correct_batch", correct_multispectral)
+    with pytest.raises(ValueError, match="LWIR conversion failed"):
+        imgcorrect.correct_images(
+            input_path, "CAL", output_path, False, True, False, "exiftool", False
+        )
+    _assert_same_outputs(output_path, d4k_ils_expected)
+
+
+def test_thermal_metadata_failure_is_raised(tmp_path, monkeypatch):
+    (tmp_path / "LWIR").mkdir()
+    tifffile.imwrite(
+        tmp_path / "LWIR" / "IMG_00001.tif", np.full((8, 8), 29315, np.uint16)
+    )
+    monkeypatch.setattr(
+        metadata,
+        "run_exiftool_concurrent",
+        lambda commands, *args: [key for key, _ in commands],
+    )
+    with pytest.raises(ValueError, match="IMG_00001.tif"):
+        thermal_convert.convert_thermal(
+            str(tmp_path / "LWIR"), str(tmp_path / "output"), "exiftool"
+        )
+    assert not (tmp_path / "output" / "IMG_00001.tif").exists()
+
+
+def test_thermal_incremental(tmp_path, monkeypatch):
+    (tmp_path / "LWIR").mkdir()
+    for i in range(2):
+        tifffile.imwrite(
+            tmp_path / "LWIR" / f"IMG_0000{i}.tif", np.full((8, 8), 29315, np.uint16)
+        )
+    converted = []
+    monkeypatch.setattr(
+        metadata,
+        "run_exiftool_concurrent",
+        lambda commands, *args: converted.extend(key for key, _ in commands) or [],
+    )
+
+    def convert(thermal_format="float32"):
+        converted.clear()
+        thermal_convert.convert_thermal(
+            str(tmp_path / "LWIR"),
+            str(tmp_path / "output"),
+            "exiftool",
+            thermal_format=thermal_format,
+            incremental_run=True,
+        )
+        return sorted(converted)
+
+    assert convert() == ["IMG_00000.tif", "IMG_00001.tif"]
+    assert convert() == []
+    tifffile.imwrite(
+        tmp_path / "LWIR" / "IMG_00001.tif", np.full((8, 8), 30315, np.uint16)
+    )
+    assert convert() == ["IMG_00001.tif"]
+    assert convert("int16") == ["IMG_00000.tif", "IMG_00001.tif"]
+    np.testing.assert_array_equal(
+        tifffile.imread(tmp_path / "output" / "IMG_00001.tif"), 3000
+    )
+
+
+@pytest.mark.parametrize("thermal_format", ["uint16", "int16"])
+def test_thermal_integer_formats_scale_to_celsius(
+    tmp_path, monkeypatch, thermal_format
+):
+    (tmp_path / "LWIR").mkdir()
+    raw = np.random.default_rng(0).integers(25000, 33000, (32, 48), dtype=np.uint16)
+    tifffile.imwrite(tmp_path / "LWIR" / "IMG_00001.tif", raw)
+    monkeypatch.setattr(metadata, "run_exiftool_concurrent", lambda *args: [])
+    for output_format in ("float32", thermal_format):
+        thermal_convert.convert_thermal(
+            str(tmp_path / "LWIR"),
+            str(tmp_path / output_format),
+            "exiftool",
+            thermal_format=output_format,
+        )
+
+    with tifffile.TiffFile(tmp_path / thermal_format / "IMG_00001.tif") as tif:
+        stored = tif.asarray()
+        items = ElementTree.fromstring(tif.pages[0].tags[io.GDAL_METADATA_TAG].value)
+    roles = {item.get("role"): float(item.text) for item in items}
+    assert stored.dtype == np.dtype(thermal_format)
+    np.testing.assert_allclose(
+        stored * roles["scale"] + roles["offset"],
+        tifffile.imread(tmp_path / "float32" / "IMG_00001.tif"),
+        atol=1e-4,
+    )
+
+
+@pytest.mark.parametrize("thermal_format", ["float32", "int16"])
+def test_thermal_parallel_matches_serial(tmp_path, monkeypatch, thermal_format):
+    (tmp_path / "LWIR").mkdir()
+    rng = np.random.default_rng(0)
+    for i in range(12):
+        tifffile.imwrite(
+            tmp_path / "LWIR" / f"IMG_{i:05d}.tif",
+            rng.integers(25000, 33000, (32, 48), dtype=np.uint16),
+        )
+    commands = {}
+
+    def run_exiftool_concurrent(run_commands, exiftool_path, workers, timeout):
+        output_path = str(tmp_path / f"output_{workers}")
+        commands[workers] = sorted(
+            (key, [arg.replace(output_path, "output") for arg in args])
+            for key, args in run_commands
+        )
+        return []
+
+    monkeypatch.setattr(metadata, "run_exiftool_concurrent", run_exiftool_concurrent)
+    for workers in (1, 4):
+        thermal_convert.convert_thermal(
+            str(tmp_path / "LWIR"),
+            str(tmp_path / f"output_{workers}"),
+            "exiftool",
+            exif_workers=workers,
+            workers=workers,
+            thermal_format=thermal_format,
+        )
+    assert commands[1] == commands[4] and len(commands[1]) == 12
+    _assert_same_outputs(str(tmp_path / "output_4"), str(tmp_path / "output_1"))
+
+
+def test_edit_xmp_packet():
+    packet = (
+        '<x:xmpmeta xmlns:x="adobe:ns:meta/">'
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">'
+        '<rdf:Description xmlns:Camera="http://pix4d.com/camera/1.0/" '
+        'Camera:IsNormalized="0" Camera:SunSensor="1 2 3">'
+        "<Camera:BandName><rdf:Seq><rdf:li>Red</rdf:li><rdf:li>NIR</rdf:li></rdf:Seq></Camera:BandName>"
+        "<Camera:BlackCurrent><rdf:Seq><rdf:li>64</rdf:li></rdf:Seq></Camera:BlackCurrent>"
+        "<Camera:ColorTransform>1 0 0 1</Camera:ColorTransform>"
+        "</rdf:Description></rdf:RDF></x:xmpmeta>"
+    ).encode("utf-8")
+    edited = metadata.edit_xmp_packet(packet, band=("NIR", 842, 57)).decode("utf-8")
+    assert edited.startswith("<?xpacket begin=") and edited.endswith(
+        '<?xpacket end="w"?>'
+    )
+    assert 'Camera:IsNormalized="1"' in edited
+    assert "SunSensor" not in edited and "ColorTransform" not in edited
+    assert "<rdf:li>Red</rdf:li>" not in edited
+    for tag, value in [
+        ("BandName", "NIR"),
+        ("CentralWavelength", "842"),
+        ("WavelengthFWHM", "57"),
+        ("BlackCurrent", "0"),
+    ]:
+        assert (
+            f"<Camera:{tag}><rdf:Seq><rdf:li>{value}</rdf:li></rdf:Seq></Camera:{tag}>"
+            in edited
+        )
+    with pytest.raises(ValueError, match="rdf:Description"):
+        metadata.edit_xmp_packet(b'<x:xmpmeta xmlns:x="adobe:ns:meta/"/>')
+
+
+def test_band_info_is_read_once_per_run(monkeypatch):
+    wavelengths = {"a.jpg": ([650, 850], [20, 40]), "b.jpg": ([660, 840], [10, 30])}
+    calls = []
+
+    def get_wavelength_data(path):
+        calls.append(path)
+        return wavelengths[path]
+
+    monkeypatch.setattr(metadata.imgparse, "get_wavelength_data", get_wavelength_data)
+    monkeypatch.setattr(metadata.imgparse, "get_bandnames", lambda path: ["red", "nir"])
+    rows = [
+        pd.Series({"sensor": "sensor", "XMP_index": index, "image_path": path})
+        for path in ("a.jpg", "b.jpg")
+        for index in (0, 1)
+    ]
+    metadata.clear_band_info()
+    assert [metadata.get_band_info(row) for row in rows] == [
+        ("red", 650, 20),
+        ("nir", 850, 40),
+    ] * 2
+    assert calls == ["a.jpg"]
+    # a later run with the same sensor reads the band information of its own images
+    metadata.clear_band_info()
+    assert metadata.get_band_info(rows[3]) == ("nir", 840, 30)
+    metadata.clear_band_info()
+
+
+def test_window_average():
+    coefficients = zenith_co.get_coefficients("sg3144_batch1")
+    assert zenith_co.window_average("sg3144_batch1", 640, 680) == pytest.approx(
+        np.average(coefficients[640:680])
+    )
+    # clipped to the spectrum like a slice
+    assert zenith_co.window_average(
+        "sg3144_batch1", len(coefficients) - 10, len(coefficients) + 10
+    ) == pytest.approx(np.average(coefficients[-10:]))
+    assert np.isnan(zenith_co.window_average("sg3144_batch1", 680, 640))
+
+
+def test_load_panels_user_file(tmp_path):
+    np.save(tmp_path / "spectrum.npy", np.full(1000, 0.5))
+    (tmp_path / "panels.json").write_text(
+        """[
+            {
+                "aruco_id": 23,
+                "name": "Replacement",
+                "spectrum": "spectrum.npy",
+                "panel_edge": [0, 1],
+                "marker_side_length_m": 0.1,
+                "marker_to_panel_center_m": 0.08,
+                "sample_width_m": 0.05,
+                "sample_height_m": 0.05
+            }
+        ]"""
+    )
+    try:
+        registry = panels.load_panels(str(tmp_path / "panels.json"))
+        assert panels.get_panel(23).name == "Replacement"
+        assert panels.get_panel(23).spectrum == str(tmp_path / "spectrum.npy")
+        assert panels.get_panel(23).reflectance(600, 700) == pytest.approx(0.5)
+        assert registry[63].spectrum == "sg3144_batch2"
+    finally:
+        panels.load_panels()
+    assert panels.get_panel(23).spectrum == "sg3144_batch1"
+
+
+def test_parse_shard():
+    assert io.parse_shard("2/3") == (2, 3)
+    for shard in ("0/3", "4/3", "2", "a/b"):
+        with pytest.raises(ValueError):
+            io.parse_shard(shard)
+
+
+def test_shard_of():
+    shards = [io.shard_of(f"IMG_{i:05d}", 4) for i in range(200)]
+    assert set(shards) == {1, 2, 3, 4}
+    assert shards == [io.shard_of(f"IMG_{i:05d}", 4) for i in range(200)]
+    assert io.shard_of("IMG_00001", 1) == 1
+
+
+def test_queue_lease_expiry(tmp_path):
+    broker = work_queue.open_broker(str(tmp_path / "queue.db"), "flight")
+    broker.enqueue(["capture:1", "capture:2"])
+    broker.enqueue(["capture:1"])
+    assert broker.claim("worker1", count=2, lease=-1) == ["capture:1", "capture:2"]
+    # the expired leases are given to the next worker, and the first can no longer acknowledge them
+    assert sorted(broker.claim("worker2", count=2)) == ["capture:1", "capture:2"]
+    broker.ack("worker1", ["capture:1", "capture:2"])
+    assert broker.counts()[work_queue.CLAIMED] == 2
+    broker.ack("worker2", ["capture:1"])
+    broker.release("worker2", ["capture:2"])
+    assert broker.counts()[work_queue.PENDING] == 1
+    # a task whose lease expires on its last attempt fails
+    assert broker.claim("worker3", lease=-1) == ["capture:2"]
+    assert broker.claim("worker4") == []
+    assert broker.counts() == {
+        work_queue.PENDING: 0,
+        work_queue.CLAIMED: 0,
+        work_queue.DONE: 1,
+        work_queue.FAILED: 1,
+    }
+    broker.close()
+
+
+def test_queue_names_keep_runs_apart(tmp_path):
+    first = work_queue.open_broker(str(tmp_path / "queue.db"), "flight1")
+    second = work_queue.open_broker(str(tmp_path / "queue.db"), "flight2")
+    first.enqueue(["capture:1"])
+    assert first.claim("worker1") == ["capture:1"]
+    first.ack("worker1", ["capture:1"])
+    # the same task of another run is not skipped as done
+    second.enqueue(["capture:1", "capture:2"])
+    assert second.counts()[work_queue.PENDING] == 2
+    assert sorted(second.claim("worker2", count=2)) == ["capture:1", "capture:2"]
+    assert first.counts() == {
+        work_queue.PENDING: 0,
+        work_queue.CLAIMED: 0,
+        work_queue.DONE: 1,
+        work_queue.FAILED: 0,
+    }
+    first.close()
+    second.close()
+
+
+def test_queue_name(tmp_path):
+    image_df, _, _ = corrections.get_corrections(
+        "tests/d4k_images/", "CAL", str(tmp_path), False, True
+    )
+    settings = corrections._OutputSettings(
+        True, False, False, None, None, None, 0, False, False, "exiftool", False, 1, 1
+    )
+    name = corrections._queue_name(image_df, str(tmp_path), settings)
+    assert corrections._queue_name(image_df, str(tmp_path), settings) == name
+    assert (
+        corrections._queue_name(
+            image_df.assign(correction_coefficient=image_df.correction_coefficient * 2),
+            str(tmp_path),
+            settings,
+        )
+        != name
+    )
+    assert (
+        corrections._queue_name(
+            image_df, str(tmp_path), settings._replace(compression="deflate")
+        )
+        != name
+    )
+    other_path = str(tmp_path / "other")
+    other_df, _, _ = corrections.get_corrections(
+        "tests/d4k_images/", "CAL", other_path, False, True
+    )
+    assert corrections._queue_name(other_df, other_path, settings) != name
+
+
+def test_journal_resume(tmp_path):
+    path = journal.journal_path(str(tmp_path))
+    header = {"settings": {"uint16_output": False}}
+    outputs = [str(tmp_path / "NIR" / f"IMG_{i}.tif") for i in range(3)]
+    run = journal.Journal.create(path, header)
+    run.record(outputs, journal.WRITTEN, scale=[1.0, 2.0, 3.0])
+    run.record(outputs[:1], journal.MOVED)
+    run.close()
+    # a crash while writing the last line leaves it incomplete
+    with open(path, "a") as f:
+        f.write('{"output": "NIR/IMG_2.tif", "sta')
+
+    resumed = journal.Journal.resume(path, header["settings"])
+    assert resumed.progress(outputs + [str(tmp_path / "IMG_3.tif")]) == [3, 1, 1, -1]
+    assert resumed.values(outputs, "scale") == [1.0, 2.0, 3.0]
+    resumed.close()
+    with pytest.raises(ValueError, match="settings"):
+        journal.Journal.resume(path, {"uint16_output": True})
+    with pytest.raises(ValueError, match="no journal"):
+        journal.Journal.resume(str(tmp_path / "missing.jsonl"), header["settings"])
+
+
+@pytest.mark.parametrize("bigtiff", [False, True])
+@pytest.mark.parametrize("byteorder", ["<", ">"])
+def test_write_gdal_scale(tmp_path, bigtiff, byteorder):
+    path = tmp_path / "image.tif"
+    data = np.arange(64, dtype=np.uint16).reshape(8, 8)
+    tifffile.imwrite(path, data, bigtiff=bigtiff, byteorder=byteorder)
+    for scale in (0.5, 0.25):
+        io.write_gdal_scale(str(path), scale)
+    with tifffile.TiffFile(path) as tif:
+        assert tif.is_bigtiff == bigtiff
+        assert tif.pages[0].tags[io.GDAL_METADATA_TAG].value == (
+            '<GDALMetadata><Item name="SCALE" sample="0" role="scale">0.25</Item>'
+            "</GDALMetadata>"
+        )
+        np.testing.assert_array_equal(tif.asarray(), data)